@@ -0,0 +1,260 @@
+"""
+Headless benchmark of the dashboard's analysis and chart-building functions.
+
+Every function runs against a fixture session read from the columnar store
+(see ``ingest.py``) or generated by ``synthetic.py``, without Streamlit
+rendering or network access. Wall time and peak memory are reported per
+function and can be saved as a baseline that later runs are compared against.
+
+Usage:
+    python benchmark.py 2024 "Bahrain Grand Prix" --save-baseline baseline.json
+    python benchmark.py 2024 "Bahrain Grand Prix" --baseline baseline.json
+    python benchmark.py --synthetic --drivers 20 40 --laps 57 120 --hz 4
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+from itertools import product
+
+import store
+from synthetic import generate_session
+
+
+def load_dashboard():
+    """Import the dashboard without running it; Streamlit calls become no-ops."""
+    import f1_dashboard
+
+    # FastF1 deprecation warnings would be repeated for every run
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    # Bare-mode Streamlit warns about the missing script context on every call
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    return f1_dashboard
+
+
+def reset_caches(dashboard):
+    for get_cache in (
+        dashboard.get_session_cache,
+        dashboard.get_telemetry_cache,
+        dashboard.get_figure_cache,
+    ):
+        get_cache().clear()
+
+
+def benchmark_cases(dashboard, session):
+    """Name -> zero-argument callable for every benchmarked function."""
+    drivers = dashboard.get_driver_names_with_numbers(session)
+    driver, compared = drivers[0], drivers[:3]
+    d = dashboard
+    return {
+        "get_driver_names_with_numbers": lambda: d.get_driver_names_with_numbers(session),
+        "fetch_race_results": lambda: d.fetch_race_results(session),
+        "build_pit_stop_table": lambda: d.build_pit_stop_table(session),
+        "create_lap_time_scatterplot": lambda: d.create_lap_time_scatterplot(session),
+        "create_lap_time_analysis": lambda: d.create_lap_time_analysis(session),
+        "create_tire_usage_analysis": lambda: d.create_tire_usage_analysis(session),
+        "create_sector_time_analysis": lambda: d.create_sector_time_analysis(session, driver),
+        "create_pit_stop_analysis": lambda: d.create_pit_stop_analysis(session),
+        "create_position_change_analysis": lambda: d.create_position_change_analysis(session),
+        "create_weather_analysis": lambda: d.create_weather_analysis(session),
+        "create_telemetry_plots": lambda: d.create_telemetry_plots(session, driver),
+        "create_enhanced_telemetry_plots": lambda: d.create_enhanced_telemetry_plots(session, driver),
+        "create_lap_time_comparison": lambda: d.create_lap_time_comparison(session, compared),
+        "create_sector_time_comparison": lambda: d.create_sector_time_comparison(session, compared),
+        "create_pit_stop_comparison": lambda: d.create_pit_stop_comparison(session, compared),
+        "create_telemetry_comparison": lambda: d.create_telemetry_comparison(session, compared),
+        "create_delta_time_analysis": lambda: d.create_delta_time_analysis(session, compared),
+        "create_ai_analysis_data": lambda: d.create_ai_analysis_data(
+            session,
+            driver,
+            ["Fastest Lap Time", "Top Speed", "Throttle Analysis",
+             "Sector Times", "Pit Stop Analysis", "Telemetry Summary"],
+        ),
+    }
+
+
+def measure(fn, repeat=5, reset=None):
+    """
+    Time ``repeat`` calls of ``fn`` and one more call under tracemalloc.
+
+    ``reset`` runs before every call so each one starts from cold caches.
+
+    Returns:
+        dict: min_s, median_s and peak_mb.
+    """
+    times = []
+    for _ in range(repeat):
+        if reset:
+            reset()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    # Memory is traced separately, tracing slows every allocation down
+    if reset:
+        reset()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_mb": peak / 1024 ** 2,
+    }
+
+
+def run_benchmarks(dashboard, session, repeat=5, warm=False, only=None, label=None):
+    """
+    Measure every case, recording failures instead of stopping at them.
+
+    With a ``label`` (e.g. the size of a synthetic session) results are
+    stored as "<function> [<label>]" so several fixtures share one baseline.
+    """
+    results = {}
+    reset = None if warm else (lambda: reset_caches(dashboard))
+    for name, fn in benchmark_cases(dashboard, session).items():
+        if only and name not in only:
+            continue
+        if label:
+            name = f"{name} [{label}]"
+        try:
+            results[name] = measure(fn, repeat=repeat, reset=reset)
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+    return results
+
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """
+    Compare results with a baseline.
+
+    A function regresses when its median time or peak memory exceeds the
+    baseline by more than ``tolerance`` (a fraction), or when it now fails.
+
+    Returns:
+        list: One message per regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None or "error" in before:
+            continue
+        if "error" in result:
+            regressions.append(f"{name}: now fails ({result['error']})")
+            continue
+        for metric in ("median_s", "peak_mb"):
+            if result[metric] > before[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} {before[metric]:.4f} -> {result[metric]:.4f} "
+                    f"(+{result[metric] / before[metric] - 1:.0%})"
+                )
+    return regressions
+
+
+def print_results(results, baseline=None):
+    width = max([34, *(len(name) for name in results)])
+    print(f"{'function':<{width}} {'min ms':>9} {'median ms':>10} {'peak MB':>9} {'vs base':>8}")
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<{width}} ERROR {result['error']}")
+            continue
+        change = ""
+        before = (baseline or {}).get(name)
+        if before and "median_s" in before:
+            change = f"{result['median_s'] / before['median_s'] - 1:+.0%}"
+        print(
+            f"{name:<{width}} {result['min_s'] * 1000:>9.1f} {result['median_s'] * 1000:>10.1f} "
+            f"{result['peak_mb']:>9.2f} {change:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("year", type=int, nargs="?", help="Year of the fixture session")
+    parser.add_argument("event", nargs="?", help="Event name of the fixture session")
+    parser.add_argument("--session", default="R", help="Stored session code (default: R)")
+    parser.add_argument("--store", default=store.STORE_DIR, help="Store root directory")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="Use generated sessions instead of the store")
+    parser.add_argument("--drivers", type=int, nargs="+", default=[20],
+                        help="Synthetic cars; every combination of sizes is run")
+    parser.add_argument("--laps", type=int, nargs="+", default=[57], help="Synthetic laps")
+    parser.add_argument("--hz", type=float, nargs="+", default=[4.0],
+                        help="Synthetic telemetry sample rates")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per function")
+    parser.add_argument("--warm", action="store_true", help="Keep caches between runs")
+    parser.add_argument("--only", nargs="+", help="Benchmark only these functions")
+    parser.add_argument("--baseline", help="Compare with this baseline JSON file")
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown or memory growth as a fraction (default: 0.2)")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        fixtures = [
+            (f"{drivers}x{laps}@{hz:g}Hz",
+             lambda d=drivers, l=laps, h=hz: generate_session(n_drivers=d, n_laps=l, hz=h))
+            for drivers, laps, hz in product(args.drivers, args.laps, args.hz)
+        ]
+        fixture = {"synthetic": [label for label, _ in fixtures]}
+    else:
+        if args.year is None or args.event is None:
+            parser.error("give the year and event of a stored session, or --synthetic")
+        if not store.has_session(args.year, args.event, args.session, root=args.store):
+            parser.error(
+                f"{args.year} {args.event} {args.session} is not in the store at "
+                f"{args.store}, run ingest.py first"
+            )
+        fixtures = [
+            (None, lambda: store.open_session(args.year, args.event, args.session, root=args.store))
+        ]
+        fixture = {"year": args.year, "event": args.event, "session": args.session}
+
+    dashboard = load_dashboard()
+    results = {}
+    for label, open_fixture in fixtures:
+        results.update(
+            run_benchmarks(dashboard, open_fixture(), args.repeat, args.warm, args.only, label)
+        )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(
+                {
+                    "fixture": fixture,
+                    "repeat": args.repeat,
+                    "warm": args.warm,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
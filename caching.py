@@ -0,0 +1,169 @@
+"""Memory-bounded LRU caches shared across Streamlit reruns and users."""
+
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def estimate_nbytes(obj, _seen=None):
+    """
+    Roughly estimate how much memory an object keeps alive.
+
+    DataFrames, Series and NumPy arrays report their buffer sizes; containers
+    and plain objects (such as a FastF1 ``Session``) are walked recursively.
+    Shared objects are only counted once.
+
+    Args:
+        obj: Any Python object.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=False).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=False))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, (bytes, bytearray, str)):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_nbytes(k, _seen) + estimate_nbytes(v, _seen)
+            for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(v, _seen) for v in obj)
+    if hasattr(obj, "__dict__") and not isinstance(obj, type):
+        return sys.getsizeof(obj) + estimate_nbytes(vars(obj), _seen)
+    return sys.getsizeof(obj)
+
+
+class MemoryLRUCache:
+    """
+    Thread-safe LRU cache that evicts entries once a memory budget is exceeded.
+
+    The most recently used entry is never evicted, so a single value larger
+    than the budget is still served until something else replaces it.
+
+    Args:
+        max_bytes (int): Memory budget for all cached values.
+        name (str): Label used when reporting statistics.
+        sizeof (callable): Function returning the size of a value in bytes.
+    """
+
+    def __init__(self, max_bytes, name="cache", sizeof=estimate_nbytes):
+        self.max_bytes = max_bytes
+        self.name = name
+        self._sizeof = sizeof
+        self._entries = OrderedDict()  # key -> [value, nbytes]
+        self._lock = threading.RLock()
+        self._loading = {}  # key -> lock held while the value is being loaded
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._thread = threading.local()  # hits made by the current thread
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def nbytes(self):
+        with self._lock:
+            return sum(nbytes for _, nbytes in self._entries.values())
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                return self._hit(key)
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        nbytes = self._sizeof(value)
+        with self._lock:
+            self._entries[key] = [value, nbytes]
+            self._entries.move_to_end(key)
+            self._evict()
+        return value
+
+    def get_or_load(self, key, loader):
+        """
+        Return the cached value for ``key``, calling ``loader()`` on a miss.
+
+        Concurrent callers asking for the same missing key wait for a single
+        load instead of each running ``loader`` themselves. ``None`` results
+        are returned but not cached.
+        """
+        with self._lock:
+            if key in self._entries:
+                return self._hit(key)
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    return self._hit(key)
+                self.misses += 1
+            try:
+                value = loader()
+                if value is not None:
+                    self.put(key, value)
+                return value
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+
+    def thread_hits(self):
+        """Number of hits made by the calling thread since it first used the cache."""
+        return getattr(self._thread, "hits", 0)
+
+    def _hit(self, key):
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self._thread.hits = self.thread_hits() + 1
+        return self._entries[key][0]
+
+    def refresh(self):
+        """Re-measure every entry (e.g. after a cached object grew) and evict."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry[1] = self._sizeof(entry[0])
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _evict(self):
+        total = sum(nbytes for _, nbytes in self._entries.values())
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            total -= nbytes
+            self.evictions += 1
@@ -0,0 +1,79 @@
+"""Season event schedules cached with a TTL and indexed for constant-time lookups."""
+
+import threading
+import time
+
+import fastf1 as ff1
+
+# Event formats that include a sprint race
+SPRINT_FORMATS = ("sprint", "sprint_shootout", "sprint_qualifying")
+
+
+class ScheduleService:
+    """
+    Loads each season's event schedule at most once per ``ttl`` seconds.
+
+    Besides the schedule itself, every loaded season keeps dictionaries from
+    event name to round number and event format, and from round number to
+    event, so lookups do not scan the schedule.
+
+    Args:
+        ttl (float): Seconds before a season's schedule is fetched again.
+        loader (callable): Returns the schedule DataFrame of a year.
+    """
+
+    def __init__(self, ttl=3600, loader=ff1.get_event_schedule):
+        self.ttl = ttl
+        self._loader = loader
+        self._seasons = {}  # year -> (loaded_at, schedule, index)
+        self._lock = threading.Lock()
+
+    def _season(self, year):
+        with self._lock:
+            season = self._seasons.get(year)
+            if season is None or time.monotonic() - season[0] > self.ttl:
+                schedule = self._loader(year).sort_values("RoundNumber", kind="stable")
+                season = (time.monotonic(), schedule, self._build_index(schedule))
+                self._seasons[year] = season
+            return season
+
+    @staticmethod
+    def _build_index(schedule):
+        rounds = schedule["RoundNumber"].astype(int).tolist()
+        names = schedule["EventName"].tolist()
+        formats = schedule["EventFormat"].tolist()
+        index = {
+            "round_by_name": dict(zip(names, rounds)),
+            "format_by_name": dict(zip(names, formats)),
+            "event_by_round": {},
+        }
+        for i, round_number in enumerate(rounds):
+            # Testing events share round 0, keep the first of them
+            index["event_by_round"].setdefault(round_number, schedule.iloc[i])
+        return index
+
+    def schedule(self, year):
+        """The full event schedule of ``year`` (shared, do not modify)."""
+        return self._season(year)[1]
+
+    def round_number(self, year, event_name):
+        """Round number of an event, or None if it is not in the schedule."""
+        return self._season(year)[2]["round_by_name"].get(event_name)
+
+    def event(self, year, round_number):
+        """Schedule row of the event held in ``round_number``, or None."""
+        return self._season(year)[2]["event_by_round"].get(round_number)
+
+    def event_format(self, year, event_name):
+        """Event format of an event, e.g. "conventional" or "sprint_qualifying"."""
+        return self._season(year)[2]["format_by_name"].get(event_name)
+
+    def remaining_events(self, year, after_round):
+        """Events held after ``after_round``, in round order."""
+        schedule = self.schedule(year)
+        start = schedule["RoundNumber"].searchsorted(after_round, side="right")
+        return schedule.iloc[start:]
+
+    def clear(self):
+        with self._lock:
+            self._seasons.clear()
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import fastf1 as ff1
 from fastf1 import plotting
 import matplotlib.pyplot as plt
@@ -10,16 +11,97 @@ from fastf1.ergast import Ergast
 import requests
 import json
 import logging
+import io
+import collections
+import threading
+import time
 from urllib.request import urlopen
 import plotly.express as px
 import requests
 import json
+import perf
+from caching import MemoryLRUCache
+from event_schedule import SPRINT_FORMATS, ScheduleService
+from live import LiveConsumer
+from prefetch import PrefetchWorker, ingest_missing
+from store import (
+    StoreSession,
+    has_session,
+    open_session,
+    read_lap_telemetry,
+    read_session_table,
+)
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from task_loader import TaskLoader
+from telemetry import (
+    STEP_CHANNELS,
+    delta_time,
+    downsample_indices,
+    resample_laps,
+    track_map_geometry,
+)
 
 # Enable FastF1 caching
 if not os.path.exists("cache"):
     os.mkdir("cache")
 ff1.Cache.enable_cache("cache")
 
+# Memory budget for loaded FastF1 sessions kept in the process-wide cache
+SESSION_CACHE_MAX_MB = int(os.environ.get("F1_SESSION_CACHE_MB", "2048"))
+
+# Memory budget for per-lap telemetry computed with Lap.get_telemetry()
+TELEMETRY_CACHE_MAX_MB = int(os.environ.get("F1_TELEMETRY_CACHE_MB", "512"))
+
+# Memory budget for rendered matplotlib figures, and their image format ("png" or "svg")
+FIGURE_CACHE_MAX_MB = int(os.environ.get("F1_FIGURE_CACHE_MB", "64"))
+FIGURE_FORMAT = os.environ.get("F1_FIGURE_FORMAT", "png")
+
+# Seconds before a season's event schedule is fetched again
+SCHEDULE_TTL_S = float(os.environ.get("F1_SCHEDULE_TTL", "3600"))
+
+# Seconds before the driver standings of a round are fetched again
+STANDINGS_TTL_S = float(os.environ.get("F1_STANDINGS_TTL", "3600"))
+
+# Most recent season offered in the year selector (selected by default)
+LATEST_SEASON = 2025
+
+# Seconds between background warm-ups of the latest race weekend, 0 disables them
+PREFETCH_INTERVAL_S = float(os.environ.get("F1_PREFETCH_INTERVAL", "1800"))
+PREFETCH_WORKERS = int(os.environ.get("F1_PREFETCH_WORKERS", "2"))
+# Also ingest the prefetched sessions into the columnar store
+PREFETCH_INGEST = os.environ.get("F1_PREFETCH_INGEST", "0") == "1"
+
+# Load only laps and results up front; telemetry, position and weather data are
+# loaded when a section that needs them is opened. Set to "0" to load everything.
+LAZY_SESSION_LOADING = os.environ.get("F1_LAZY_LOADING", "1") != "0"
+
+# Threads loading the race session, qualifying results and standings
+# concurrently; 0 or 1 loads them one after another
+LOADER_WORKERS = int(os.environ.get("F1_LOADER_WORKERS", "4"))
+
+# Default number of points drawn per telemetry trace (adjustable in the sidebar)
+TELEMETRY_POINT_BUDGET = int(os.environ.get("F1_TELEMETRY_POINTS", "500"))
+
+# Whole-field lap charts with more points than this are drawn with WebGL
+WEBGL_POINT_THRESHOLD = int(os.environ.get("F1_WEBGL_THRESHOLD", "1000"))
+
+# Spacing in meters of the common distance grid used to compare laps
+RESAMPLE_STEP_M = float(os.environ.get("F1_RESAMPLE_STEP_M", "5"))
+
+# Append the timing records of every rerun to this JSON lines file (off when empty)
+PERF_LOG_PATH = os.environ.get("F1_PERF_LOG", "")
+
+# Seconds between two updates of the live page
+LIVE_REFRESH_S = float(os.environ.get("F1_LIVE_REFRESH", "1"))
+
+# Car data samples kept per driver in the live ring buffers (two hours at
+# about 4 Hz), and samples per driver the live charts start from
+LIVE_POINTS = int(os.environ.get("F1_LIVE_POINTS", "30000"))
+LIVE_CHART_POINTS = int(os.environ.get("F1_LIVE_CHART_POINTS", "2000"))
+
+# Directory the live ring buffers are snapshotted to
+LIVE_SNAPSHOT_DIR = os.environ.get("F1_LIVE_SNAPSHOT_DIR", "live_snapshots")
+
 # Set page title and layout
 st.set_page_config(page_title="Formula One Dashboard", page_icon="🏎️", layout="wide")
 
@@ -29,10 +111,34 @@ if "sections" not in st.session_state:
         "Telemetry": False,
         "Lap & Tire Analysis": False,
         "Pit Stops & Weather": False,
+        "Enhanced Telemetry": False,
         "Driver Comparison": False,
+        "Track Map": False,
     }
 
 
+# Fresh timing records for every rerun
+st.session_state["perf_recorder"] = perf.PerfRecorder()
+
+
+def current_perf_recorder():
+    """Timing records of the running rerun; None on threads outside a script run."""
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    return st.session_state.get("perf_recorder")
+
+
+def cache_hits_on_thread():
+    return sum(
+        cache.thread_hits()
+        for cache in (get_session_cache(), get_telemetry_cache(), get_figure_cache())
+    )
+
+
+# Records wall time, rows and cache hits of the decorated function per call
+timed = perf.timed(current_perf_recorder, cache_hits_on_thread)
+
+
 # Function to toggle sections
 def toggle_section(section):
     st.session_state["sections"][section] = not st.session_state["sections"][section]
@@ -384,10 +490,16 @@ def inject_custom_css():
     )
 
 
+@st.cache_resource
+def get_schedule_service():
+    """Season schedules shared by every user, refreshed after SCHEDULE_TTL_S."""
+    return ScheduleService(ttl=SCHEDULE_TTL_S)
+
+
 # Function to fetch all races for a given year
+@timed
 def fetch_races(year):
-    schedule = ff1.get_event_schedule(year)
-    return schedule
+    return get_schedule_service().schedule(year)
 
 
 def add_footer():
@@ -417,30 +529,445 @@ def add_footer():
 
 
 
-# Function to fetch session data for a specific race
-def fetch_session_data(year, race_name):
-    try:
-        # st.write(f"Fetching session data for {year} for the race {race_name} ...")
-        # Check if it's the 2025 season pretesting
-        if year == 2025 and race_name.lower() == "pre-season testing":
-            # st.write("Fetching pre-season testing session data ...")
-            session = ff1.get_testing_session(2025, 1, 1)  # Fetch pretesting session
-        else:
-            session = ff1.get_session(year, race_name, "R")  # Regular race session
+@st.cache_resource
+def get_session_cache():
+    """Loaded FastF1 sessions, shared by every user of this server process."""
+    return MemoryLRUCache(SESSION_CACHE_MAX_MB * 1024 * 1024, name="sessions")
+
+
+@st.cache_resource
+def get_telemetry_cache():
+    """Per-lap telemetry shared by every chart, keyed by (session, driver, lap)."""
+    return MemoryLRUCache(TELEMETRY_CACHE_MAX_MB * 1024 * 1024, name="telemetry")
 
+
+@st.cache_resource
+def get_figure_cache():
+    """Rendered figures as image bytes, keyed by (session, chart, inputs, format), up to F1_FIGURE_CACHE_MB."""
+    return MemoryLRUCache(FIGURE_CACHE_MAX_MB * 1024 * 1024, name="figures")
+
+
+def session_key(session):
+    """Identifies a loaded session across reruns, e.g. (2024, "Bahrain Grand Prix", "Race")."""
+    return (session.event.year, session.event["EventName"], session.name)
+
+
+def load_race_session(year, race_name):
+    # Check if it's the 2025 season pretesting
+    if year == 2025 and race_name.lower() == "pre-season testing":
+        session = ff1.get_testing_session(2025, 1, 1)  # Fetch pretesting session
+    elif has_session(year, race_name, "R"):
+        return open_session(year, race_name, "R")  # Ingested into the columnar store
+    else:
+        session = ff1.get_session(year, race_name, "R")  # Regular race session
+
+    if LAZY_SESSION_LOADING:
+        session.load(laps=True, telemetry=False, weather=False, messages=False)
+    else:
         session.load()
-        # has_data = not session.laps.empty  # Check if session has lap data
-        # st.write("Session data fetched successfully.")
+    return session
+
+
+def load_qualifying_session(year, race_name):
+    if has_session(year, race_name, "Q"):
+        return open_session(year, race_name, "Q")  # Ingested into the columnar store
+
+    session = ff1.get_session(year, race_name, "Q")
+    # Results only; laps and telemetry are loaded by ensure_session_data when
+    # a view needs them
+    session.load(laps=False, telemetry=False, weather=False, messages=False)
+    return session
 
+
+@timed
+def fetch_qualifying_session(year, race_name):
+    """Qualifying session with its results loaded, shared through the session cache."""
+    return get_session_cache().get_or_load(
+        (year, race_name, "Q"), lambda: load_qualifying_session(year, race_name)
+    )
+
+
+# Session attribute filled by each lazily loaded data section
+SESSION_SECTIONS = {
+    "laps": "_laps",
+    "telemetry": "_car_data",
+    "weather": "_weather_data",
+    "messages": "_race_control_messages",
+}
+
+# Private FastF1 3.5 methods loading just one section, and the Session.load()
+# arguments loading it through the public API instead. "quali_results" derives
+# qualifying results from lap times; Session.load() does that itself.
+SECTION_LOADERS = {
+    "laps": (
+        (
+            "_load_session_status_data",
+            "_load_total_lap_count",
+            "_load_track_status_data",
+            "_load_laps_data",
+            "_add_first_lap_time_from_ergast",
+            "_fix_missing_laps_retired_on_track",
+        ),
+        {"laps": True},
+    ),
+    "telemetry": (("_load_telemetry",), {"laps": True, "telemetry": True}),
+    "weather": (("_load_weather_data",), {"weather": True}),
+    "messages": (
+        ("_load_race_control_messages", "_set_laps_deleted_from_rcm"),
+        {"messages": True},
+    ),
+    "quali_results": (("_calculate_quali_like_session_results",), {"laps": True}),
+}
+
+
+def load_session_section(session, section):
+    """
+    Load one data section of a FastF1 session, the only place private
+    FastF1 methods are called.
+
+    The private per-section loaders exist in the FastF1 release pinned in
+    requirements.txt. When they are missing, the section is loaded with
+    ``session.load()`` instead, which is slower but public.
+
+    Args:
+        session: FastF1 session object.
+        section (str): Key of ``SECTION_LOADERS``, e.g. "telemetry".
+    """
+    methods, load_kwargs = SECTION_LOADERS[section]
+    if all(hasattr(session, method) for method in methods):
+        for method in methods:
+            getattr(session, method)()
+        return
+
+    logging.warning(
+        f"FastF1 {ff1.__version__} lacks the private loaders of the {section} "
+        "section, loading it with Session.load()"
+    )
+    session.load(
+        **{"laps": False, "telemetry": False, "weather": False, "messages": False, **load_kwargs}
+    )
+
+
+@st.cache_resource
+def get_section_load_lock():
+    """Serializes lazy section loads so two users never load the same data twice."""
+    return threading.Lock()
+
+
+@timed
+def ensure_session_data(session, *sections):
+    """
+    Load the given data sections of a session if they are not loaded yet.
+
+    Args:
+        session: FastF1 session object, possibly loaded with results or laps only.
+        *sections (str): Keys of ``SESSION_SECTIONS``, e.g. "telemetry".
+
+    Returns:
+        The same session object, with the requested sections loaded.
+    """
+    if isinstance(session, StoreSession):
+        return session  # Everything is read from the columnar store
+
+    missing = [
+        section for section in sections
+        if not hasattr(session, SESSION_SECTIONS[section])
+    ]
+    if not missing or not session.f1_api_support:
         return session
-    except Exception as e:
-        st.warning(f"Error fetching session data: {e}")
-        return None, False
 
+    with get_section_load_lock():
+        for section in missing:
+            if not hasattr(session, SESSION_SECTIONS[section]):
+                load_session_section(session, section)
+
+    # The cached session just grew, re-measure it against the memory budget
+    get_session_cache().refresh()
+    return session
+
+
+@timed
+def fetch_lap_telemetry(session, lap, columns=None):
+    """
+    Telemetry of a single lap.
+
+    Sessions opened from the columnar store only read the requested columns of
+    that lap from disk. Other sessions compute it with ``lap.get_telemetry()``
+    once and share the result through the telemetry cache as a plain
+    DataFrame, so the cache does not keep the whole session alive through
+    the Telemetry's ``session`` reference; the returned frame must not be
+    modified in place.
+    """
+    if isinstance(session, StoreSession):
+        return read_lap_telemetry(
+            session, lap["DriverNumber"], lap["LapNumber"], columns=columns
+        )
+
+    computed = []
+
+    def compute():
+        computed.append(True)
+        return pd.DataFrame(lap.get_telemetry())
+
+    key = (session_key(session), str(lap["DriverNumber"]), int(lap["LapNumber"]))
+    tel = get_telemetry_cache().get_or_load(key, compute)
+    if not computed:
+        st.session_state["telemetry_calls_saved"] = (
+            st.session_state.get("telemetry_calls_saved", 0) + 1
+        )
+
+    if columns is not None:
+        tel = tel[[column for column in columns if column in tel.columns]]
+    return tel
+
+
+# Channels recorded in car data; laps resampled on these alone skip the
+# position merge and driver-ahead search of Lap.get_telemetry()
+CAR_DATA_CHANNELS = {"Time", "SessionTime", "Speed", "RPM", "nGear", "Throttle", "Brake", "DRS"}
+
+
+@timed
+def fetch_resampled_laps(session, laps, channels, step=RESAMPLE_STEP_M):
+    """
+    Telemetry of several laps resampled onto one common distance grid.
+
+    Results are kept in the telemetry cache per (session, lap set, channels,
+    grid spacing), so comparison and delta charts share them across reruns.
+    Car data channels of a FastF1 session are read from ``lap.get_car_data()``
+    with the distance added, which is much cheaper than the merged telemetry.
+
+    Args:
+        session: FastF1 session.
+        laps (list): Laps (rows of ``session.laps``) to resample.
+        channels (list): Telemetry channels to resample.
+        step (float): Grid spacing in meters.
+
+    Returns:
+        tuple: ``(grid, arrays)`` as returned by ``telemetry.resample_laps``,
+        one row per lap in the order given.
+    """
+    lap_set = tuple((lap["DriverNumber"], int(lap["LapNumber"])) for lap in laps)
+    key = (*session_key(session), "resampled", lap_set, tuple(channels), step)
+
+    def compute():
+        if isinstance(session, StoreSession) or not set(channels) <= CAR_DATA_CHANNELS:
+            frames = [
+                fetch_lap_telemetry(session, lap, columns=["Distance", *channels])
+                for lap in laps
+            ]
+        else:
+            frames = [pd.DataFrame(lap.get_car_data().add_distance()) for lap in laps]
+        return resample_laps(frames, channels, step)
+
+    return get_telemetry_cache().get_or_load(key, compute)
+
+
+def thin_telemetry(tel, channel, x="Distance"):
+    """
+    Rows of ``tel`` worth drawing for one channel.
+
+    Keeps at most the sidebar's point budget using LTTB, or the per-bucket
+    minimum and maximum for step channels such as gear and DRS. Returns
+    ``tel`` unchanged in full-resolution mode.
+
+    Args:
+        tel (pandas.DataFrame): Lap telemetry.
+        channel (str): Column plotted on the y axis.
+        x (str): Column plotted on the x axis.
+
+    Returns:
+        pandas.DataFrame: The selected rows of ``tel``.
+    """
+    budget = st.session_state.get("telemetry_point_budget", TELEMETRY_POINT_BUDGET)
+    if st.session_state.get("telemetry_full_resolution") or len(tel) <= budget:
+        return tel
+
+    indices = downsample_indices(
+        tel[x].to_numpy(dtype=float),
+        tel[channel].to_numpy(dtype=float),
+        budget,
+        step=channel in STEP_CHANNELS,
+    )
+    return tel.iloc[indices]
+
+
+def figure_to_image(fig, image_format=FIGURE_FORMAT):
+    """Render a matplotlib figure to PNG bytes or an SVG string and close it."""
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=image_format, bbox_inches="tight")
+    finally:
+        # Figures left open stay registered with pyplot for the process lifetime
+        plt.close(fig)
+    if image_format == "svg":
+        return buffer.getvalue().decode()
+    return buffer.getvalue()
+
+
+def display_figure(key, build):
+    """
+    Show a matplotlib figure from the figure cache, building it on a miss.
+
+    Args:
+        key (tuple): Identifies the figure by everything it is drawn from.
+        build (callable): Returns a new matplotlib figure; only called on a miss.
+    """
+    image = get_figure_cache().get_or_load(
+        (*key, FIGURE_FORMAT), lambda: figure_to_image(build())
+    )
+    st.image(image, use_container_width=True)
+
+
+def section_enabled(section, label):
+    """
+    Checkbox that opts in to loading the heavy data behind a section.
+
+    Always enabled when lazy loading is turned off.
+    """
+    if not LAZY_SESSION_LOADING:
+        return True
+
+    st.checkbox(
+        label,
+        value=st.session_state["sections"][section],
+        key=f"load_section_{section}",
+        on_change=toggle_section,
+        args=(section,),
+    )
+    return st.session_state["sections"][section]
+
+
+# Function to fetch session data for a specific race
+@timed
+def fetch_session_data(year, race_name):
+    """Race session from the session cache; raises if it cannot be loaded."""
+    # Loaded sessions are reused across reruns and users instead of
+    # parsing the FastF1 disk cache again on every interaction
+    return get_session_cache().get_or_load(
+        (year, race_name, "R"), lambda: load_race_session(year, race_name)
+    )
+
+
+@st.cache_resource
+def start_prefetch_worker():
+    """
+    Start the background worker that keeps the latest race weekend warm.
+
+    Cached as a resource so only one worker runs per server process. It loads
+    the race and qualifying of the latest completed event and of the season's
+    first race weekend into the shared session cache before the first user
+    asks for them. Tasks run without a Streamlit context, so they must not call
+    ``st.*``; the worker logs their failures.
+    """
+
+    def load_race(year, race_name):
+        get_session_cache().get_or_load(
+            (year, race_name, "R"), lambda: load_race_session(year, race_name)
+        )
+
+    def load_qualifying(year, race_name):
+        get_session_cache().get_or_load(
+            (year, race_name, "Q"), lambda: load_qualifying_session(year, race_name)
+        )
+
+    tasks = [load_race, load_qualifying]
+    if PREFETCH_INGEST:
+        tasks.append(ingest_missing)
+
+    worker = PrefetchWorker(
+        LATEST_SEASON,
+        fetch_races,
+        tasks,
+        interval=PREFETCH_INTERVAL_S,
+        max_workers=PREFETCH_WORKERS,
+    )
+    worker.start()
+    return worker
+
+
+def display_cache_stats():
+    """Show hit/miss/eviction counters of the shared caches in the sidebar."""
+    with st.sidebar.expander("⚙️ Cache Statistics", expanded=False):
+        st.write(
+            "get_telemetry() calls saved this rerun: "
+            f"{st.session_state.get('telemetry_calls_saved', 0)}"
+        )
+        st.write(f"Open matplotlib figures: {len(plt.get_fignums())}")
+        for cache in (get_session_cache(), get_telemetry_cache(), get_figure_cache()):
+            stats = cache.stats()
+            st.markdown(f"**{stats['name'].title()}**")
+            st.write(
+                f"Entries: {stats['entries']} | "
+                f"Memory: {stats['bytes'] / 1024 ** 2:.1f} / "
+                f"{stats['max_bytes'] / 1024 ** 2:.0f} MB"
+            )
+            st.write(
+                f"Hits: {stats['hits']} | Misses: {stats['misses']} | "
+                f"Evictions: {stats['evictions']}"
+            )
+
+
+
+def display_perf_panel(year, race_name):
+    """
+    Sidebar breakdown of where this rerun spent its time.
+
+    The records can be downloaded as JSON lines and, with ``F1_PERF_LOG``
+    set, are appended to that file on every rerun.
+    """
+    recorder = st.session_state["perf_recorder"]
+    if PERF_LOG_PATH:
+        with open(PERF_LOG_PATH, "a") as f:
+            f.write(recorder.to_json_lines(year=year, race=race_name))
+
+    if not st.sidebar.checkbox("⏱️ Show performance panel", key="show_perf_panel"):
+        return
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        summary = recorder.summary()
+        if summary.empty:
+            st.write("Nothing recorded in this rerun.")
+            return
+        st.dataframe(summary.round(3), hide_index=True)
+        st.download_button(
+            "Download JSON lines",
+            recorder.to_json_lines(year=year, race=race_name),
+            file_name="f1_dashboard_perf.jsonl",
+            mime="application/json",
+        )
+
+
+def with_script_run_ctx(fn):
+    """
+    Attach the current script run context to the thread that runs ``fn``.
+
+    Streamlit caches used from a loader thread then behave as they would on
+    the script thread. Tasks must still not render anything: they raise, and
+    the script thread shows the error.
+    """
+    ctx = get_script_run_ctx()
+
+    def run(*args, **kwargs):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+
+    return run
+
+
+def display_load_timings(timings, wall_time):
+    """Show how long each concurrently loaded task took in the sidebar."""
+    with st.sidebar.expander("⏱️ Load Timings", expanded=False):
+        for name, seconds in timings.items():
+            st.write(f"{name}: {seconds * 1000:.0f} ms")
+        st.write(
+            f"Total: {wall_time * 1000:.0f} ms wall time "
+            f"({sum(timings.values()) * 1000:.0f} ms of work, "
+            f"{'serial' if LOADER_WORKERS <= 1 else f'{LOADER_WORKERS} workers'})"
+        )
 
 OLLAMA_API_URL = "http://localhost:11434/"  # Update if your Ollama instance runs on a different port
 
 # Function to check if Ollama API is accessible
+@timed
 def is_ollama_api_available():
     try:
         response = requests.get(OLLAMA_API_URL, timeout=3)  # Quick health check
@@ -453,6 +980,7 @@ if "ollama_available" not in st.session_state:
     st.session_state["ollama_available"] = is_ollama_api_available()
 
 
+@timed
 def interpret_data_with_ollama(data):
     """
     Sends telemetry data to Ollama API for AI-based interpretation.
@@ -508,6 +1036,7 @@ def get_driver_names_with_numbers(session):
 
 
 # Function to create telemetry plots
+@timed
 def create_telemetry_plots(session, selected_driver_info):
     st.subheader("Telemetry Analysis")
 
@@ -516,17 +1045,20 @@ def create_telemetry_plots(session, selected_driver_info):
         "It helps analyze how a driver manages speed, braking zones, and acceleration."
     )
     selected_driver = selected_driver_info.split("(")[-1].strip(")")
+    ensure_session_data(session, "telemetry")
 
     laps = session.laps.pick_driver(selected_driver)
     selected_lap = st.slider("Select Lap", min_value=int(laps["LapNumber"].min()), max_value=int(laps["LapNumber"].max()), value=int(laps["LapNumber"].min()))
     lap = laps[laps["LapNumber"] == selected_lap].iloc[0]
 
 
-    tel = lap.get_telemetry()
+    tel = fetch_lap_telemetry(
+        session, lap, columns=["Distance", "Speed", "Throttle", "Brake", "nGear", "DRS"]
+    )
 
     # Speed vs Distance
     fig_speed = px.line(
-        tel,
+        thin_telemetry(tel, "Speed"),
         x="Distance",
         y="Speed",
         title=f"Speed vs Distance - {selected_driver_info}",
@@ -535,7 +1067,7 @@ def create_telemetry_plots(session, selected_driver_info):
 
     # Throttle vs Distance
     fig_throttle = px.line(
-        tel,
+        thin_telemetry(tel, "Throttle"),
         x="Distance",
         y="Throttle",
         title=f"Throttle vs Distance - {selected_driver_info}",
@@ -544,7 +1076,7 @@ def create_telemetry_plots(session, selected_driver_info):
 
     # Brake vs Distance
     fig_brake = px.line(
-        tel,
+        thin_telemetry(tel, "Brake"),
         x="Distance",
         y="Brake",
         title=f"Brake vs Distance - {selected_driver_info}",
@@ -553,7 +1085,7 @@ def create_telemetry_plots(session, selected_driver_info):
 
     # Gear Shifts vs Distance
     fig_gear = px.line(
-        tel,
+        thin_telemetry(tel, "nGear"),
         x="Distance",
         y="nGear",
         title=f"Gear Shifts vs Distance - {selected_driver_info}",
@@ -562,11 +1094,15 @@ def create_telemetry_plots(session, selected_driver_info):
 
     # DRS Usage
     fig_drs = px.line(
-        tel, x="Distance", y="DRS", title=f"DRS Usage - {selected_driver_info}"
+        thin_telemetry(tel, "DRS"),
+        x="Distance",
+        y="DRS",
+        title=f"DRS Usage - {selected_driver_info}",
     )
     st.plotly_chart(fig_drs, use_container_width=True)
 
 
+@timed
 def create_enhanced_telemetry_plots(session, selected_driver_info):
     st.subheader("📊 Enhanced Telemetry Analysis")
 
@@ -589,12 +1125,16 @@ def create_enhanced_telemetry_plots(session, selected_driver_info):
     selected_driver = selected_driver_info.split("(")[-1].strip(")")
 
     # Load the fastest lap telemetry data
+    ensure_session_data(session, "telemetry")
     lap = session.laps.pick_driver(selected_driver).pick_fastest()
-    tel = lap.get_telemetry()
+    tel = fetch_lap_telemetry(
+        session,
+        lap,
+        columns=["Distance", "Speed", "Throttle", "Brake", "nGear", "DRS", "RPM", "X", "Y"],
+    )
 
-    # Calculate Steering Angle
-    tel["delta_x"] = tel["X"].diff()
-    tel["delta_y"] = tel["Y"].diff()
+    # Calculate Steering Angle (on a new frame, the cached telemetry is shared)
+    tel = tel.assign(delta_x=tel["X"].diff(), delta_y=tel["Y"].diff())
     tel["SteeringAngle"] = np.arctan2(tel["delta_y"], tel["delta_x"]) * (180 / np.pi)
 
     # Define telemetry parameters and their labels
@@ -614,7 +1154,7 @@ def create_enhanced_telemetry_plots(session, selected_driver_info):
     with col1:
         for param, label in list(telemetry_params.items())[:4]:  # First four graphs
             fig = px.line(
-                tel,
+                thin_telemetry(tel, param),
                 x="Distance",
                 y=param,
                 title=f"{label} vs Distance - {selected_driver_info}",
@@ -625,7 +1165,7 @@ def create_enhanced_telemetry_plots(session, selected_driver_info):
     with col2:
         for param, label in list(telemetry_params.items())[4:]:  # Last three graphs
             fig = px.line(
-                tel,
+                thin_telemetry(tel, param),
                 x="Distance",
                 y=param,
                 title=f"{label} vs Distance - {selected_driver_info}",
@@ -634,7 +1174,60 @@ def create_enhanced_telemetry_plots(session, selected_driver_info):
             st.plotly_chart(fig, use_container_width=True)
 
 
+@timed
+def create_driver_lap_figure(laps, y, title, y_label, mode="lines"):
+    """
+    Figure with one trace of ``y`` against lap number per driver.
+
+    The laps are sorted by driver and lap number once into flat NumPy arrays
+    and every trace is a slice of them. Above ``WEBGL_POINT_THRESHOLD`` points
+    the traces are drawn with WebGL (``Scattergl``) instead of SVG.
+
+    Args:
+        laps (pandas.DataFrame): Laps with "Driver", "LapNumber" and ``y`` columns.
+        y (str): Column to plot; timedeltas are converted to seconds.
+        title (str): Figure title.
+        y_label (str): y axis title.
+        mode (str): Plotly trace mode, "lines" or "markers".
+
+    Returns:
+        plotly.graph_objects.Figure: The figure.
+    """
+    codes, drivers = pd.factorize(laps["Driver"])
+    values = laps[y]
+    if pd.api.types.is_timedelta64_dtype(values):
+        values = values.dt.total_seconds()
+
+    keep = codes >= 0  # Laps without a driver
+    codes = codes[keep]
+    lap_numbers = laps["LapNumber"].to_numpy(dtype=float)[keep]
+    order = np.lexsort((lap_numbers, codes))
+    x_values = lap_numbers[order]
+    y_values = values.to_numpy(dtype=float)[keep][order]
+    ends = np.cumsum(np.bincount(codes, minlength=len(drivers)))
+
+    trace_type = go.Scattergl if len(x_values) > WEBGL_POINT_THRESHOLD else go.Scatter
+    traces, start = [], 0
+    for driver, end in zip(drivers, ends):
+        traces.append(
+            trace_type(
+                x=x_values[start:end], y=y_values[start:end], mode=mode, name=driver
+            )
+        )
+        start = end
+
+    fig = go.Figure(data=traces)
+    fig.update_layout(
+        title=title,
+        xaxis_title="Lap Number",
+        yaxis_title=y_label,
+        legend_title_text="Driver",
+    )
+    return fig
+
+
 # Function to create lap time analysis
+@timed
 def create_lap_time_analysis(session):
     st.subheader("Lap Time Analysis")
     st.write(
@@ -642,11 +1235,14 @@ def create_lap_time_analysis(session):
         "It helps identify **race pace consistency, slow and fast laps, and strategy changes.**"
     )
     laps = session.laps
-    fig_lap_times = px.line(laps, x="LapNumber", y="LapTime", title="Lap Times")
+    fig_lap_times = create_driver_lap_figure(
+        laps, "LapTime", title="Lap Times", y_label="Lap Time (s)"
+    )
     st.plotly_chart(fig_lap_times, use_container_width=True)
 
 
 # Function to create tire usage analysis
+@timed
 def create_tire_usage_analysis(session):
     st.subheader("Tire Usage Analysis")
     st.write(
@@ -659,6 +1255,7 @@ def create_tire_usage_analysis(session):
 
 
 # Function to create sector time analysis
+@timed
 def create_sector_time_analysis(session, selected_driver_info):
     st.subheader("Sector Time Analysis")
 
@@ -685,34 +1282,91 @@ def create_sector_time_analysis(session, selected_driver_info):
     st.plotly_chart(fig_sector_times, use_container_width=True)
 
 
+def build_pit_stop_table(session):
+    """
+    One row per pit stop of the session, computed with vectorized operations.
+
+    FastF1 records ``PitInTime`` on the in-lap and ``PitOutTime`` on the
+    following out-lap, so each in-lap is paired with the next lap of the same
+    driver. Stops without an out-lap (e.g. retirements in the pit lane) are
+    left out. The pit-lane loss is the in-lap plus out-lap time minus two of
+    the driver's median laps without a pit stop.
+
+    Args:
+        session: FastF1 session with laps and results loaded.
+
+    Returns:
+        pandas.DataFrame: Columns DriverNumber, Driver, DriverName, Team,
+        LapNumber (in-lap), Stint, Compound, NewCompound, PitInTime,
+        PitOutTime, PitDuration and PitLaneLoss (seconds).
+    """
+    laps = pd.DataFrame(session.laps).sort_values(["DriverNumber", "LapNumber"])
+    laps = laps.reset_index(drop=True)
+    out_laps = laps.shift(-1)
+
+    paired = (
+        laps["PitInTime"].notna()
+        & (out_laps["DriverNumber"] == laps["DriverNumber"])
+        & (out_laps["LapNumber"] == laps["LapNumber"] + 1)
+        & out_laps["PitOutTime"].notna()
+    )
+
+    # Reference pace: median lap of each driver without pit lane time
+    lap_seconds = laps["LapTime"].dt.total_seconds()
+    clean = laps["PitInTime"].isna() & laps["PitOutTime"].isna()
+    median_lap = lap_seconds.where(clean).groupby(laps["DriverNumber"]).transform("median")
+
+    in_laps, next_laps = laps[paired], out_laps[paired]
+    pit_stops = pd.DataFrame(
+        {
+            "DriverNumber": in_laps["DriverNumber"],
+            "Driver": in_laps["Driver"],
+            "Team": in_laps["Team"],
+            "LapNumber": in_laps["LapNumber"].astype(int),
+            "Stint": in_laps["Stint"],
+            "Compound": in_laps["Compound"],
+            "NewCompound": next_laps["Compound"],
+            "PitInTime": in_laps["PitInTime"],
+            "PitOutTime": next_laps["PitOutTime"],
+            "PitDuration": (
+                next_laps["PitOutTime"] - in_laps["PitInTime"]
+            ).dt.total_seconds(),
+            "PitLaneLoss": (
+                lap_seconds[paired]
+                + next_laps["LapTime"].dt.total_seconds()
+                - 2 * median_lap[paired]
+            ),
+        }
+    ).reset_index(drop=True)
+
+    results = session.results
+    names = pd.Series(results["FullName"].values, index=results["DriverNumber"].values)
+    pit_stops.insert(2, "DriverName", pit_stops["DriverNumber"].map(names))
+    return pit_stops
+
+
+@timed
+def fetch_pit_stops(session):
+    """The pit-stop table of a loaded session, built once and kept in the session cache."""
+    return get_session_cache().get_or_load(
+        (*session_key(session), "pit_stops"), lambda: build_pit_stop_table(session)
+    )
+
+
 # Function to create pit stop analysis
+@timed
 def create_pit_stop_analysis(session):
     st.subheader("Pit Stop Analysis")
     st.write(
         "This chart shows **average pit stop durations** for each driver. "
         "It helps compare how quickly teams execute pit stops and their impact on race positions."
     )
-    # Get laps data
-    laps = session.laps
-
-    # Filter laps where pit stops occurred
-    pit_stops = laps[laps["PitInTime"].notna() | laps["PitOutTime"].notna()]
+    pit_stops = fetch_pit_stops(session)
 
     if not pit_stops.empty:
-        # Calculate pit stop duration
-        pit_stops["PitDuration"] = pit_stops["PitOutTime"] - pit_stops["PitInTime"]
-
-        # Convert pit duration to seconds
-        pit_stops["PitDuration"] = pit_stops["PitDuration"].dt.total_seconds()
-
         # Group by driver and calculate average pit stop duration
         pit_stop_summary = (
-            pit_stops.groupby("Driver")["PitDuration"].mean().reset_index()
-        )
-
-        # Add driver names
-        pit_stop_summary["DriverName"] = pit_stop_summary["Driver"].apply(
-            lambda x: session.get_driver(x)["FullName"]
+            pit_stops.groupby("DriverName")["PitDuration"].mean().reset_index()
         )
 
         # Plot pit stop durations
@@ -729,23 +1383,25 @@ def create_pit_stop_analysis(session):
 
 
 # Function to create position change analysis
+@timed
 def create_position_change_analysis(session):
     st.subheader("Position Change Analysis")
     laps = session.laps
-    fig_position = px.line(
+    fig_position = create_driver_lap_figure(
         laps,
-        x="LapNumber",
-        y="Position",
-        color="Driver",
+        "Position",
         title="Position Changes During the Race",
+        y_label="Position",
     )
     st.plotly_chart(fig_position, use_container_width=True)
 
 
 
 
+@timed
 def create_weather_analysis(session):
     st.subheader("Weather Analysis")
+    ensure_session_data(session, "weather")
     weather_data = session.weather_data
 
     if not weather_data.empty:
@@ -770,6 +1426,7 @@ def create_weather_analysis(session):
         st.write("No weather data available for this session.")
 
 
+@timed
 def create_team_radio_analysis(session, selected_driver_info):
     st.subheader("Team Radio Analysis")
     selected_driver = selected_driver_info.split("(")[-1].strip(")")
@@ -795,59 +1452,94 @@ def create_team_radio_analysis(session, selected_driver_info):
 
 
 # Function to create race track visualization with fastest lap colormap
+@timed
 def create_track_visualization(session, selected_driver_info):
     st.subheader("Race Track Visualization")
     selected_driver = selected_driver_info.split("(")[-1].strip(")")
 
     # Get the fastest lap for the selected driver
+    ensure_session_data(session, "telemetry")
     fastest_lap = session.laps.pick_driver(selected_driver).pick_fastest()
 
     # Get telemetry data for the fastest lap
-    tel = fastest_lap.get_telemetry()
+    tel = fetch_lap_telemetry(session, fastest_lap, columns=["X", "Y"])
 
     if not tel.empty:
-        # Plot the track layout with speed as a colormap
-        fig, ax = plt.subplots()
-        ff1.plotting.plot_track(session.track, ax=ax)
-        ax.plot(tel["X"], tel["Y"], color="red", label=selected_driver_info)
-        ax.set_title(f"Fastest Lap - {selected_driver_info}")
-        st.pyplot(fig)
+
+        def build():
+            # Plot the driver's line around the track
+            fig, ax = plt.subplots()
+            ax.plot(tel["X"], tel["Y"], color="red", label=selected_driver_info)
+            ax.set_title(f"Fastest Lap - {selected_driver_info}")
+            ax.axis("equal")
+            return fig
+
+        display_figure(
+            (*session_key(session), "track_visualization", selected_driver), build
+        )
     else:
         st.write("No telemetry data available for this driver.")
 
 
+@timed
 def create_lap_time_scatterplot(session):
     st.subheader("Drivers' Lap Time Comparison")
     laps = session.laps
-    fig_scatter = px.scatter(
-        laps, x="LapNumber", y="LapTime", color="Driver", title="Lap Time Comparison"
+    fig_scatter = create_driver_lap_figure(
+        laps,
+        "LapTime",
+        title="Lap Time Comparison",
+        y_label="Lap Time (s)",
+        mode="markers",
     )
     st.plotly_chart(fig_scatter, use_container_width=True)
 
 
-def who_can_win_wdc(year, round_number):
+@st.cache_data(ttl=STANDINGS_TTL_S, show_spinner=False)
+def load_driver_standings(year, round_number):
+    """
+    Driver standings after ``round_number`` from Ergast, or None if unavailable.
+
+    Cached apart from the sessions: a small table that must not compete
+    with them for the session cache budget, and that can still change
+    after the round (e.g. penalties).
+    """
+    standings = Ergast().get_driver_standings(season=year, round=round_number)
+    if not standings.content:
+        return None
+    return standings.content[0]
+
+
+@timed
+def fetch_driver_standings(year, round_number):
+    """Driver standings after ``round_number`` from Ergast, or None if unavailable."""
+    try:
+        return load_driver_standings(year, round_number)
+    except Exception as e:
+        st.warning(f"Error fetching driver standings: {e}")
+        return None
+
+
+def who_can_win_wdc(year, round_number, driver_standings=None):
     st.subheader("Who Can Still Win the WDC?")
 
     # Get the current driver standings
-    ergast = Ergast()
-    standings = ergast.get_driver_standings(season=year, round=round_number)
-    if standings.content.empty:
+    if driver_standings is None:
+        driver_standings = fetch_driver_standings(year, round_number)
+    if driver_standings is None or driver_standings.empty:
         st.write("No standings data available.")
         return
 
-    driver_standings = standings.content[0]
-
     # Calculate the maximum points for the remaining season
     def calculate_max_points_for_remaining_season():
         POINTS_FOR_SPRINT = 8 + 25 + 1  # Winning the sprint, race, and fastest lap
         POINTS_FOR_CONVENTIONAL = 25 + 1  # Winning the race and fastest lap
 
-        events = ff1.events.get_event_schedule(year, backend="ergast")
-        events = events[events["RoundNumber"] > round_number]
+        events = get_schedule_service().remaining_events(year, round_number)
 
         # Count how many sprints and conventional races are left
-        sprint_events = len(events.loc[events["EventFormat"] == "sprint_shootout"])
-        conventional_events = len(events.loc[events["EventFormat"] == "conventional"])
+        sprint_events = int(events["EventFormat"].isin(SPRINT_FORMATS).sum())
+        conventional_events = int((events["EventFormat"] == "conventional").sum())
 
         # Calculate points for each
         sprint_points = sprint_events * POINTS_FOR_SPRINT
@@ -880,65 +1572,58 @@ def who_can_win_wdc(year, round_number):
         )
 
 
-def draw_track_map(session):
-    st.subheader("Track Map with Numbered Corners")
-    try:
-        # Get the fastest lap
-        lap = session.laps.pick_fastest()
-        pos = lap.get_pos_data()
-    except: 
-        print("No data")
-        return
+@timed
+def fetch_track_geometry(session):
+    """
+    Rotated track outline, corner positions and corner labels of a circuit.
 
-    # Get circuit information
-    circuit_info = session.get_circuit_info()
+    Computed once per session and kept in the session cache; several
+    events of a season can share a location with different layouts.
+    """
 
-    # Define a helper function for rotating points
-    def rotate(xy, *, angle):
-        rot_mat = np.array(
-            [[np.cos(angle), np.sin(angle)], [-np.sin(angle), np.cos(angle)]]
+    def compute():
+        # Outline from the fastest lap's position data
+        ensure_session_data(session, "telemetry")
+        lap = session.laps.pick_fastest()
+        if isinstance(session, StoreSession):
+            pos = fetch_lap_telemetry(session, lap, columns=["X", "Y"])
+        else:
+            pos = lap.get_pos_data()
+
+        circuit_info = session.get_circuit_info()
+        corners = circuit_info.corners
+        track, corner_xy, label_xy = track_map_geometry(
+            pos.loc[:, ("X", "Y")].to_numpy(dtype=float),
+            corners.loc[:, ("X", "Y")].to_numpy(dtype=float),
+            corners["Angle"].to_numpy(dtype=float),
+            circuit_info.rotation,
         )
-        return np.matmul(xy, rot_mat)
-
-    # Get the track coordinates and rotate them
-    track = pos.loc[:, ("X", "Y")].to_numpy()
-    track_angle = circuit_info.rotation / 180 * np.pi
-    rotated_track = rotate(track, angle=track_angle)
-
-    # Create the plot
-    fig, ax = plt.subplots()
-    ax.plot(rotated_track[:, 0], rotated_track[:, 1], color="black")
+        labels = (corners["Number"].astype(str) + corners["Letter"].astype(str)).tolist()
+        return {"track": track, "corners": corner_xy, "label_xy": label_xy, "labels": labels}
 
-    # Define an offset vector for corner annotations
-    offset_vector = [500, 0]  # Adjust this value as needed
+    key = (*session_key(session), "track_geometry")
+    return get_session_cache().get_or_load(key, compute)
 
-    # Iterate over all corners and annotate them
-    for _, corner in circuit_info.corners.iterrows():
-        txt = f"{corner['Number']}{corner['Letter']}"  # Corner number and letter
 
-        # Convert the angle from degrees to radians
-        offset_angle = corner["Angle"] / 180 * np.pi
+def build_track_map_figure(session):
+    """Draw the track map with numbered corners."""
+    geometry = fetch_track_geometry(session)
+    track, corners, label_xy = geometry["track"], geometry["corners"], geometry["label_xy"]
 
-        # Rotate the offset vector
-        offset_x, offset_y = rotate(offset_vector, angle=offset_angle)
-
-        # Add the offset to the corner position
-        text_x = corner["X"] + offset_x
-        text_y = corner["Y"] + offset_y
-
-        # Rotate the text position
-        text_x, text_y = rotate([text_x, text_y], angle=track_angle)
-
-        # Rotate the corner position
-        track_x, track_y = rotate([corner["X"], corner["Y"]], angle=track_angle)
-
-        # Draw a circle next to the track
-        ax.scatter(text_x, text_y, color="grey", s=140)
-
-        # Draw a line from the track to the circle
-        ax.plot([track_x, text_x], [track_y, text_y], color="grey")
+    fig, ax = plt.subplots()
+    ax.plot(track[:, 0], track[:, 1], color="black")
+
+    # Lines from the track to the labels, separated by NaNs into one artist
+    gaps = np.full(len(corners), np.nan)
+    ax.plot(
+        np.column_stack([corners[:, 0], label_xy[:, 0], gaps]).ravel(),
+        np.column_stack([corners[:, 1], label_xy[:, 1], gaps]).ravel(),
+        color="grey",
+    )
 
-        # Print the corner number inside the circle
+    # Circles next to the track with the corner number inside
+    ax.scatter(label_xy[:, 0], label_xy[:, 1], color="grey", s=140, zorder=2)
+    for (text_x, text_y), txt in zip(label_xy, geometry["labels"]):
         ax.text(
             text_x,
             text_y,
@@ -947,6 +1632,7 @@ def draw_track_map(session):
             ha="center",
             size="small",
             color="white",
+            zorder=3,
         )
 
     # Add a title and clean up the plot
@@ -954,20 +1640,38 @@ def draw_track_map(session):
     ax.set_xticks([])
     ax.set_yticks([])
     ax.axis("equal")
+    return fig
 
-    # Display the plot in Streamlit
-    st.pyplot(fig)
 
+@timed
+def draw_track_map(session):
+    st.subheader("Track Map with Numbered Corners")
 
-def fetch_round_number(year, race_name):
-    schedule = fetch_races(year)
-    race_info = schedule[schedule["EventName"] == race_name]
+    # The outline needs position data, which a laps-only session loads with
+    # all of its telemetry; skip the opt-in when nothing has to be loaded
+    key = (*session_key(session), "track_map")
+    ready = (
+        isinstance(session, StoreSession)
+        or hasattr(session, SESSION_SECTIONS["telemetry"])
+        or (*key, FIGURE_FORMAT) in get_figure_cache()
+    )
+    if not ready and not section_enabled("Track Map", "Load track map"):
+        return
+
+    try:
+        # The rendered map is reused on every rerun, no figure is redrawn
+        display_figure(key, lambda: build_track_map_figure(session))
+    except Exception as e:
+        logging.warning(f"Track map unavailable: {e}")
+        st.info("No track map available for this session.")
 
-    if not race_info.empty:
-        return int(race_info["RoundNumber"].values[0])  # Extract round number
-    return None
 
+@timed
+def fetch_round_number(year, race_name):
+    return get_schedule_service().round_number(year, race_name)
 
+
+@timed
 def fetch_race_results(session):
     try:
         # Get race results (classified finishers)
@@ -997,30 +1701,41 @@ def format_time(delta):
     return f"{minutes:02}:{seconds:02}.{milliseconds:03}"
 
 
+@timed
 def fetch_qualifying_results(year, race_name):
-    try:
-        # Load the qualifying session
-        qualifying_session = ff1.get_session(year, race_name, "Q")
-        qualifying_session.load()
+    """Formatted qualifying results; raises if they cannot be loaded."""
+    if has_session(year, race_name, "Q"):
+        # Only the displayed columns are read from the columnar store
+        qualifying_results = read_session_table(
+            year, race_name, "Q", "results",
+            columns=["Position", "FullName", "Q1", "Q2", "Q3"],
+        )
+    else:
+        # Results-only qualifying session from the shared session cache
+        qualifying_session = fetch_qualifying_session(year, race_name)
+
+        if qualifying_session.results["Position"].isna().all():
+            # No official results yet, derive them from the lap times
+            ensure_session_data(qualifying_session, "laps", "messages")
+            with get_section_load_lock():
+                load_session_section(qualifying_session, "quali_results")
 
-        # Extract qualifying results
+        # Extract qualifying results (a copy, the cached session is shared)
         qualifying_results = qualifying_session.results[
             ["Position", "FullName", "Q1", "Q2", "Q3"]
-        ]
+        ].copy()
 
-        # Convert Position to integer
-        qualifying_results["Position"] = qualifying_results["Position"].astype(int)
+    # Convert Position to integer
+    qualifying_results["Position"] = qualifying_results["Position"].astype(int)
 
-        # Format Q1, Q2, Q3 times
-        for col in ["Q1", "Q2", "Q3"]:
-            qualifying_results[col] = qualifying_results[col].apply(format_time)
+    # Format Q1, Q2, Q3 times
+    for col in ["Q1", "Q2", "Q3"]:
+        qualifying_results[col] = qualifying_results[col].apply(format_time)
 
-        return qualifying_results
-    except Exception as e:
-        st.error(f"Error fetching qualifying results: {e}")
-        return None
+    return qualifying_results
 
 
+@timed
 def fetch_team_radio():
     """Fetches the latest Team Radio messages from the Formula 1 API."""
     try:
@@ -1076,6 +1791,7 @@ def display_team_radio():
 
 
 # Create telemetry comparison plots
+@timed
 def create_telemetry_comparison(session, selected_drivers):
     st.subheader("📊 Multi-Driver Telemetry Comparison")
 
@@ -1088,21 +1804,55 @@ def create_telemetry_comparison(session, selected_drivers):
         "RPM": "Engine RPM",
     }
 
-    fig = plt.figure(figsize=(12, 6))
-    ax = fig.add_subplot(111)
+    ensure_session_data(session, "telemetry")
 
+    # Fastest laps of the selected drivers with a timed lap on a common
+    # distance grid, one row per driver, shared by all charts below
+    labels, laps = [], []
     for driver_info in selected_drivers:
-        driver = driver_info.split("(")[-1].strip(")")
-        lap = session.laps.pick_driver(driver).pick_fastest()
-        tel = lap.get_telemetry()
+        lap = session.laps.pick_driver(driver_info.split("(")[-1].strip(")")).pick_fastest()
+        if lap is not None and pd.notna(lap["LapTime"]):
+            labels.append(driver_info)
+            laps.append(lap)
 
-        ax.plot(tel["Distance"], tel["Speed"], label=f"{driver_info}")
+    if not labels:
+        st.write("No timed lap available for the selected drivers.")
+        return
 
-    ax.set_xlabel("Distance (m)")
-    ax.set_ylabel("Speed (km/h)")
-    ax.set_title("Speed Comparison Across Drivers")
-    ax.legend()
-    st.pyplot(fig)
+    grid, channels = fetch_resampled_laps(session, laps, list(telemetry_params))
+    driver_telemetry = {
+        driver_info: pd.DataFrame(
+            {"Distance": grid, **{param: channels[param][row] for param in channels}}
+        )
+        for row, driver_info in enumerate(labels)
+    }
+
+    def build_speed_comparison():
+        fig = plt.figure(figsize=(12, 6))
+        ax = fig.add_subplot(111)
+
+        for driver_info in labels:
+            tel = thin_telemetry(driver_telemetry[driver_info], "Speed")
+
+            ax.plot(tel["Distance"], tel["Speed"], label=f"{driver_info}")
+
+        ax.set_xlabel("Distance (m)")
+        ax.set_ylabel("Speed (km/h)")
+        ax.set_title("Speed Comparison Across Drivers")
+        ax.legend()
+        return fig
+
+    # The figure depends on the drivers and the telemetry resolution settings
+    display_figure(
+        (
+            *session_key(session),
+            "speed_comparison",
+            tuple(labels),
+            st.session_state.get("telemetry_full_resolution", False),
+            st.session_state.get("telemetry_point_budget", TELEMETRY_POINT_BUDGET),
+        ),
+        build_speed_comparison,
+    )
 
     col1, col2 = st.columns(2)
     with col1:
@@ -1111,10 +1861,8 @@ def create_telemetry_comparison(session, selected_drivers):
                 title=f"{label} vs Distance",
                 labels={"Distance": "Distance (m)", param: label},
             )
-            for driver_info in selected_drivers:
-                driver = driver_info.split("(")[-1].strip(")")
-                lap = session.laps.pick_driver(driver).pick_fastest()
-                tel = lap.get_telemetry()
+            for driver_info in labels:
+                tel = thin_telemetry(driver_telemetry[driver_info], param)
                 fig_param.add_scatter(
                     x=tel["Distance"], y=tel[param], mode="lines", name=driver_info
                 )
@@ -1126,17 +1874,68 @@ def create_telemetry_comparison(session, selected_drivers):
                 title=f"{label} vs Distance",
                 labels={"Distance": "Distance (m)", param: label},
             )
-            for driver_info in selected_drivers:
-                driver = driver_info.split("(")[-1].strip(")")
-                lap = session.laps.pick_driver(driver).pick_fastest()
-                tel = lap.get_telemetry()
+            for driver_info in labels:
+                tel = thin_telemetry(driver_telemetry[driver_info], param)
                 fig_param.add_scatter(
                     x=tel["Distance"], y=tel[param], mode="lines", name=driver_info
                 )
             st.plotly_chart(fig_param, use_container_width=True)
 
 
+@timed
+def create_delta_time_analysis(session, selected_drivers):
+    st.subheader("⏱️ Delta Time to Reference Lap")
+    st.write(
+        "Cumulative time lost (above zero) or gained (below zero) over the lap "
+        "against the reference driver's fastest lap, showing where on track the gap is made."
+    )
+
+    driver_info = get_driver_names_with_numbers(session)
+    reference_info = st.selectbox(
+        "Reference lap (fastest lap of)",
+        driver_info,
+        index=driver_info.index(selected_drivers[0]),
+        key="delta_reference",
+    )
+    compare_all = st.checkbox("Compare all drivers", value=False, key="delta_all_drivers")
+    compared = driver_info if compare_all else selected_drivers
+
+    ensure_session_data(session, "telemetry")
+
+    # Reference first, then every compared driver with a timed lap
+    labels, laps = [], []
+    for info in [reference_info] + [d for d in compared if d != reference_info]:
+        lap = session.laps.pick_driver(info.split("(")[-1].strip(")")).pick_fastest()
+        if lap is not None and pd.notna(lap["LapTime"]):
+            labels.append(info)
+            laps.append(lap)
+
+    if not labels or labels[0] != reference_info:
+        st.write("No timed lap available for the reference driver.")
+        return
+
+    grid, channels = fetch_resampled_laps(session, laps, ["Time"])
+    deltas = delta_time(channels["Time"], reference=0)
+
+    trace_type = go.Scattergl if deltas.size > WEBGL_POINT_THRESHOLD else go.Scatter
+    traces = []
+    for row, label in enumerate(labels):
+        tel = thin_telemetry(pd.DataFrame({"Distance": grid, "Delta": deltas[row]}), "Delta")
+        traces.append(
+            trace_type(x=tel["Distance"], y=tel["Delta"], mode="lines", name=label)
+        )
+
+    fig = go.Figure(data=traces)
+    fig.update_layout(
+        title=f"Delta to {reference_info}",
+        xaxis_title="Distance (m)",
+        yaxis_title="Delta (s)",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
 # Create lap time comparison
+@timed
 def create_lap_time_comparison(session, selected_drivers):
     st.subheader("⏱️ Lap Time Comparison")
 
@@ -1157,6 +1956,7 @@ def create_lap_time_comparison(session, selected_drivers):
 
 
 # Create sector time comparison
+@timed
 def create_sector_time_comparison(session, selected_drivers):
     st.subheader("🏎️ Sector Time Comparison")
 
@@ -1187,27 +1987,21 @@ def create_sector_time_comparison(session, selected_drivers):
 
 
 # Create pit stop comparison
+@timed
 def create_pit_stop_comparison(session, selected_drivers):
     st.subheader("🛑 Pit Stop Comparison")
 
-    pit_stops = session.laps[session.laps["PitInTime"].notna()]
-    pit_stop_data = []
-
-    for driver_info in selected_drivers:
-        driver = driver_info.split("(")[-1].strip(")")
-        driver_pit_stops = pit_stops[pit_stops["Driver"] == driver]
-
-        for _, row in driver_pit_stops.iterrows():
-            pit_duration = (row["PitOutTime"] - row["PitInTime"]).total_seconds()
-            pit_stop_data.append(
-                {
-                    "Driver": driver_info,
-                    "Lap": row["LapNumber"],
-                    "PitDuration": pit_duration,
-                }
-            )
+    # Selected drivers by driver number
+    driver_labels = {
+        driver_info.split("(")[-1].strip(")"): driver_info
+        for driver_info in selected_drivers
+    }
+    pit_stops = fetch_pit_stops(session)
+    pit_df = pit_stops[pit_stops["DriverNumber"].isin(list(driver_labels))]
+    pit_df = pit_df.assign(
+        Driver=pit_df["DriverNumber"].map(driver_labels), Lap=pit_df["LapNumber"]
+    )
 
-    pit_df = pd.DataFrame(pit_stop_data)
     if not pit_df.empty:
         fig = px.bar(
             pit_df, x="Driver", y="PitDuration", color="Lap", title="Pit Stop Durations"
@@ -1233,6 +2027,7 @@ def render_track_map(session, selected_driver_info):
     selected_driver = selected_driver_info.split("(")[-1].strip(")")
 
     # Get the fastest lap for the selected driver
+    ensure_session_data(session, "telemetry")
     fastest_lap = session.laps.pick_driver(selected_driver).pick_fastest()
     
     
@@ -1241,11 +2036,14 @@ def render_track_map(session, selected_driver_info):
         return
 
     # Get telemetry data (GPS X, Y coordinates & Speed)
-    telemetry = fastest_lap.get_telemetry()
+    telemetry = fetch_lap_telemetry(
+        session, fastest_lap, columns=["Distance", "X", "Y", "Speed"]
+    )
 
-    # Create a scatter plot with GPS data
+    # Create a scatter plot with GPS data, thinned along the lap distance so
+    # the points keep covering the whole track
     fig = px.scatter(
-        telemetry,
+        thin_telemetry(telemetry, "Speed"),
         x="X",
         y="Y",
         color="Speed",
@@ -1263,6 +2061,7 @@ def render_track_map(session, selected_driver_info):
     st.plotly_chart(fig, use_container_width=True)
 
 
+@timed
 def create_ai_analysis_data(session, selected_driver_info, selected_graphs):
     """
     Creates a structured data object for AI analysis based on user-selected graphs.
@@ -1278,14 +2077,17 @@ def create_ai_analysis_data(session, selected_driver_info, selected_graphs):
 
     try:
         selected_driver = selected_driver_info.split("(")[-1].strip(")")
+        ensure_session_data(session, "telemetry")
         fastest_lap = session.laps.pick_driver(selected_driver).pick_fastest()
-        telemetry = fastest_lap.get_telemetry()
-        pit_stops = session.laps[session.laps["PitInTime"].notna()]
+        telemetry = fetch_lap_telemetry(
+            session,
+            fastest_lap,
+            columns=["Speed", "Throttle", "Brake", "nGear", "DRS", "RPM", "Distance"],
+        )
+        pit_stops = fetch_pit_stops(session)
 
         average_pit_duration = (
-            (pit_stops["PitOutTime"] - pit_stops["PitInTime"]).dt.total_seconds().mean()
-            if not pit_stops.empty
-            else None
+            pit_stops["PitDuration"].mean() if not pit_stops.empty else None
         )
 
         def convert_to_serializable(value):
@@ -1297,22 +2099,22 @@ def create_ai_analysis_data(session, selected_driver_info, selected_graphs):
 
         # Include only user-selected graphs
         if "Fastest Lap Time" in selected_graphs:
-            data_for_analysis["Fastest Lap Time (s)"] += convert_to_serializable(
+            data_for_analysis["Fastest Lap Time (s)"] = convert_to_serializable(
                 fastest_lap.LapTime.total_seconds()
             )
 
         if "Top Speed" in selected_graphs:
-            data_for_analysis["Top Speed (km/h)"] += convert_to_serializable(
+            data_for_analysis["Top Speed (km/h)"] = convert_to_serializable(
                 telemetry["Speed"].max()
             )
 
         if "Throttle Analysis" in selected_graphs:
-            data_for_analysis["Average Throttle (%)"] += convert_to_serializable(
+            data_for_analysis["Average Throttle (%)"] = convert_to_serializable(
                 telemetry["Throttle"].mean()
             )
 
         if "Sector Times" in selected_graphs:
-            data_for_analysis["Sector Times (s)"] += {
+            data_for_analysis["Sector Times (s)"] = {
                 "Sector 1": (
                     convert_to_serializable(fastest_lap.Sector1Time.total_seconds())
                     if pd.notna(fastest_lap.Sector1Time)
@@ -1331,7 +2133,7 @@ def create_ai_analysis_data(session, selected_driver_info, selected_graphs):
             }
 
         if "Pit Stop Analysis" in selected_graphs:
-            data_for_analysis["Pit Stop Analysis"] += {
+            data_for_analysis["Pit Stop Analysis"] = {
                 "Total Pit Stops": convert_to_serializable(len(pit_stops)),
                 "Average Pit Duration (s)": convert_to_serializable(
                     average_pit_duration
@@ -1339,7 +2141,7 @@ def create_ai_analysis_data(session, selected_driver_info, selected_graphs):
             }
 
         if "Telemetry Summary" in selected_graphs:
-            data_for_analysis["Telemetry Summary"] += {
+            data_for_analysis["Telemetry Summary"] = {
                 "Max RPM": (
                     convert_to_serializable(telemetry["RPM"].max())
                     if "RPM" in telemetry.columns
@@ -1372,6 +2174,7 @@ def create_ai_analysis_data(session, selected_driver_info, selected_graphs):
     except Exception as e:
         return {"error": f"Failed to process AI analysis data: {e}"}
 
+@timed
 def generate_strategy_recommendations(data):
     """Send telemetry data to AI for strategy optimization insights."""
 
@@ -1405,6 +2208,7 @@ def generate_strategy_recommendations(data):
         return f"Error: {response.status_code} - {response.text}"
     
  #Function to send race strategy question to Ollama API
+@timed
 def ask_race_strategy_question(question, data):
     payload = {
         "model": "llama3",
@@ -1420,8 +2224,214 @@ def ask_race_strategy_question(question, data):
     else:
         return f"Error: {response.status_code} - Unable to fetch AI insights."
 
+@st.cache_resource
+def get_live_consumer():
+    """Start the consumer of the producer's queues, one per server process."""
+    consumer = LiveConsumer(max_points=LIVE_POINTS)
+    consumer.start()
+    return consumer
+
+
+def live_frame(records, columns):
+    """Chart rows of live records: ``columns`` and the driver number as a label."""
+    frame = pd.DataFrame.from_records(records, columns=["driver_number", *columns])
+    frame["driver"] = frame.pop("driver_number").astype(str)
+    return frame
+
+
+def live_car_frame(car_data, channels):
+    """
+    Chart rows of ring buffer car data: the sample date, ``channels`` and the
+    driver number as a label.
+
+    Args:
+        car_data (dict): Driver number -> columns from ``car_data_since``.
+        channels (list): Channels to include.
+    """
+    frames = [
+        pd.DataFrame(
+            {
+                # OpenF1 dates have millisecond precision
+                "date": pd.to_datetime(np.round(columns["time"] * 1000), unit="ms", utc=True),
+                **{channel: columns[channel] for channel in channels},
+                "driver": str(driver_number),
+            }
+        )
+        for driver_number, columns in car_data.items()
+        if len(columns.get("time", ()))
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["date", *channels, "driver"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def append_chart_rows(area, chart, frame, **encoding):
+    """Draw the first rows into ``area`` as a line chart, append later ones to it."""
+    if frame.empty:
+        return chart
+    if chart is None:
+        return area.line_chart(frame, **encoding)
+    chart.add_rows(frame)
+    return chart
+
+
+def display_live_latency(area, receive_latencies, render_latencies):
+    """Median and 95th percentile latency from publish to receive and to render."""
+    with area.container():
+        columns = st.columns(4)
+        for column, (label, latencies) in zip(
+            (columns[:2], columns[2:]),
+            (("Publish → receive", receive_latencies), ("Publish → render", render_latencies)),
+        ):
+            if latencies:
+                p50, p95 = np.percentile(latencies, [50, 95])
+                column[0].metric(f"{label} (median)", f"{p50 * 1000:.0f} ms")
+                column[1].metric(f"{label} (p95)", f"{p95 * 1000:.0f} ms")
+            else:
+                column[0].metric(f"{label} (median)", "–")
+                column[1].metric(f"{label} (p95)", "–")
+
+
+def display_live_page():
+    """
+    Live car data and laps of the session ``produce.py`` publishes.
+
+    The charts are drawn once from the buffered records; afterwards only the
+    records arriving since the previous update are appended with
+    ``add_rows``. The page keeps updating until the user interacts with it.
+    """
+    st.header("📡 Live Session")
+    consumer = get_live_consumer()
+
+    memory = consumer.memory()
+    st.sidebar.caption(
+        f"Live ring buffers: {memory['drivers']} drivers × {memory['capacity']} samples, "
+        f"{memory['bytes'] / 1024 ** 2:.1f} MB"
+    )
+    if st.sidebar.button("💾 Snapshot live telemetry"):
+        paths = consumer.snapshot(LIVE_SNAPSHOT_DIR)
+        st.sidebar.success(f"Saved {len(paths)} drivers to {LIVE_SNAPSHOT_DIR}")
+
+    drivers = consumer.drivers()
+    if not drivers:
+        st.info(
+            f"Waiting for live data from {consumer.transport_name or 'the transport'} "
+            f"({consumer.status}). "
+            "Run `python produce.py` to publish the latest session."
+        )
+        time.sleep(LIVE_REFRESH_S)
+        st.rerun()
+
+    selected = st.multiselect("Drivers", drivers, default=drivers[:3], key="live_drivers")
+    if not selected:
+        st.warning("Select at least one driver.")
+        return
+
+    latency_area = st.empty()
+    st.subheader("Speed (km/h)")
+    speed_area = st.empty()
+    st.subheader("Throttle (%)")
+    throttle_area = st.empty()
+    st.subheader("Lap Times (s)")
+    lap_area = st.empty()
+
+    car_seen, lap_seen = {}, {}
+    speed_chart = throttle_chart = lap_chart = None
+    render_latencies = collections.deque(maxlen=1000)
+    rows_drawn = 0
+    while True:
+        car_data, laps = {}, []
+        for driver_number in selected:
+            columns, total = consumer.car_data_since(
+                driver_number, car_seen.get(driver_number, 0)
+            )
+            if driver_number not in car_seen:
+                # The charts start from the latest samples, not the whole buffer
+                columns = {name: values[-LIVE_CHART_POINTS:] for name, values in columns.items()}
+            car_data[driver_number], car_seen[driver_number] = columns, total
+            records, lap_seen[driver_number] = consumer.laps_since(
+                driver_number, lap_seen.get(driver_number, 0)
+            )
+            laps += records
+
+        car_frame = live_car_frame(car_data, ["speed", "throttle"])
+        speed_chart = append_chart_rows(
+            speed_area, speed_chart, car_frame, x="date", y="speed", color="driver"
+        )
+        throttle_chart = append_chart_rows(
+            throttle_area, throttle_chart, car_frame, x="date", y="throttle", color="driver"
+        )
+        lap_chart = append_chart_rows(
+            lap_area,
+            lap_chart,
+            # A lap arrives again once its duration is known, draw only that version
+            live_frame(laps, ["lap_number", "lap_duration"]).dropna(subset=["lap_duration"]),
+            x="lap_number",
+            y="lap_duration",
+            color="driver",
+        )
+
+        rendered_at = time.time()
+        for columns in car_data.values():
+            published_at = columns.get("published_at", np.empty(0))
+            render_latencies.extend(rendered_at - published_at[~np.isnan(published_at)])
+        render_latencies.extend(
+            rendered_at - record["_published_at"]
+            for record in laps
+            if record["_published_at"] is not None
+        )
+        display_live_latency(latency_area, consumer.receive_latencies(), render_latencies)
+
+        # Redraw from the latest samples once the charts hold twice as many
+        rows_drawn += len(car_frame)
+        if rows_drawn > 2 * LIVE_CHART_POINTS * len(selected):
+            st.rerun()
+        time.sleep(LIVE_REFRESH_S)
+
+
 ## Main function
+def display_podium(top_3):
+    st.subheader("🏆 Podium Finishers")
+    if top_3 is None:
+        return
+    for _, row in top_3.iterrows():
+        driver_name = row["FullName"]
+        driver_team = row["TeamName"]
+
+        if row["Position"] == 1:
+            st.markdown(
+                f"<h1 style='font-size:32px;'>🥇 <b>{driver_name} ({driver_team})</b></h1>",
+                unsafe_allow_html=True,
+            )
+        elif row["Position"] == 2:
+            st.markdown(
+                f"<h2 style='font-size:28px;'>🥈 <b>{driver_name} ({driver_team})</b></h2>",
+                unsafe_allow_html=True,
+            )
+        elif row["Position"] == 3:
+            st.markdown(
+                f"<h3 style='font-size:26px;'>🥉 <b>{driver_name} ({driver_team})</b></h3>",
+                unsafe_allow_html=True,
+            )
+
+
+def display_qualifying_results(qualifying_results):
+    if qualifying_results is not None:
+        st.subheader("🏁 Qualifying Results")
+        st.dataframe(
+            qualifying_results.style.set_properties(**{"text-align": "center"})
+        )
+    else:
+        st.write("No qualifying data available.")
+
+
 def main():
+    # Counted by fetch_lap_telemetry, shown in the cache statistics
+    st.session_state["telemetry_calls_saved"] = 0
+
+    if PREFETCH_INTERVAL_S > 0:
+        start_prefetch_worker()
+
     # Inject custom CSS
     inject_custom_css()
     st.title("Formula One Dashboard 🏎️")
@@ -1436,18 +2446,24 @@ def main():
         unsafe_allow_html=True,
     )
 
+    # Live mode replaces the historical analysis with the streaming page
+    mode = st.sidebar.radio("📡 Mode", ["Historical", "Live"], horizontal=True, key="mode")
+    if mode == "Live":
+        display_live_page()
+        return
+
     # Sidebar for filters
     st.sidebar.title("Filters")
 
     # Ensure session state is initialized
     if "year" not in st.session_state:
-        st.session_state["year"] = 2025  # Default value
+        st.session_state["year"] = LATEST_SEASON  # Default value
     if "race_name" not in st.session_state:
         st.session_state["race_name"] = ""
 
     # Select Year
     st.session_state["year"] = st.sidebar.selectbox(
-        "Select Year", range(2025, 2000, -1), index=0
+        "Select Year", range(LATEST_SEASON, 2000, -1), index=0
     )
     year = st.session_state["year"]
 
@@ -1467,94 +2483,116 @@ def main():
     )
     selected_race = st.session_state["race_name"]
 
+    # Points drawn per telemetry trace
+    st.sidebar.subheader("📉 Telemetry Resolution")
+    st.sidebar.checkbox("Full resolution", value=False, key="telemetry_full_resolution")
+    st.sidebar.number_input(
+        "Points per trace",
+        min_value=50,
+        max_value=20000,
+        value=TELEMETRY_POINT_BUDGET,
+        step=50,
+        key="telemetry_point_budget",
+    )
+
 
     # Dynamically get the round number based on selected race
     round_number = fetch_round_number(year, selected_race)
-    session = fetch_session_data(year, selected_race)
-    has_data = True  # Check if session has lap data
 
-    # Fetch session data and race results using the retrieved round number
+    # The race session, qualifying results and standings do not depend on each
+    # other: load them concurrently and render each section as it arrives
+    load_start = time.perf_counter()
+    loader = TaskLoader(LOADER_WORKERS, wrap=with_script_run_ctx)
+    loader.submit("Race session", fetch_session_data, year, selected_race)
     if round_number:
-        session = fetch_session_data(year, selected_race)
-        race_results, top_3 = fetch_race_results(session)
-        qualifying_results = fetch_qualifying_results(year, selected_race)
+        loader.submit("Qualifying results", fetch_qualifying_results, year, selected_race)
+        loader.submit("Driver standings", load_driver_standings, year, round_number)
 
-        if not has_data:
-            st.warning(
-                "No data available for the selected race. Please choose another race."
-            )
-        else:
-            st.header(f"🏁 {selected_race} - {year}")
+    if round_number:
+        # Event details come from the cached schedule, not the race session
+        event = get_schedule_service().event(year, round_number)
+        st.header(f"🏁 {selected_race} - {year}")
 
-            col1, col2 = st.columns(2)  # Two columns for race details
+        col1, col2 = st.columns(2)  # Two columns for race details
 
-            with col1:
-                st.subheader("Race Information")
-                st.write(f"📅 **Race Date:** {session.event['EventDate']}")
-                st.write(f"📍 **Track:** {session.event['Location']}")
-
-                if race_results is not None:
-                    st.subheader("🏆 Podium Finishers")
-                    if top_3 is not None:
-                        for _, row in top_3.iterrows():
-                            driver_name = row["FullName"]
-                            driver_team = row["TeamName"]
-
-                            if row["Position"] == 1:
-                                st.markdown(
-                                    f"<h1 style='font-size:32px;'>🥇 <b>{driver_name} ({driver_team})</b></h1>",
-                                    unsafe_allow_html=True,
-                                )
-                            elif row["Position"] == 2:
-                                st.markdown(
-                                    f"<h2 style='font-size:28px;'>🥈 <b>{driver_name} ({driver_team})</b></h2>",
-                                    unsafe_allow_html=True,
-                                )
-                            elif row["Position"] == 3:
-                                st.markdown(
-                                    f"<h3 style='font-size:26px;'>🥉 <b>{driver_name} ({driver_team})</b></h3>",
-                                    unsafe_allow_html=True,
-                                )
-
-                # Display qualifying results
-                if qualifying_results is not None:
-                    st.subheader("🏁 Qualifying Results")
-                    st.dataframe(
-                        qualifying_results.style.set_properties(
-                            **{"text-align": "center"}
-                        )
-                    )
-                else:
-                    st.write("No qualifying data available.")
+        with col1:
+            st.subheader("Race Information")
+            st.write(f"📅 **Race Date:** {event['EventDate']}")
+            st.write(f"📍 **Track:** {event['Location']}")
+            podium_area = st.container()
+            qualifying_area = st.container()
 
-            with col2:
-                # Get the circuit name from the selected Grand Prix
-                circuit_name = grand_prix_to_circuit.get(selected_race)
+        with col2:
+            # Get the circuit name from the selected Grand Prix
+            circuit_name = grand_prix_to_circuit.get(selected_race)
+
+            # Retrieve track details using the circuit name
+            track_details = track_info.get(circuit_name)
 
-                # Retrieve track details using the circuit name
-                track_details = track_info.get(circuit_name)
+            if track_details:
+                st.subheader("🏁 Track Information")
+                st.write(
+                    f"📍 **Location:** {track_details['location']}, {track_details['country']}"
+                )
+                st.write(f"📏 **Length:** {track_details['length_km']} km")
+                st.write(f"🔄 **Number of Corners:** {track_details['corners']}")
+                st.write(f"📜 **History:** {track_details['history']}")
+            else:
+                st.warning("Track information not available for this Grand Prix.")
 
-                if track_details:
-                    st.subheader("🏁 Track Information")
-                    st.write(
-                        f"📍 **Location:** {track_details['location']}, {track_details['country']}"
-                    )
-                    st.write(f"📏 **Length:** {track_details['length_km']} km")
-                    st.write(f"🔄 **Number of Corners:** {track_details['corners']}")
-                    st.write(f"📜 **History:** {track_details['history']}")
-                else:
-                    st.warning("Track information not available for this Grand Prix.")
+            track_map_area = st.container()  # Track map in the second column
 
-                draw_track_map(session)  # Display the track map in the second column
+        standings_area = st.expander("🏆 Championship Standings", expanded=False)
 
-            st.markdown("---")  # Separator
+        st.markdown("---")  # Separator
 
     else:
         st.warning("Unable to determine the round number for the selected race.")
 
+    # Section each task renders into, errors included
+    task_areas = (
+        {
+            "Race session": podium_area,
+            "Qualifying results": qualifying_area,
+            "Driver standings": standings_area,
+        }
+        if round_number
+        else {}
+    )
+
+    session = None
+    for name, future in loader.as_completed():
+        # Tasks raise instead of calling st.* from their worker thread
+        try:
+            result = future.result()
+        except Exception as e:
+            with task_areas.get(name) or st.container():
+                st.warning(f"Error fetching {name.lower()}: {e}")
+            continue
+        if name == "Race session":
+            session = result
+            if round_number and session is not None:
+                with podium_area:
+                    race_results, top_3 = fetch_race_results(session)
+                    if race_results is not None:
+                        display_podium(top_3)
+        elif name == "Qualifying results":
+            with qualifying_area:
+                display_qualifying_results(result)
+        elif name == "Driver standings":
+            with standings_area:
+                who_can_win_wdc(year, round_number, result)
+    loader.shutdown()
+    display_load_timings(loader.timings, time.perf_counter() - load_start)
+
+    # Drawn after the loaded results so they never wait for position data
+    if round_number and session is not None:
+        with track_map_area:
+            draw_track_map(session)
+
     st.markdown("---")  # Separator for sections
 
-    if not session:
+    if session is None:
         st.stop()
     else:
         # Driver selection
@@ -1647,8 +2685,9 @@ def main():
 
     # **Accordion Sections**
     with st.expander("📊 Telemetry & Performance", expanded=False):
-        render_track_map(session, selected_driver_info)
-        create_telemetry_plots(session, selected_driver_info)
+        if section_enabled("Telemetry", "Load telemetry data"):
+            render_track_map(session, selected_driver_info)
+            create_telemetry_plots(session, selected_driver_info)
 
     with st.expander("⏱️ Lap & Tire Analysis", expanded=False):
         create_lap_time_scatterplot(session)
@@ -1659,10 +2698,12 @@ def main():
     with st.expander("🔧 Pit Stops & Weather", expanded=False):
         create_pit_stop_analysis(session)
         create_position_change_analysis(session)
-        create_weather_analysis(session)
+        if section_enabled("Pit Stops & Weather", "Load weather data"):
+            create_weather_analysis(session)
 
     with st.expander("📈 Enhanced Telemetry Analysis", expanded=False):
-        create_enhanced_telemetry_plots(session, selected_driver_info)
+        if section_enabled("Enhanced Telemetry", "Load telemetry data"):
+            create_enhanced_telemetry_plots(session, selected_driver_info)
 
     # **Driver Comparison Section**
     with st.expander("🏎️ Driver Comparison", expanded=False):
@@ -1679,21 +2720,25 @@ def main():
 
         if len(selected_drivers) < 2:
             st.warning("Please select at least two drivers for comparison.")
-            st.stop()
+        else:
+            # Layout for comparison charts
+            col1, col2 = st.columns(2)
 
-        # Layout for comparison charts
-        col1, col2 = st.columns(2)
+            with col1:
+                create_lap_time_comparison(session, selected_drivers)
+                create_pit_stop_comparison(session, selected_drivers)
 
-        with col1:
-            create_lap_time_comparison(session, selected_drivers)
-            create_pit_stop_comparison(session, selected_drivers)
+            with col2:
+                create_sector_time_comparison(session, selected_drivers)
+
+            if section_enabled("Driver Comparison", "Load telemetry comparison"):
+                create_telemetry_comparison(session, selected_drivers)
+                create_delta_time_analysis(session, selected_drivers)
+
+    display_cache_stats()
+    display_perf_panel(year, selected_race)
 
-        with col2:
-            create_sector_time_comparison(session, selected_drivers)
 
-        create_telemetry_comparison(session, selected_drivers)
-        
-        
 # Call this function at the end of the app
 add_footer()
 
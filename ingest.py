@@ -0,0 +1,63 @@
+"""
+Ingest race weekends into the columnar session store read by the dashboard.
+
+Usage:
+    python ingest.py 2024 "Bahrain Grand Prix"
+    python ingest.py 2024 1 --sessions R --no-telemetry
+"""
+
+import argparse
+import logging
+import os
+
+import fastf1 as ff1
+
+import store
+
+
+def ingest_event(year, event, sessions=("R", "Q"), root=store.STORE_DIR, telemetry=True):
+    """
+    Load the given sessions of an event with FastF1 and write them to the store.
+
+    Args:
+        year (int): Championship year.
+        event (str or int): Event name or round number.
+        sessions (tuple): Session identifiers to ingest, e.g. ("R", "Q").
+        root (str): Store root directory.
+        telemetry (bool): Also store per-lap telemetry.
+
+    Returns:
+        list: Paths of the written session directories.
+    """
+    paths = []
+    for session_code in sessions:
+        session = ff1.get_session(year, event, session_code)
+        session.load(telemetry=telemetry)
+        path = store.write_session(session, session_code, root=root, telemetry=telemetry)
+        logging.info(f"Stored {year} {session.event['EventName']} {session.name} in {path}")
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("year", type=int)
+    parser.add_argument("event", help="Event name or round number")
+    parser.add_argument("--sessions", nargs="+", default=["R", "Q"])
+    parser.add_argument("--store", default=store.STORE_DIR, help="Store root directory")
+    parser.add_argument("--no-telemetry", action="store_true", help="Skip per-lap telemetry")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    # Share the FastF1 cache with the dashboard
+    if not os.path.exists("cache"):
+        os.mkdir("cache")
+    ff1.Cache.enable_cache("cache")
+
+    event = int(args.event) if args.event.isdigit() else args.event
+    ingest_event(args.year, event, args.sessions, root=args.store, telemetry=not args.no_telemetry)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Background consumer of the producer's ``telemetry_data`` and ``lap_data`` queues.
+
+A ``LiveConsumer`` thread drains both queues into in-memory state: the most
+recent car data samples per driver in a fixed-size ``TelemetryRing``, and every
+lap per driver. Readers ask for the records
+that arrived since their last read, so charts can append new points instead of
+being rebuilt. Messages are the JSON-lines batches published by ``produce.py``
+(single JSON records are accepted as well) over any backend of
+``transport.py``; their ``published_at`` header gives the latency from
+publish to receive.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from ring_buffer import TelemetryRing
+from transport import TransportError, open_transport
+
+# Queue -> kind of record it carries
+QUEUES = {"telemetry_data": "car_data", "lap_data": "laps"}
+
+
+def decode_message(body, headers=None):
+    """
+    Records of a message and the time it was published.
+
+    Args:
+        body (bytes): A JSON-lines batch or a single JSON record.
+        headers (dict): Message headers, may carry ``published_at``.
+
+    Returns:
+        tuple: ``(records, published_at)``; ``published_at`` is None when the
+        producer did not stamp the message.
+    """
+    published_at = (headers or {}).get("published_at")
+    records = [json.loads(line) for line in body.splitlines() if line.strip()]
+    return records, published_at
+
+
+class LiveConsumer(threading.Thread):
+    """
+    Daemon thread draining the live queues into per-driver state.
+
+    Car data keeps the latest ``max_points`` samples per driver in a ring
+    buffer allocated when the driver's first sample arrives; laps are kept in
+    full with ``_published_at`` and ``_received_at`` (epoch seconds) fields.
+    The transport is re-opened after errors.
+
+    Args:
+        open_transport (callable): Returns a connected transport.
+        max_points (int): Car data samples kept per driver.
+        retry_interval (float): Seconds between reconnection attempts.
+    """
+
+    def __init__(self, open_transport=open_transport, max_points=2000, retry_interval=5.0):
+        super().__init__(name="live-consumer", daemon=True)
+        self.open_transport = open_transport
+        self.transport_name = None
+        self.received = 0  # records received in total
+        self.max_points = max_points
+        self.retry_interval = retry_interval
+        self.status = "connecting"
+        self._car_data = {}  # driver_number -> TelemetryRing
+        self._laps = {}  # driver_number -> laps in arrival order
+        self._receive_latencies = deque(maxlen=1000)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def on_message(self, queue, body, headers):
+        """Add the records of one message to the state of its kind."""
+        received_at = time.time()
+        try:
+            records, published_at = decode_message(body, headers)
+        except ValueError as e:
+            logging.warning(f"Skipping undecodable message on {queue}: {e}")
+            return
+        kind = QUEUES[queue]
+        with self._lock:
+            if published_at is not None:
+                self._receive_latencies.append(received_at - published_at)
+            self.received += len(records)
+            for record in records:
+                driver_number = record.get("driver_number")
+                if driver_number is None:
+                    continue
+                record["_published_at"] = published_at
+                record["_received_at"] = received_at
+                if kind == "car_data":
+                    ring = self._car_data.get(driver_number)
+                    if ring is None:
+                        ring = TelemetryRing(self.max_points)
+                    try:
+                        ring.append_record(record)
+                    except (KeyError, ValueError) as e:
+                        logging.warning(f"Skipping car data sample without a valid date: {e}")
+                        continue
+                    self._car_data[driver_number] = ring
+                else:
+                    self._laps.setdefault(driver_number, []).append(record)
+
+    def drivers(self):
+        """Driver numbers seen so far."""
+        with self._lock:
+            return sorted(set(self._car_data) | set(self._laps))
+
+    def car_data_since(self, driver_number, seen=0):
+        """
+        Car data of a driver received after the first ``seen`` samples.
+
+        Samples already overwritten are skipped. The arrays are copied under
+        the lock: a view of a nearly full ring buffer would be overwritten by
+        the next message.
+
+        Returns:
+            tuple: ``(columns, total)``; ``columns`` maps "time",
+            "published_at" and every channel to an array, pass ``total`` as
+            ``seen`` next time.
+        """
+        with self._lock:
+            ring = self._car_data.get(driver_number)
+            if ring is None:
+                return {}, 0
+            columns, total = ring.since(seen)
+            return {name: column.copy() for name, column in columns.items()}, total
+
+    def memory(self):
+        """Drivers buffered, samples kept per driver and bytes held by the ring buffers."""
+        with self._lock:
+            return {
+                "drivers": len(self._car_data),
+                "capacity": self.max_points,
+                "bytes": sum(ring.nbytes for ring in self._car_data.values()),
+            }
+
+    def snapshot(self, directory):
+        """
+        Save every driver's ring buffer to ``<directory>/<driver_number>.npz``.
+
+        Returns:
+            list: Paths written.
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        with self._lock:
+            for driver_number, ring in self._car_data.items():
+                path = os.path.join(directory, f"{driver_number}.npz")
+                ring.snapshot(path)
+                paths.append(path)
+        return paths
+
+    def laps_since(self, driver_number, seen=0):
+        """Laps of a driver received after the first ``seen``, and the total."""
+        with self._lock:
+            laps = self._laps.get(driver_number, [])
+            return laps[seen:], len(laps)
+
+    def receive_latencies(self):
+        """Seconds from publish to receive of the latest messages."""
+        with self._lock:
+            return list(self._receive_latencies)
+
+    def consume(self):
+        """Consume until stopped or the transport fails."""
+        transport = self.open_transport()
+        self.transport_name = transport.name
+        try:
+            for queue in QUEUES:
+                transport.declare(queue)
+                transport.consume(queue, self.on_message)
+            self.status = "connected"
+            while not self._stop_event.is_set():
+                transport.poll(0.5)
+        finally:
+            transport.close()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.consume()
+            except TransportError as e:
+                self.status = f"disconnected ({e})"
+                logging.warning(f"Live consumer lost its transport: {e}")
+                self._stop_event.wait(self.retry_interval)
+
+    def stop(self):
+        self._stop_event.set()
@@ -0,0 +1,128 @@
+"""Per-rerun timing of dashboard functions: wall time, rows processed and cache hits."""
+
+import functools
+import json
+import threading
+import time
+
+import pandas as pd
+
+
+def count_rows(result):
+    """
+    Rows in a function's result: the length of DataFrames, Series, arrays and
+    lists, summed over tuples such as ``(race_results, top_3)``.
+    """
+    if isinstance(result, tuple):
+        return sum(count_rows(item) for item in result)
+    if isinstance(result, (str, bytes, dict)) or not hasattr(result, "__len__"):
+        return 0
+    return len(result)
+
+
+class PerfRecorder:
+    """
+    Collects one record per instrumented call during a rerun.
+
+    Calls nest: a record's ``rows`` falls back to the rows of the calls made
+    inside it when the function itself returns nothing countable (as the
+    ``create_*`` chart functions do).
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()  # per-thread stack of open calls
+
+    def start(self, name):
+        stack = self._local.__dict__.setdefault("stack", [])
+        record = {
+            "function": name,
+            "depth": len(stack),
+            "thread": threading.current_thread().name,
+            "started": time.time(),
+            "seconds": None,
+            "rows": 0,
+            "cache_hits": 0,
+            "child_rows": 0,
+        }
+        stack.append(record)
+        return record
+
+    def finish(self, record, seconds, rows, cache_hits):
+        stack = self._local.stack
+        stack.pop()
+        record["seconds"] = seconds
+        record["rows"] = rows or record["child_rows"]
+        del record["child_rows"]
+        record["cache_hits"] = cache_hits
+        if stack:
+            stack[-1]["child_rows"] += record["rows"]
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self):
+        """Calls, total and slowest wall time, rows and cache hits per function."""
+        with self._lock:
+            records = pd.DataFrame(self.records)
+        if records.empty:
+            return records
+        return (
+            records.groupby("function")
+            .agg(
+                calls=("seconds", "size"),
+                total_s=("seconds", "sum"),
+                max_s=("seconds", "max"),
+                rows=("rows", "sum"),
+                cache_hits=("cache_hits", "sum"),
+            )
+            .sort_values("total_s", ascending=False)
+            .reset_index()
+        )
+
+    def to_json_lines(self, **context):
+        """One JSON object per record, with ``context`` (e.g. year, race) added to each."""
+        with self._lock:
+            records = list(self.records)
+        return "".join(json.dumps({**context, **record}) + "\n" for record in records)
+
+
+def timed(get_recorder, count_hits=lambda: 0):
+    """
+    Build a decorator that records calls into the current ``PerfRecorder``.
+
+    Args:
+        get_recorder (callable): Returns the recorder of the current rerun, or
+            None to run the function untimed (e.g. on background threads).
+        count_hits (callable): Returns a running count of cache hits made by
+            the calling thread; the difference over a call is recorded.
+
+    Returns:
+        callable: The decorator.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            recorder = get_recorder()
+            if recorder is None:
+                return fn(*args, **kwargs)
+
+            record = recorder.start(fn.__name__)
+            hits = count_hits()
+            start = time.perf_counter()
+            result = None
+            try:
+                result = fn(*args, **kwargs)
+                return result
+            finally:
+                recorder.finish(
+                    record,
+                    time.perf_counter() - start,
+                    count_rows(result),
+                    count_hits() - hits,
+                )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,148 @@
+"""
+Background warm-up of the latest race weekend.
+
+Inside the dashboard, a ``PrefetchWorker`` loads the latest completed event and
+the season's first race weekend into the shared in-process caches. Run standalone, it
+fills the FastF1 disk cache and (with ``--ingest``) the columnar store, so any
+dashboard process starts warm.
+
+Usage:
+    python prefetch.py --year 2025 --interval 1800 --workers 2 --ingest
+"""
+
+import argparse
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import fastf1 as ff1
+import pandas as pd
+
+import store
+from ingest import ingest_event
+
+
+def latest_completed_event(schedule, now=None):
+    """Name of the most recent non-testing event whose race day has passed, or None."""
+    now = pd.Timestamp.now() if now is None else now
+    past = schedule[
+        (schedule["EventDate"] <= now.normalize())
+        & (schedule["EventFormat"] != "testing")
+    ]
+    if past.empty:
+        return None
+    return past.iloc[-1]["EventName"]
+
+
+def prefetch_targets(schedule, now=None):
+    """Latest completed event first, then the season's first race weekend."""
+    targets = []
+    # The dashboard preselects the first event of the season's schedule;
+    # testing has no qualifying, so the first race weekend is warmed instead
+    races = schedule[schedule["EventFormat"] != "testing"]
+    default_event = races.iloc[0]["EventName"] if not races.empty else None
+    for event_name in (latest_completed_event(schedule, now), default_event):
+        if event_name and event_name not in targets:
+            targets.append(event_name)
+    return targets
+
+
+class PrefetchWorker(threading.Thread):
+    """
+    Daemon thread that periodically warms caches for the prefetch targets.
+
+    Args:
+        year (int): Season to warm.
+        fetch_schedule (callable): Returns the event schedule of a year.
+        tasks (list): Callables run as ``task(year, event_name)`` for every target.
+        interval (float): Seconds between two warm-up rounds.
+        max_workers (int): Maximum number of tasks running at the same time.
+    """
+
+    def __init__(self, year, fetch_schedule, tasks, interval=1800, max_workers=2):
+        super().__init__(name="prefetch", daemon=True)
+        self.year = year
+        self.fetch_schedule = fetch_schedule
+        self.tasks = tasks
+        self.interval = interval
+        self.max_workers = max_workers
+        self.last_targets = []
+        self._stop_event = threading.Event()
+
+    def run_once(self):
+        """Run every task for every target once and return the targets."""
+        schedule = self.fetch_schedule(self.year)
+        targets = prefetch_targets(schedule)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(task, self.year, event_name): (task.__name__, event_name)
+                for event_name in targets
+                for task in self.tasks
+            }
+            for future in as_completed(futures):
+                task_name, event_name = futures[future]
+                try:
+                    future.result()
+                    logging.info(f"Prefetched {task_name} for {self.year} {event_name}")
+                except Exception as e:
+                    logging.warning(f"Prefetch {task_name} failed for {self.year} {event_name}: {e}")
+
+        self.last_targets = targets
+        return targets
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logging.warning(f"Prefetch round failed: {e}")
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def warm_disk_cache(year, event_name):
+    """Load the race and qualifying once so FastF1's disk cache holds them."""
+    for session_code in ("R", "Q"):
+        ff1.get_session(year, event_name, session_code).load()
+
+
+def ingest_missing(year, event_name):
+    """Ingest the race and qualifying into the columnar store unless already there."""
+    missing = [code for code in ("R", "Q") if not store.has_session(year, event_name, code)]
+    if missing:
+        ingest_event(year, event_name, missing)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, default=pd.Timestamp.now().year)
+    parser.add_argument("--interval", type=float, default=1800, help="Seconds between rounds")
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent loads")
+    parser.add_argument("--ingest", action="store_true", help="Also write the columnar store")
+    parser.add_argument("--once", action="store_true", help="Run a single round and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    # Share the FastF1 cache with the dashboard
+    if not os.path.exists("cache"):
+        os.mkdir("cache")
+    ff1.Cache.enable_cache("cache")
+
+    tasks = [ingest_missing] if args.ingest else [warm_disk_cache]
+    worker = PrefetchWorker(
+        args.year, ff1.get_event_schedule, tasks,
+        interval=args.interval, max_workers=args.workers,
+    )
+    if args.once:
+        worker.run_once()
+    else:
+        worker.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,646 @@
-import pika
-import requests
+"""
+Publish live OpenF1 car data and laps to RabbitMQ (or another transport).
+
+For every driver and endpoint the producer keeps a cursor, the last ``date``
+(car data) or ``lap_number`` (laps) it published, and only requests records
+after it. Cursors are checkpointed to disk, with the session they belong to,
+once the broker confirms the batch holding a record, so a restart resumes
+without republishing or losing data. When a new session starts the cursors
+are dropped, lap numbers and dates start over with every session.
+
+The drivers of the latest session are discovered from the API. Every
+(endpoint, driver) stream is polled at its own adaptive interval: shorter
+while new records arrive, longer while idle, and backed off on errors and rate
+limits. All requests share one token-bucket budget and run concurrently over
+one pooled HTTP session with timeouts and retries. Records are published in JSON-lines
+batches per driver and queue, bounded by record count, size and age, with
+publisher confirms, over the transport selected by ``F1_TRANSPORT`` (see
+``transport.py``). Each cycle logs its latency, publish throughput and how far
+the newest record lags the wall clock.
+
+Usage:
+    python produce.py
+"""
+
 import json
+import logging
+import os
+import statistics
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from transport import open_transport
+
+API_URL = "https://api.openf1.org/v1"
+
+# File the per-driver, per-endpoint cursors are checkpointed to
+CURSOR_PATH = os.environ.get("F1_PRODUCER_CURSORS", "producer_cursors.json")
+
+# Bounds of every stream's adaptive polling interval, in seconds
+MIN_POLL_INTERVAL_S = float(os.environ.get("F1_PRODUCER_MIN_INTERVAL", "1"))
+MAX_POLL_INTERVAL_S = float(os.environ.get("F1_PRODUCER_MAX_INTERVAL", "30"))
+
+# Global request budget: sustained requests per second and burst size
+REQUEST_RATE = float(os.environ.get("F1_PRODUCER_RATE", "3"))
+REQUEST_BURST = int(os.environ.get("F1_PRODUCER_BURST", "6"))
 
-# Setup RabbitMQ Connection
-connection = pika.BlockingConnection(pika.ConnectionParameters('localhost'))
-channel = connection.channel()
-channel.queue_declare(queue='telemetry_data')
-channel.queue_declare(queue='lap_data')
+# Seconds between refreshes of the latest session's driver list
+DRIVER_REFRESH_S = float(os.environ.get("F1_PRODUCER_DRIVER_REFRESH", "300"))
 
-def fetch_car_data(driver_number):
-    url = f'https://api.openf1.org/v1/car_data?session_key=latest&driver_number={driver_number}'
-    response = requests.get(url)
-    return response.json() if response.status_code == 200 else []
+# Requests in flight at the same time, also the size of the connection pool
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("F1_PRODUCER_CONCURRENCY", "6"))
+HTTP_TIMEOUT_S = float(os.environ.get("F1_PRODUCER_TIMEOUT", "10"))
+HTTP_RETRIES = int(os.environ.get("F1_PRODUCER_RETRIES", "3"))
 
-def fetch_lap_data(driver_number):
-    url = f'https://api.openf1.org/v1/laps?session_key=latest&driver_number={driver_number}'
-    response = requests.get(url)
-    return response.json() if response.status_code == 200 else []
+# A batch is published once it holds this many records or bytes, or is this old
+BATCH_MAX_RECORDS = int(os.environ.get("F1_PRODUCER_BATCH_RECORDS", "500"))
+BATCH_MAX_BYTES = int(os.environ.get("F1_PRODUCER_BATCH_BYTES", str(256 * 1024)))
+BATCH_MAX_DELAY_S = float(os.environ.get("F1_PRODUCER_BATCH_DELAY", "1"))
 
-# Define multiple drivers for live comparison
+
+def parse_time(value):
+    """An OpenF1 ISO 8601 timestamp as an aware datetime; naive ones are UTC."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+# OpenF1 endpoint -> (queue, field the cursor tracks, key ordering that field,
+# field holding the record's wall-clock time)
+ENDPOINTS = {
+    "car_data": ("telemetry_data", "date", parse_time, "date"),
+    "laps": ("lap_data", "lap_number", int, "date_start"),
+}
+
+# Endpoints whose latest record is completed after it first appears (a lap is
+# published before its duration is known): the record at the cursor is
+# requested again and republished when it has changed
+REFETCH_LAST = {"laps"}
+
+# Drivers polled until the latest session's drivers have been discovered
 drivers = [44, 1, 16]  # Example: Hamilton, Verstappen, Leclerc
 
-while True:
-    for driver_number in drivers:
-        telemetry_data = fetch_car_data(driver_number)
-        lap_data = fetch_lap_data(driver_number)
 
-        if telemetry_data:
-            for entry in telemetry_data:
-                entry["driver_number"] = driver_number
-                message = json.dumps(entry)
-                channel.basic_publish(exchange='', routing_key='telemetry_data', body=message)
+def load_cursors(path=CURSOR_PATH):
+    """
+    Cursors saved by a previous run, as {endpoint: {driver_number: value}},
+    with the "session_key" they belong to (None if unknown).
+    """
+    cursors = {"session_key": None, **{endpoint: {} for endpoint in ENDPOINTS}}
+    if os.path.exists(path):
+        with open(path) as f:
+            saved = json.load(f)
+        cursors["session_key"] = saved.get("session_key")
+        for endpoint in ENDPOINTS:
+            cursors[endpoint].update(saved.get(endpoint, {}))
+    return cursors
+
+
+def reset_cursors(cursors, session_key):
+    """Start the cursors over for another session, in place."""
+    cursors["session_key"] = session_key
+    for endpoint in ENDPOINTS:
+        cursors[endpoint].clear()
+
+
+def save_cursors(cursors, path=CURSOR_PATH):
+    """Write the cursors atomically, a crash never leaves a half-written file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cursors, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def create_http_session(pool_size=MAX_CONCURRENT_REQUESTS, retries=HTTP_RETRIES):
+    """
+    HTTP session sharing keep-alive connections between all fetches.
+
+    Connection errors and 5xx responses are retried with exponential backoff.
+    429 responses are returned, the scheduler backs off from them.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    http = requests.Session()
+    http.mount("https://", adapter)
+    http.mount("http://", adapter)
+    return http
+
+
+class RequestBudget:
+    """
+    Token bucket shared by all requests: ``rate`` requests per second on
+    average, at most ``burst`` at once. A ``rate`` of 0 disables the budget.
+    """
+
+    def __init__(self, rate=REQUEST_RATE, burst=REQUEST_BURST):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def hold(self, seconds):
+        """Send no request for ``seconds``, e.g. after a 429."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+class AdaptivePoller:
+    """
+    Next poll time of every (endpoint, driver) stream.
+
+    A stream's interval halves when a poll returns new records, grows by half
+    when it returns none and doubles on errors (at least to the server's
+    ``Retry-After`` on 429), always within ``[min_interval, max_interval]``.
+    """
+
+    def __init__(self, min_interval=MIN_POLL_INTERVAL_S, max_interval=MAX_POLL_INTERVAL_S):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.intervals = {}
+        self._next = {}
+
+    def sync(self, streams):
+        """Track exactly ``streams``; new ones are due right away."""
+        streams = set(streams)
+        now = time.monotonic()
+        for stream in streams - set(self._next):
+            self.intervals[stream] = self.min_interval
+            self._next[stream] = now
+        for stream in set(self._next) - streams:
+            del self.intervals[stream], self._next[stream]
+
+    def due(self):
+        """Streams whose poll time has come, most overdue first."""
+        now = time.monotonic()
+        return sorted((s for s, t in self._next.items() if t <= now), key=self._next.get)
+
+    def wait_time(self):
+        """Seconds until the next stream is due."""
+        return max(0.0, min(self._next.values(), default=time.monotonic()) - time.monotonic())
+
+    def interval_range(self, endpoint):
+        """Shortest and longest interval among an endpoint's streams."""
+        intervals = [i for (e, _), i in self.intervals.items() if e == endpoint] or [0.0]
+        return min(intervals), max(intervals)
+
+    def record(self, stream, outcome, retry_after=None):
+        """
+        Schedule a stream's next poll from the outcome of its last one.
+
+        Args:
+            stream (tuple): ``(endpoint, driver_number)``.
+            outcome (str): "new", "idle", "error" or "rate_limited".
+            retry_after (float): Seconds the server asked to wait, if any.
+        """
+        if stream not in self.intervals:
+            return
+        interval = self.intervals[stream]
+        if outcome == "new":
+            interval *= 0.5
+        elif outcome == "idle":
+            interval *= 1.5
+        else:
+            interval *= 2
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        self.intervals[stream] = interval
+        self._next[stream] = time.monotonic() + max(interval, retry_after or 0.0)
+
+
+def retry_after_seconds(response):
+    """Seconds from a response's ``Retry-After`` header, None if absent or a date."""
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def fetch_page(endpoint, driver_number, after=None, http=requests, session_key="latest"):
+    """
+    Records of a driver from an OpenF1 endpoint, only those after the cursor if
+    given (and the one at the cursor for ``REFETCH_LAST`` endpoints).
+
+    Returns:
+        tuple: ``(entries, status, retry_after)``; ``status`` is the HTTP
+        status code, or None when the request failed.
+    """
+    _, field, _, _ = ENDPOINTS[endpoint]
+    url = f"{API_URL}/{endpoint}?session_key={session_key}&driver_number={driver_number}"
+    if after is not None:
+        operator = ">=" if endpoint in REFETCH_LAST else ">"
+        url += f"&{field}{operator}{quote(str(after))}"
+    try:
+        response = http.get(url, timeout=HTTP_TIMEOUT_S)
+        if response.status_code != 200:
+            return [], response.status_code, retry_after_seconds(response)
+        return response.json(), 200, None
+    except (requests.RequestException, ValueError) as e:
+        # ValueError: a truncated or non-JSON body
+        logging.warning(f"Fetching {endpoint} of driver {driver_number} failed: {e}")
+        return [], None, None
+
+
+def fetch(endpoint, driver_number, after=None, http=requests):
+    """Records of a driver from an OpenF1 endpoint, only those after the cursor if given."""
+    return fetch_page(endpoint, driver_number, after, http)[0]
+
+
+def fetch_car_data(driver_number, after=None, http=requests):
+    return fetch("car_data", driver_number, after, http)
+
+
+def fetch_lap_data(driver_number, after=None, http=requests):
+    return fetch("laps", driver_number, after, http)
+
+
+def fetch_session_key(http=requests, budget=None):
+    """Key of the latest session, or None when it cannot be fetched."""
+    if budget is not None:
+        budget.acquire()
+    try:
+        response = http.get(f"{API_URL}/sessions?session_key=latest", timeout=HTTP_TIMEOUT_S)
+        response.raise_for_status()
+        return response.json()[0]["session_key"]
+    except (requests.RequestException, ValueError, KeyError, IndexError, TypeError) as e:
+        logging.warning(f"Fetching the latest session failed: {e}")
+        return None
+
+
+def discover_drivers(http=requests, budget=None, session_key="latest"):
+    """Driver numbers of a session, or None when they cannot be fetched."""
+    if budget is not None:
+        budget.acquire()
+    try:
+        response = http.get(
+            f"{API_URL}/drivers?session_key={session_key}", timeout=HTTP_TIMEOUT_S
+        )
+        response.raise_for_status()
+        numbers = {entry["driver_number"] for entry in response.json()}
+    except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+        logging.warning(f"Discovering the drivers of the latest session failed: {e}")
+        return None
+    return sorted(numbers) or None
+
+
+def fetch_all(pool, http, cursors, streams, budget=None):
+    """
+    Fetch the given (endpoint, driver) streams concurrently within the budget,
+    from the session of the cursors (the latest one if it is not known yet).
+
+    Yields:
+        tuple: ``(endpoint, driver_number, entries, status, retry_after, seconds)``
+        as requests finish; ``seconds`` excludes the wait for the budget.
+    """
+
+    def timed_fetch(endpoint, driver_number, after):
+        if budget is not None:
+            budget.acquire()
+        start = time.perf_counter()
+        page = fetch_page(
+            endpoint, driver_number, after, http, cursors["session_key"] or "latest"
+        )
+        return page, time.perf_counter() - start
+
+    # Cursors are read here, the caller advances them while results arrive
+    futures = {
+        pool.submit(
+            timed_fetch, endpoint, driver_number, cursors[endpoint].get(str(driver_number))
+        ): (endpoint, driver_number)
+        for endpoint, driver_number in streams
+    }
+    for future in as_completed(futures):
+        endpoint, driver_number = futures[future]
+        (entries, status, retry_after), seconds = future.result()
+        yield endpoint, driver_number, entries, status, retry_after, seconds
+
+
+def new_entries(endpoint, entries, cursor, published=None):
+    """
+    Entries past the cursor, in cursor order, and how many were duplicates.
+
+    The API filter already excludes older records; this guards against
+    overlapping responses and entries without the cursor field. For
+    ``REFETCH_LAST`` endpoints the entry at the cursor is kept too when it
+    differs from ``published``, the version published last (unknown after a
+    restart, so it is published again then); an unchanged one is requested
+    on purpose and not counted as a duplicate.
+    """
+    _, field, key, _ = ENDPOINTS[endpoint]
+    entries = [entry for entry in entries if entry.get(field) is not None]
+    if cursor is not None:
+        fresh = [
+            entry
+            for entry in entries
+            if key(entry[field]) > key(cursor)
+            or (
+                endpoint in REFETCH_LAST
+                and key(entry[field]) == key(cursor)
+                and entry != published
+            )
+        ]
+    else:
+        fresh = entries
+    refetched = 0
+    if cursor is not None and endpoint in REFETCH_LAST:
+        refetched = sum(
+            1 for entry in entries if key(entry[field]) == key(cursor) and entry == published
+        )
+    duplicates = len(entries) - len(fresh) - refetched
+    return sorted(fresh, key=lambda entry: key(entry[field])), duplicates
+
+
+class BatchPublisher:
+    """
+    Packs records into JSON-lines messages per (queue, driver) and publishes
+    them over a transport, which confirms every message.
+
+    A batch is sent once it reaches ``max_records`` records or ``max_bytes``
+    bytes, or, on :meth:`flush_due`, once its first record is ``max_delay_s``
+    old. Each message carries ``records`` and ``published_at`` (epoch
+    seconds) headers. After the broker confirms a batch, ``on_confirm`` is
+    called with the marker of its last record.
+
+    Args:
+        transport: Transport from :func:`transport.open_transport`.
+        max_records (int): Records per batch.
+        max_bytes (int): Body size per batch.
+        max_delay_s (float): Age at which :meth:`flush_due` sends a batch.
+        on_confirm (callable): Called as ``on_confirm(marker)`` per confirmed batch.
+    """
+
+    def __init__(self, transport, max_records=BATCH_MAX_RECORDS, max_bytes=BATCH_MAX_BYTES,
+                 max_delay_s=BATCH_MAX_DELAY_S, on_confirm=None):
+        self.transport = transport
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_delay_s = max_delay_s
+        self.on_confirm = on_confirm
+        self._batches = {}  # (queue, driver_number) -> open batch
+        self.totals = {"records": 0, "batches": 0, "bytes": 0}
+        self._window = (time.perf_counter(), dict(self.totals))
+
+    def add(self, queue, driver_number, entry, marker=None):
+        line = json.dumps(entry).encode()
+        batch = self._batches.setdefault(
+            (queue, driver_number),
+            {"lines": [], "bytes": 0, "started": time.monotonic(), "marker": None},
+        )
+        batch["lines"].append(line)
+        batch["bytes"] += len(line) + 1
+        batch["marker"] = marker
+        if len(batch["lines"]) >= self.max_records or batch["bytes"] >= self.max_bytes:
+            self._publish((queue, driver_number))
+
+    def flush_due(self):
+        """Publish the batches older than ``max_delay_s``."""
+        now = time.monotonic()
+        for key in [k for k, b in self._batches.items() if now - b["started"] >= self.max_delay_s]:
+            self._publish(key)
+
+    def flush(self):
+        """Publish every open batch."""
+        for key in list(self._batches):
+            self._publish(key)
+
+    def _publish(self, key):
+        queue, _ = key
+        batch = self._batches.pop(key)
+        body = b"\n".join(batch["lines"])
+        # Blocks until the transport accepts the batch, raises if it does not
+        self.transport.publish(
+            queue, body, headers={"records": len(batch["lines"]), "published_at": time.time()}
+        )
+        self.totals["records"] += len(batch["lines"])
+        self.totals["batches"] += 1
+        self.totals["bytes"] += len(body)
+        if self.on_confirm is not None and batch["marker"] is not None:
+            self.on_confirm(batch["marker"])
+
+    def throughput(self):
+        """Records, batches and bytes published since the previous call, with rates per second."""
+        now = time.perf_counter()
+        since, before = self._window
+        self._window = (now, dict(self.totals))
+        elapsed = max(now - since, 1e-9)
+        delta = {name: self.totals[name] - before[name] for name in self.totals}
+        return dict(
+            delta,
+            records_per_s=delta["records"] / elapsed,
+            bytes_per_s=delta["bytes"] / elapsed,
+        )
+
+
+def publish_new(publisher, endpoint, driver_number, entries, cursors, stats, last_published=None):
+    """
+    Queue the entries past the driver's cursor for publishing and advance it.
+
+    ``cursors`` is advanced right away so the next fetch does not ask for
+    records waiting in a batch; the checkpoint on disk follows confirms.
+    ``last_published`` maps (endpoint, driver_number) to the last entry
+    queued, so changes to it can be detected for ``REFETCH_LAST`` endpoints.
+
+    Returns:
+        list: The entries queued.
+    """
+    queue, field, _, _ = ENDPOINTS[endpoint]
+    driver_cursors = cursors[endpoint]
+    if last_published is None:
+        last_published = {}
+    for entry in entries:
+        entry["driver_number"] = driver_number
+    fresh, duplicates = new_entries(
+        endpoint,
+        entries,
+        driver_cursors.get(str(driver_number)),
+        last_published.get((endpoint, driver_number)),
+    )
+    stats["duplicates"] += duplicates
+
+    for entry in fresh:
+        publisher.add(
+            queue,
+            driver_number,
+            entry,
+            marker=(cursors["session_key"], endpoint, driver_number, entry[field]),
+        )
+    stats["published"] += len(fresh)
+
+    if fresh:
+        driver_cursors[str(driver_number)] = fresh[-1][field]
+        last_published[(endpoint, driver_number)] = fresh[-1]
+    return fresh
+
+
+def newest_time(endpoint, entries):
+    """Latest wall-clock time among the entries, None if none carries one."""
+    _, _, _, time_field = ENDPOINTS[endpoint]
+    times = []
+    for entry in entries:
+        try:
+            times.append(parse_time(entry[time_field]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return max(times, default=None)
+
+
+def outcome_of(status, fresh):
+    """Outcome of a poll for :meth:`AdaptivePoller.record`."""
+    if status == 429:
+        return "rate_limited"
+    # OpenF1 answers 404 when a filter matches no records
+    if status not in (200, 404):
+        return "error"
+    return "new" if fresh else "idle"
+
+
+def checkpoint(confirmed):
+    """``on_confirm`` callback saving the cursor of the last confirmed record."""
+
+    def on_confirm(marker):
+        session_key, endpoint, driver_number, value = marker
+        # Batches of a finished session may be confirmed after the switch
+        if session_key != confirmed["session_key"]:
+            return
+        confirmed[endpoint][str(driver_number)] = value
+        save_cursors(confirmed)
+
+    return on_confirm
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    transport = open_transport()
+    for queue, _, _, _ in ENDPOINTS.values():
+        transport.declare(queue)
+    logging.info(f"Publishing to {transport.name}")
+
+    # Cursors of fetched records, and of records the broker has confirmed
+    cursors = load_cursors()
+    confirmed = load_cursors()
+    publisher = BatchPublisher(transport, on_confirm=checkpoint(confirmed))
+    http = create_http_session()
+    budget = RequestBudget()
+    poller = AdaptivePoller()
+    pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+    session_drivers = drivers
+    drivers_checked = None
+    newest = {}  # endpoint -> latest record time published
+    last_published = {}  # (endpoint, driver_number) -> last entry queued
+    try:
+        while True:
+            if drivers_checked is None or time.monotonic() - drivers_checked >= DRIVER_REFRESH_S:
+                session_key = fetch_session_key(http, budget)
+                if session_key is not None and session_key != cursors["session_key"]:
+                    logging.info(
+                        f"Session {session_key} replaces session {cursors['session_key']}, "
+                        "starting its cursors over"
+                    )
+                    publisher.flush()
+                    reset_cursors(cursors, session_key)
+                    reset_cursors(confirmed, session_key)
+                    save_cursors(confirmed)
+                    newest.clear()
+                    last_published.clear()
+                session_drivers = (
+                    discover_drivers(http, budget, cursors["session_key"] or "latest")
+                    or session_drivers
+                )
+                drivers_checked = time.monotonic()
+                poller.sync(
+                    (endpoint, driver_number)
+                    for driver_number in session_drivers
+                    for endpoint in ENDPOINTS
+                )
+
+            time.sleep(min(poller.wait_time(), DRIVER_REFRESH_S))
+            due = poller.due()
+            if not due:
+                continue
+            cycle_start = time.perf_counter()
+            stats = {"published": 0, "duplicates": 0}
+            latencies = []
+            # Publishing stays on this thread, pika channels are not thread-safe
+            for endpoint, driver_number, entries, status, retry_after, seconds in fetch_all(
+                pool, http, cursors, due, budget
+            ):
+                latencies.append(seconds)
+                fresh = publish_new(
+                    publisher, endpoint, driver_number, entries, cursors, stats, last_published
+                )
+                outcome = outcome_of(status, fresh)
+                if outcome == "rate_limited":
+                    budget.hold(retry_after or poller.min_interval)
+                poller.record((endpoint, driver_number), outcome, retry_after)
+                latest = newest_time(endpoint, fresh)
+                if latest is not None and (endpoint not in newest or latest > newest[endpoint]):
+                    newest[endpoint] = latest
+                publisher.flush_due()
+            # Nothing waits for the next cycle
+            publisher.flush()
 
-        if lap_data:
-            for entry in lap_data:
-                entry["driver_number"] = driver_number
-                message = json.dumps(entry)
-                channel.basic_publish(exchange='', routing_key='lap_data', body=message)
+            cycle_s = time.perf_counter() - cycle_start
+            throughput = publisher.throughput()
+            now = datetime.now(timezone.utc)
+            lag = ", ".join(
+                f"{endpoint} {(now - latest).total_seconds():.1f}s"
+                for endpoint, latest in newest.items()
+            )
+            intervals = ", ".join(
+                "{} {:.1f}-{:.1f}s".format(endpoint, *poller.interval_range(endpoint))
+                for endpoint in ENDPOINTS
+            )
+            logging.info(
+                f"Cycle took {cycle_s:.2f}s ({len(latencies)} requests for "
+                f"{len(session_drivers)} drivers, median {statistics.median(latencies):.2f}s, "
+                f"max {max(latencies):.2f}s): "
+                f"published {stats['published']} new records in {throughput['batches']} batches "
+                f"({throughput['records_per_s']:.0f} msg/s, "
+                f"{throughput['bytes_per_s'] / 1024:.1f} KiB/s), "
+                f"skipped {stats['duplicates']} duplicates; lag {lag or 'n/a'}; "
+                f"intervals {intervals}"
+            )
+    finally:
+        pool.shutdown()
+        transport.close()
 
-    time.sleep(5)  # Fetch updates every 2 seconds
 
-connection.close()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Fixed-memory NumPy ring buffer for live per-driver car data."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Car data channel -> dtype; gear and DRS are small integer codes (-1 when missing)
+CHANNELS = {
+    "speed": np.float32,
+    "throttle": np.float32,
+    "brake": np.float32,
+    "rpm": np.float32,
+    "n_gear": np.int8,
+    "drs": np.int8,
+}
+
+# Every sample also records its own time and its publish time, epoch seconds
+TIME_COLUMNS = ("time", "published_at")
+
+
+class TelemetryRing:
+    """
+    Preallocated ring buffer of one driver's car data, one array per channel.
+
+    Every sample is written twice, at ``i`` and ``i + capacity`` of arrays
+    twice the capacity long, so the latest ``capacity`` samples are always
+    one contiguous slice: reads return NumPy views without copying, and
+    appends are O(1). Memory is allocated once and never grows.
+
+    A view of ``n`` samples stays valid for ``capacity - n`` further appends
+    (a view of a full buffer for none); copy it to keep it longer.
+
+    Args:
+        capacity (int): Samples kept.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0  # samples appended in total
+        self.columns = {name: np.full(2 * capacity, np.nan) for name in TIME_COLUMNS}
+        for channel, dtype in CHANNELS.items():
+            self.columns[channel] = np.zeros(2 * capacity, dtype=dtype)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the buffer, fixed at construction."""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, time, published_at=None, **values):
+        """
+        Add one sample, overwriting the oldest once the buffer is full.
+
+        Args:
+            time (float): Sample time in epoch seconds.
+            published_at (float): Publish time in epoch seconds, if known.
+            **values: Channel values; missing channels are stored as NaN, or
+                -1 for integer channels.
+        """
+        i = self.count % self.capacity
+        sample = dict(values, time=time, published_at=published_at)
+        for name, column in self.columns.items():
+            value = sample.get(name)
+            if value is None:
+                value = np.nan if column.dtype.kind == "f" else -1
+            column[i] = column[i + self.capacity] = value
+        self.count += 1
+
+    def append_record(self, record):
+        """Add an OpenF1 car data record as decoded by the live consumer."""
+        date = datetime.fromisoformat(record["date"])
+        if date.tzinfo is None:
+            # OpenF1 dates are UTC; a naive one must not take the local zone
+            date = date.replace(tzinfo=timezone.utc)
+        self.append(
+            date.timestamp(),
+            record.get("_published_at"),
+            **{channel: record.get(channel) for channel in CHANNELS},
+        )
+
+    def latest(self, n=None):
+        """
+        Zero-copy views of the latest ``n`` samples (all kept ones by default),
+        oldest first.
+
+        Returns:
+            dict: Column name -> read-only array.
+        """
+        n = len(self) if n is None else min(n, len(self))
+        end = self.count % self.capacity + self.capacity
+        views = {}
+        for name, column in self.columns.items():
+            view = column[end - n:end]
+            view.flags.writeable = False
+            views[name] = view
+        return views
+
+    def since(self, seen):
+        """
+        Views of the samples appended after the first ``seen``, and the total.
+
+        Samples already overwritten are skipped. Pass the returned total as
+        ``seen`` to read only new samples next time.
+        """
+        return self.latest(self.count - seen), self.count
+
+    def window(self, start, end=None):
+        """
+        Views of the kept samples with ``start <= time < end`` (epoch seconds).
+
+        Samples are expected to arrive in time order.
+        """
+        views = self.latest()
+        first, last = np.searchsorted(
+            views["time"], [start, np.inf if end is None else end], side="left"
+        )
+        return {name: view[first:last] for name, view in views.items()}
+
+    def snapshot(self, path):
+        """Save the kept samples, oldest first, as an ``.npz`` file."""
+        np.savez(path, capacity=self.capacity, count=self.count, **self.latest())
+
+    @classmethod
+    def load(cls, path):
+        """Rebuild a buffer from a :meth:`snapshot` file."""
+        with np.load(path) as data:
+            ring = cls(int(data["capacity"]))
+            n = len(data["time"])
+            for name, column in ring.columns.items():
+                column[:n] = column[ring.capacity:ring.capacity + n] = data[name]
+            ring.count = n
+        return ring
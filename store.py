@@ -0,0 +1,273 @@
+"""
+Columnar on-disk store of FastF1 sessions.
+
+Sessions are written once by ``ingest.py`` as uncompressed Arrow IPC files and
+read back through memory maps, so a reader only pages in the columns (and, for
+telemetry, the laps) it actually selects.
+
+Layout::
+
+    <root>/<year>/<event_slug>/<session_code>/
+        meta.json               event, session info and telemetry lap index
+        laps.arrow              session.laps
+        results.arrow           session.results
+        weather.arrow           session.weather_data
+        track_status.arrow      session.track_status
+        session_status.arrow    session.session_status
+        messages.arrow          session.race_control_messages
+        telemetry/<driver>.arrow  lap.get_telemetry(), one record batch per lap
+"""
+
+import datetime
+import json
+import logging
+import os
+import re
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+from fastf1.core import Laps, Session, SessionResults
+from fastf1.events import Event
+
+STORE_DIR = os.environ.get("F1_STORE_DIR", "store")
+
+# Session attribute holding each stored table
+SESSION_TABLES = {
+    "laps": "_laps",
+    "results": "_results",
+    "weather": "_weather_data",
+    "track_status": "_track_status",
+    "session_status": "_session_status",
+    "messages": "_race_control_messages",
+}
+
+
+class StoreSession(Session):
+    """A FastF1 ``Session`` rebuilt from the columnar store instead of the API."""
+
+    def __init__(self, event, session_name, path, meta):
+        super().__init__(event, session_name, f1_api_support=meta["f1_api_support"])
+        self.store_path = path
+        self.telemetry_index = meta["telemetry"]
+
+
+def event_slug(event_name):
+    return re.sub(r"[^a-z0-9]+", "_", event_name.lower()).strip("_")
+
+
+def session_path(year, event_name, session_code, root=STORE_DIR):
+    return os.path.join(root, str(year), event_slug(event_name), session_code)
+
+
+def has_session(year, event_name, session_code, root=STORE_DIR):
+    path = session_path(year, event_name, session_code, root)
+    return os.path.exists(os.path.join(path, "meta.json"))
+
+
+def _to_json_value(value):
+    """Make event/session metadata JSON serializable, tagging timestamps and timedeltas."""
+    if isinstance(value, dict):
+        return {key: _to_json_value(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(v) for v in value]
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    if isinstance(value, datetime.datetime):
+        return {"__timestamp__": pd.Timestamp(value).isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {"__timedelta__": pd.Timedelta(value).value}
+    if hasattr(value, "item"):  # NumPy scalars
+        return value.item()
+    return value
+
+
+def _from_json_value(value):
+    if isinstance(value, dict):
+        if "__timestamp__" in value:
+            return pd.Timestamp(value["__timestamp__"])
+        if "__timedelta__" in value:
+            return pd.Timedelta(value["__timedelta__"])
+        return {key: _from_json_value(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_from_json_value(v) for v in value]
+    return value
+
+
+def _to_table(df):
+    """Convert a DataFrame to Arrow, falling back to strings for mixed object columns."""
+    df = pd.DataFrame(df).reset_index(drop=True)
+    for column in df.columns[df.dtypes == object]:
+        try:
+            pa.array(df[column], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df[column] = df[column].astype("string")
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _write_table(table, path):
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def write_session(session, session_code, root=STORE_DIR, telemetry=True):
+    """
+    Write a loaded FastF1 session to the store, replacing any previous copy.
+
+    Args:
+        session: FastF1 session loaded with ``session.load()``.
+        session_code (str): Session identifier used in the store, e.g. "R" or "Q".
+        root (str): Store root directory.
+        telemetry (bool): Also write per-lap telemetry (slow, one
+            ``get_telemetry()`` per lap).
+
+    Returns:
+        str: Path of the written session directory.
+    """
+    year = session.event.year
+    event_name = session.event["EventName"]
+    path = session_path(year, event_name, session_code, root)
+    tmp_path = path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(os.path.join(tmp_path, "telemetry"))
+
+    for name, attribute in SESSION_TABLES.items():
+        if hasattr(session, attribute):
+            _write_table(_to_table(getattr(session, attribute)),
+                         os.path.join(tmp_path, f"{name}.arrow"))
+
+    telemetry_index = {}
+    if telemetry and hasattr(session, "_car_data"):
+        for driver in session.drivers:
+            telemetry_index[driver] = _write_driver_telemetry(
+                session, driver, os.path.join(tmp_path, "telemetry", f"{driver}.arrow")
+            )
+
+    meta = {
+        "year": year,
+        "event": _to_json_value(dict(session.event)),
+        "session_name": session.name,
+        "f1_api_support": session.f1_api_support,
+        "session_info": _to_json_value(getattr(session, "_session_info", None)),
+        "total_laps": _to_json_value(getattr(session, "_total_laps", None)),
+        "t0_date": _to_json_value(getattr(session, "_t0_date", None)),
+        "session_start_time": _to_json_value(getattr(session, "_session_start_time", None)),
+        "telemetry": telemetry_index,
+    }
+    with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+        json.dump(meta, f)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _write_driver_telemetry(session, driver, path):
+    """Write one record batch per lap and return the lap number -> batch index map."""
+    lap_numbers, frames = [], []
+    for _, lap in session.laps.pick_drivers(driver).iterlaps():
+        try:
+            frames.append(pd.DataFrame(lap.get_telemetry()))
+            lap_numbers.append(int(lap["LapNumber"]))
+        except Exception as e:
+            logging.warning(f"Skipping telemetry of driver {driver} lap {lap['LapNumber']}: {e}")
+
+    if not frames:
+        return {}
+
+    # Converting all laps at once gives every batch the same schema
+    table = _to_table(pd.concat(frames, ignore_index=True)).combine_chunks()
+    if table.num_rows == 0:
+        return {}
+    batch = table.to_batches()[0]
+    index, offset = {}, 0
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            for i, (lap_number, frame) in enumerate(zip(lap_numbers, frames)):
+                writer.write_batch(batch.slice(offset, len(frame)))
+                index[str(lap_number)] = i
+                offset += len(frame)
+    return index
+
+
+def read_table(path, columns=None):
+    """
+    Read an Arrow file through a memory map, keeping only ``columns``.
+
+    Columns that are not selected are never paged in from disk.
+    """
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select([c for c in columns if c in table.column_names])
+    return table.to_pandas()
+
+
+def read_session_table(year, event_name, session_code, name, columns=None, root=STORE_DIR):
+    path = os.path.join(session_path(year, event_name, session_code, root), f"{name}.arrow")
+    return read_table(path, columns=columns)
+
+
+def open_session(year, event_name, session_code, root=STORE_DIR):
+    """
+    Rebuild a FastF1 session from the store.
+
+    Laps, results and the other session tables are attached so the usual
+    ``session.laps`` / ``session.results`` API works; telemetry stays on disk
+    and is read per lap with :func:`read_lap_telemetry`.
+
+    Returns:
+        StoreSession: The stored session.
+    """
+    path = session_path(year, event_name, session_code, root)
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+
+    event = Event(_from_json_value(meta["event"]), year=meta["year"])
+    session = StoreSession(event, meta["session_name"], path, meta)
+    session._session_info = _from_json_value(meta["session_info"])
+    session._total_laps = _from_json_value(meta["total_laps"])
+    session._t0_date = _from_json_value(meta["t0_date"])
+    session._session_start_time = _from_json_value(meta["session_start_time"])
+
+    for name, attribute in SESSION_TABLES.items():
+        table_path = os.path.join(path, f"{name}.arrow")
+        if not os.path.exists(table_path):
+            continue
+        df = read_table(table_path)
+        if name == "laps":
+            df = Laps(df, session=session, _force_default_cols=True)
+        elif name == "results":
+            df = SessionResults(df, _force_default_cols=True)
+            df.index = df["DriverNumber"].values
+        setattr(session, attribute, df)
+
+    return session
+
+
+def read_lap_telemetry(session, driver, lap_number, columns=None):
+    """
+    Read the stored telemetry of a single lap.
+
+    Only the record batch of that lap and the selected columns are paged in.
+
+    Args:
+        session (StoreSession): Session opened with :func:`open_session`.
+        driver (str): Driver number.
+        lap_number (int): Lap number.
+        columns (list): Telemetry channels to read; all when ``None``.
+
+    Returns:
+        pandas.DataFrame: Telemetry of the lap (empty if it was not stored).
+    """
+    batch_index = session.telemetry_index.get(str(driver), {}).get(str(int(lap_number)))
+    if batch_index is None:
+        return pd.DataFrame(columns=columns)
+
+    path = os.path.join(session.store_path, "telemetry", f"{driver}.arrow")
+    with pa.memory_map(path, "r") as source:
+        batch = pa.ipc.open_file(source).get_batch(batch_index)
+    if columns is not None:
+        batch = batch.select([c for c in columns if c in batch.schema.names])
+    return batch.to_pandas()
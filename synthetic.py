@@ -0,0 +1,360 @@
+"""
+Synthetic FastF1-shaped sessions for offline stress and scaling tests.
+
+``generate_session`` builds a real ``fastf1.core.Session`` whose laps, results,
+weather, car and position data are simulated, so every dashboard function
+(including ``Lap.get_telemetry()``) runs against it without network access.
+
+Usage:
+    python synthetic.py --drivers 40 --laps 120 --hz 10 --store store
+    python benchmark.py --synthetic --drivers 20 40 --laps 57 120
+"""
+
+import argparse
+import logging
+
+import numpy as np
+import pandas as pd
+from fastf1.core import Laps, Session, SessionResults, Telemetry
+from fastf1.events import Event
+
+import store
+
+TEAMS = [
+    ("Red Bull Racing", "3671C6"), ("Ferrari", "E8002D"), ("Mercedes", "27F4D2"),
+    ("McLaren", "FF8000"), ("Aston Martin", "229971"), ("Alpine", "0093CC"),
+    ("Williams", "64C4FF"), ("RB", "6692FF"), ("Kick Sauber", "52E252"),
+    ("Haas F1 Team", "B6BABD"),
+]
+
+COMPOUNDS = ["SOFT", "MEDIUM", "HARD"]
+
+# Track shape resolution used to build the racing line and speed profile
+TRACK_POINTS = 2000
+
+
+def _make_track(rng, length_m):
+    """Closed racing line with a grip-, acceleration- and braking-limited speed profile."""
+    theta = np.linspace(0, 2 * np.pi, TRACK_POINTS, endpoint=False)
+    harmonics = np.arange(2, 13)
+    amplitude = 0.25 / harmonics ** 0.8 * rng.uniform(0.5, 1.0, len(harmonics))
+    phase = rng.uniform(0, 2 * np.pi, len(harmonics))
+    radius = 1 + (amplitude[:, None] * np.sin(harmonics[:, None] * theta + phase[:, None])).sum(axis=0)
+    x, y = radius * np.cos(theta), radius * np.sin(theta)
+
+    segment = np.hypot(np.diff(x, append=x[0]), np.diff(y, append=y[0]))
+    scale = length_m / segment.sum()
+    x, y, segment = x * scale, y * scale, segment * scale
+    distance = np.concatenate([[0.0], np.cumsum(segment)[:-1]])
+
+    # Cornering speed from the curvature of the line (~1.6 g of lateral grip)
+    heading = np.unwrap(np.arctan2(np.gradient(y), np.gradient(x)))
+    curvature = np.abs(np.gradient(heading)) / np.gradient(distance)
+    curvature = np.convolve(np.r_[curvature[-12:], curvature, curvature[:12]],
+                            np.ones(25) / 25, mode="valid")[:TRACK_POINTS]
+    speed = np.minimum(np.sqrt(16 / np.maximum(curvature, 1e-6)), 330 / 3.6)
+
+    # Limit acceleration and braking; two laps around make the profile periodic
+    for _ in range(2):
+        for i in range(1, 2 * TRACK_POINTS):
+            j, prev = i % TRACK_POINTS, (i - 1) % TRACK_POINTS
+            speed[j] = min(speed[j], np.sqrt(speed[prev] ** 2 + 2 * 7.0 * segment[prev]))
+        for i in range(2 * TRACK_POINTS, 0, -1):
+            j, nxt = (i - 1) % TRACK_POINTS, i % TRACK_POINTS
+            speed[j] = min(speed[j], np.sqrt(speed[nxt] ** 2 + 2 * 30.0 * segment[j]))
+
+    dt = segment / speed
+    dv = np.roll(speed, -1) - speed
+    at_limit = speed >= 330 / 3.6 - 0.1
+    throttle = np.where((dv > 0) | at_limit, 100.0, np.where(dv < -0.05, 0.0, 35 + 50 * speed / speed.max()))
+    # DRS zones on the fastest parts of the line, whatever this layout's top speed
+    drs = (speed >= 0.9 * speed.max()).astype(float)
+
+    # Time needed to reach every point of the line, normalized to one lap
+    tau = np.concatenate([[0.0], np.cumsum(dt)[:-1]]) / dt.sum()
+    return {
+        "distance": distance, "x": x, "y": y, "speed": speed * 3.6,
+        "throttle": throttle, "brake": (dv < -0.05).astype(float), "drs": drs,
+        "tau": tau, "lap_time": dt.sum(), "length": length_m,
+    }
+
+
+def _make_event(year, event_name, session_name, date):
+    return Event({
+        "RoundNumber": 1,
+        "Country": "Syntheticland",
+        "Location": "Synthetic Park",
+        "OfficialEventName": f"FORMULA 1 {event_name.upper()} {year}",
+        "EventDate": date.normalize(),
+        "EventName": event_name,
+        "EventFormat": "conventional",
+        "Session1": session_name,
+        "Session1Date": date.tz_localize("UTC"),
+        "Session1DateUtc": date,
+        "Session2": "None", "Session2Date": pd.NaT, "Session2DateUtc": pd.NaT,
+        "Session3": "None", "Session3Date": pd.NaT, "Session3DateUtc": pd.NaT,
+        "Session4": "None", "Session4Date": pd.NaT, "Session4DateUtc": pd.NaT,
+        "Session5": "None", "Session5Date": pd.NaT, "Session5DateUtc": pd.NaT,
+        "F1ApiSupport": True,
+    }, year=year)
+
+
+def _make_drivers(n_drivers):
+    drivers = []
+    for i in range(n_drivers):
+        number = str(i + 1)
+        team, color = TEAMS[(i // 2) % len(TEAMS)]
+        abbreviation = f"D{i + 1:02d}"[-3:]
+        drivers.append({
+            "DriverNumber": number,
+            "BroadcastName": f"D DRIVER{i + 1}",
+            "Abbreviation": abbreviation,
+            "DriverId": f"driver_{i + 1}",
+            "TeamName": team,
+            "TeamColor": color,
+            "TeamId": team.lower().replace(" ", "_"),
+            "FirstName": "Driver",
+            "LastName": str(i + 1),
+            "FullName": f"Driver {i + 1}",
+            "HeadshotUrl": "",
+            "CountryCode": "SYN",
+        })
+    return drivers
+
+
+def _lap_times(rng, track, n_laps):
+    """Lap times in seconds with tyre degradation, fuel burn and pit stops."""
+    pace = track["lap_time"] * rng.normal(1.0, 0.006)
+    # Up to two stops between lap 8 and five laps from the end
+    pit_laps = np.arange(8, max(n_laps - 5, 9))
+    stops = np.sort(rng.choice(pit_laps, size=min(2, n_laps - 12, len(pit_laps)), replace=False)) \
+        if n_laps > 12 else np.array([], dtype=int)
+    stint = np.searchsorted(stops, np.arange(1, n_laps + 1), side="left") + 1
+    tyre_life = np.ones(n_laps)
+    for lap in range(1, n_laps):
+        tyre_life[lap] = 1 if stint[lap] != stint[lap - 1] else tyre_life[lap - 1] + 1
+
+    fuel = np.linspace(2.5, 0.0, n_laps)
+    degradation = 0.06 * tyre_life
+    noise = rng.normal(0, 0.25, n_laps)
+    times = pace + fuel + degradation + noise
+    times[0] += 4.0  # standing start
+
+    pit_loss = rng.normal(21.5, 1.2, len(stops))
+    in_laps = stops - 1  # index of the lap on which the car enters the pits
+    times[in_laps] += 0.4 * pit_loss
+    times[np.minimum(in_laps + 1, n_laps - 1)] += 0.6 * pit_loss
+    return times, stint, tyre_life, in_laps, pit_loss
+
+
+def _channels(track, distance_in_lap, lap_scale):
+    """Car channels for points at ``distance_in_lap`` driven at ``lap_scale`` pace."""
+    speed = np.interp(distance_in_lap, track["distance"], track["speed"]) / lap_scale
+    throttle = np.interp(distance_in_lap, track["distance"], track["throttle"])
+    brake = np.interp(distance_in_lap, track["distance"], track["brake"]) > 0.5
+    gear = np.clip(np.digitize(speed, [95, 135, 170, 200, 230, 260, 290]) + 1, 1, 8)
+    # Engine speed climbs through each gear's speed band
+    band_low = np.array([0, 95, 135, 170, 200, 230, 260, 290])[gear - 1]
+    band_high = np.array([95, 135, 170, 200, 230, 260, 290, 340])[gear - 1]
+    rpm = 9500 + 2500 * np.clip((speed - band_low) / (band_high - band_low), 0, 1)
+    drs = np.where(np.interp(distance_in_lap, track["distance"], track["drs"]) > 0.5, 12, 0)
+    return speed, throttle, brake, gear, rpm, drs
+
+
+def _driver_telemetry(track, lap_start, lap_times, hz, t0_date, session, driver):
+    """Car and position data covering every lap of one driver."""
+    race_end = lap_start[-1] + lap_times[-1]
+    t = np.arange(lap_start[0] - 1.0, race_end + 1.0, 1.0 / hz)
+    lap = np.clip(np.searchsorted(lap_start, t, side="right") - 1, 0, len(lap_times) - 1)
+    fraction = np.clip((t - lap_start[lap]) / lap_times[lap], 0, 1)
+    distance_in_lap = np.interp(fraction, track["tau"], track["distance"])
+    lap_scale = lap_times[lap] / track["lap_time"]
+
+    speed, throttle, brake, gear, rpm, drs = _channels(track, distance_in_lap, lap_scale)
+    session_time = pd.to_timedelta(t, unit="s").round("ms")
+    date = t0_date + session_time
+
+    car = Telemetry({
+        "Date": date, "RPM": rpm, "Speed": speed, "nGear": gear.astype(int),
+        "Throttle": throttle, "Brake": brake, "DRS": drs.astype(int),
+        "Source": "car", "Time": session_time, "SessionTime": session_time,
+    }, session=session, driver=driver)
+
+    # Position data is sampled with a small offset like the real feed
+    x = np.interp(distance_in_lap, track["distance"], track["x"]) * 10
+    y = np.interp(distance_in_lap, track["distance"], track["y"]) * 10
+    pos = Telemetry({
+        "Date": date + pd.Timedelta(milliseconds=110),
+        "Status": "OnTrack", "X": x, "Y": y, "Z": np.zeros_like(x),
+        "Source": "pos",
+        "Time": session_time + pd.Timedelta(milliseconds=110),
+        "SessionTime": session_time + pd.Timedelta(milliseconds=110),
+    }, session=session, driver=driver)
+    return car, pos
+
+
+def generate_session(n_drivers=20, n_laps=57, hz=4.0, seed=0, year=2024,
+                     event_name="Synthetic Grand Prix", session_name="Race",
+                     track_length_m=5400.0):
+    """
+    Build a FastF1 ``Session`` filled with simulated data.
+
+    Args:
+        n_drivers (int): Number of cars.
+        n_laps (int): Laps driven by every car.
+        hz (float): Car and position data sample rate.
+        seed (int): Random seed, the same arguments always give the same session.
+        year (int): Season of the event.
+        event_name (str): Name of the synthetic event.
+        session_name (str): "Race" or "Qualifying".
+        track_length_m (float): Lap length in meters.
+
+    Returns:
+        fastf1.core.Session: A session that behaves as if ``load()`` was called.
+    """
+    rng = np.random.default_rng(seed)
+    track = _make_track(rng, track_length_m)
+    session_date = pd.Timestamp(f"{year}-03-02 15:00:00")
+    event = _make_event(year, event_name, session_name, session_date)
+    session = Session(event, session_name, f1_api_support=True)
+
+    t0_date = session_date - pd.Timedelta(hours=1)
+    race_start = 3600.0
+    drivers = _make_drivers(n_drivers)
+
+    laps_frames, results = [], []
+    session._car_data, session._pos_data = {}, {}
+    for grid, driver in enumerate(drivers, start=1):
+        times, stint, tyre_life, in_laps, pit_loss = _lap_times(rng, track, n_laps)
+        lap_start = race_start + 0.25 * grid + np.concatenate([[0.0], np.cumsum(times)[:-1]])
+        lap_end = lap_start + times
+
+        pit_in = np.full(n_laps, np.nan)
+        pit_out = np.full(n_laps, np.nan)
+        pit_in[in_laps] = lap_end[in_laps] - 0.4 * pit_loss
+        out_laps = np.minimum(in_laps + 1, n_laps - 1)
+        pit_out[out_laps] = lap_start[out_laps] + 0.6 * pit_loss - 3.0
+
+        sectors = times[:, None] * rng.dirichlet([30, 40, 30], size=1)[0]
+        compound_order = rng.permutation(COMPOUNDS)
+        compounds = compound_order[(stint - 1) % len(COMPOUNDS)]
+        best = np.minimum.accumulate(times)
+
+        laps_frames.append(pd.DataFrame({
+            "Time": pd.to_timedelta(lap_end, unit="s"),
+            "Driver": driver["Abbreviation"],
+            "DriverNumber": driver["DriverNumber"],
+            "LapTime": pd.to_timedelta(times, unit="s"),
+            "LapNumber": np.arange(1, n_laps + 1, dtype=float),
+            "Stint": stint.astype(float),
+            "PitOutTime": pd.to_timedelta(pit_out, unit="s"),
+            "PitInTime": pd.to_timedelta(pit_in, unit="s"),
+            "Sector1Time": pd.to_timedelta(sectors[:, 0], unit="s"),
+            "Sector2Time": pd.to_timedelta(sectors[:, 1], unit="s"),
+            "Sector3Time": pd.to_timedelta(sectors[:, 2], unit="s"),
+            "Sector1SessionTime": pd.to_timedelta(lap_start + sectors[:, 0], unit="s"),
+            "Sector2SessionTime": pd.to_timedelta(lap_start + sectors[:, :2].sum(axis=1), unit="s"),
+            "Sector3SessionTime": pd.to_timedelta(lap_end, unit="s"),
+            "SpeedI1": rng.normal(280, 6, n_laps),
+            "SpeedI2": rng.normal(260, 6, n_laps),
+            "SpeedFL": rng.normal(290, 5, n_laps),
+            "SpeedST": rng.normal(315, 7, n_laps),
+            "IsPersonalBest": times <= best,
+            "Compound": compounds,
+            "TyreLife": tyre_life,
+            "FreshTyre": True,
+            "Team": driver["TeamName"],
+            "LapStartTime": pd.to_timedelta(lap_start, unit="s"),
+            "LapStartDate": t0_date + pd.to_timedelta(lap_start, unit="s"),
+            "TrackStatus": "1",
+            "Position": np.nan,
+            "Deleted": False,
+            "DeletedReason": "",
+            "FastF1Generated": False,
+            "IsAccurate": True,
+        }))
+
+        car, pos = _driver_telemetry(track, lap_start, times, hz, t0_date, session,
+                                     driver["DriverNumber"])
+        session._car_data[driver["DriverNumber"]] = car
+        session._pos_data[driver["DriverNumber"]] = pos
+        results.append(dict(driver, GridPosition=float(grid), TotalTime=lap_end[-1] - race_start))
+
+    laps = pd.concat(laps_frames, ignore_index=True)
+    # Running order at the end of every lap
+    laps["Position"] = laps.groupby("LapNumber")["Time"].rank(method="first")
+
+    results = pd.DataFrame(results).sort_values("TotalTime").reset_index(drop=True)
+    results["Position"] = np.arange(1, len(results) + 1, dtype=float)
+    results["ClassifiedPosition"] = results["Position"].astype(int).astype(str)
+    results["Time"] = pd.to_timedelta(results["TotalTime"] - results["TotalTime"].iloc[0], unit="s")
+    results["Status"] = "Finished"
+    results["Points"] = 0.0
+    results.loc[:9, "Points"] = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1][: min(10, len(results))]
+    best_laps = laps.groupby("DriverNumber")["LapTime"].min()
+    for column, offset in (("Q1", 0.9), ("Q2", 0.6), ("Q3", 0.3)):
+        results[column] = results["DriverNumber"].map(best_laps) - pd.Timedelta(seconds=offset)
+    results = results.drop(columns="TotalTime")
+    results.index = results["DriverNumber"].values
+
+    n_weather = int((laps["Time"].max().total_seconds()) // 60) + 1
+    weather_time = np.arange(n_weather) * 60.0
+    session._weather_data = pd.DataFrame({
+        "Time": pd.to_timedelta(weather_time, unit="s"),
+        "AirTemp": 24 + np.cumsum(rng.normal(0, 0.05, n_weather)),
+        "Humidity": np.clip(45 + np.cumsum(rng.normal(0, 0.2, n_weather)), 0, 100),
+        "Pressure": 1012 + rng.normal(0, 0.3, n_weather),
+        "Rainfall": False,
+        "TrackTemp": 35 + np.cumsum(rng.normal(0, 0.08, n_weather)),
+        "WindDirection": rng.integers(0, 360, n_weather),
+        "WindSpeed": np.abs(rng.normal(2, 0.8, n_weather)),
+    })
+
+    session._session_info = {
+        "Meeting": {"Name": event_name, "Circuit": {"Key": 0, "ShortName": "Synthetic"}},
+        "Name": session_name,
+    }
+    session._t0_date = t0_date
+    session._session_start_time = pd.Timedelta(seconds=race_start)
+    session._total_laps = n_laps
+    session._track_status = pd.DataFrame({"Time": [pd.Timedelta(0)], "Status": ["1"], "Message": ["AllClear"]})
+    session._session_status = pd.DataFrame({"Time": [pd.Timedelta(seconds=race_start)], "Status": ["Started"]})
+    session._race_control_messages = pd.DataFrame(columns=["Time", "Category", "Message"])
+    session._results = SessionResults(results, _force_default_cols=True)
+    session._laps = Laps(laps, session=session, _force_default_cols=True)
+    return session
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--drivers", type=int, default=20, help="Number of cars")
+    parser.add_argument("--laps", type=int, default=57, help="Laps per car")
+    parser.add_argument("--hz", type=float, default=4.0, help="Telemetry sample rate")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--event", default="Synthetic Grand Prix", help="Event name")
+    parser.add_argument("--store", help="Write the session to this store root as session R")
+    parser.add_argument("--no-telemetry", action="store_true",
+                        help="Do not store per-lap telemetry")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    session = generate_session(
+        n_drivers=args.drivers, n_laps=args.laps, hz=args.hz,
+        seed=args.seed, year=args.year, event_name=args.event,
+    )
+    samples = sum(len(car) for car in session.car_data.values())
+    logging.info(
+        f"Generated {len(session.drivers)} drivers, {len(session.laps)} laps and "
+        f"{samples} car data samples"
+    )
+
+    if args.store:
+        path = store.write_session(
+            session, "R", root=args.store, telemetry=not args.no_telemetry
+        )
+        logging.info(f"Stored {args.year} {args.event} in {path}")
+
+
+if __name__ == "__main__":
+    main()
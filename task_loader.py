@@ -0,0 +1,80 @@
+"""Run independent, I/O-bound load tasks concurrently and time each of them."""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+
+class TaskLoader:
+    """
+    Starts named load tasks on a bounded thread pool.
+
+    Results can be consumed in completion order, so callers can render each
+    part of a page as soon as its data arrives. With ``max_workers`` of 0 or 1
+    every task runs on the calling thread at submission time, which gives a
+    deterministic serial fallback with the same interface.
+
+    Args:
+        max_workers (int): Maximum number of tasks running at the same time.
+        wrap (callable): Optional decorator applied to every task before it
+            runs on a worker thread, e.g. to attach a thread-local context.
+    """
+
+    def __init__(self, max_workers=4, wrap=None):
+        self.serial = max_workers <= 1
+        self._pool = None if self.serial else ThreadPoolExecutor(max_workers=max_workers)
+        self._wrap = wrap
+        self._futures = {}  # name -> Future, in submission order
+        self.timings = {}  # name -> seconds spent in the task
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def _timed(self, name, fn):
+        def run(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.timings[name] = time.perf_counter() - start
+
+        return run
+
+    def submit(self, name, fn, *args, **kwargs):
+        """Start ``fn(*args, **kwargs)`` as the task called ``name``."""
+        task = self._timed(name, fn)
+        if self.serial:
+            future = Future()
+            try:
+                future.set_result(task(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            if self._wrap is not None:
+                task = self._wrap(task)
+            future = self._pool.submit(task, *args, **kwargs)
+        self._futures[name] = future
+        return future
+
+    def result(self, name):
+        """Wait for the task called ``name`` and return its result."""
+        return self._futures[name].result()
+
+    def as_completed(self):
+        """
+        Yield ``(name, future)`` pairs as tasks finish.
+
+        In serial mode tasks are yielded in submission order.
+        """
+        if self.serial:
+            yield from self._futures.items()
+            return
+        names = {future: name for name, future in self._futures.items()}
+        for future in as_completed(names):
+            yield names[future], future
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
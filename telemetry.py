@@ -0,0 +1,185 @@
+"""NumPy helpers for preparing lap telemetry for charts."""
+
+import numpy as np
+
+# Channels that change in discrete steps; they keep per-bucket extremes
+# instead of LTTB's triangle-area pick so no gear change or DRS flap is lost
+STEP_CHANNELS = ("nGear", "DRS", "Brake")
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of ``n_out - 2`` buckets,
+    the point forming the largest triangle with the point kept from the
+    previous bucket and the average of the next bucket.
+
+    Args:
+        x (array-like): Monotonic x values.
+        y (array-like): y values, same length as ``x``.
+        n_out (int): Number of points to keep.
+
+    Returns:
+        numpy.ndarray: Sorted indices of the kept points.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket boundaries over the points between the first and the last one
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    starts, ends = edges[:-1], edges[1:]
+
+    # Averages of every bucket; the last bucket looks ahead to the final point
+    sizes = ends - starts
+    avg_x = np.append(np.add.reduceat(x[1:n - 1], starts - 1) / sizes, x[-1])
+    avg_y = np.append(np.add.reduceat(y[1:n - 1], starts - 1) / sizes, y[-1])
+
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        bx, by = x[start:end], y[start:end]
+        # Twice the triangle area, the constant factor does not change the argmax
+        area = np.abs(
+            (x[a] - avg_x[i + 1]) * (by - y[a]) - (x[a] - bx) * (avg_y[i + 1] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def minmax_indices(y, n_out):
+    """
+    Keep the minimum and the maximum of each bucket.
+
+    Suited to step-like channels: every level the signal reaches survives.
+    NaNs are ignored, buckets holding only NaNs are dropped.
+
+    Args:
+        y (array-like): Values to downsample.
+        n_out (int): Approximate number of points to keep (two per bucket).
+
+    Returns:
+        numpy.ndarray: Sorted, unique indices of the kept points.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    starts = np.linspace(0, n, n_out // 2, endpoint=False).astype(int)
+    bucket = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    kept = [np.array([0, n - 1])]
+    for reduce in (np.fmin, np.fmax):
+        extremes = reduce.reduceat(y, starts)
+        hits = np.flatnonzero(y == extremes[bucket])
+        # First index reaching the extreme in every bucket
+        _, first = np.unique(bucket[hits], return_index=True)
+        kept.append(hits[first])
+    return np.unique(np.concatenate(kept))
+
+
+def downsample_indices(x, y, n_out, step=False):
+    """Indices of ``n_out`` representative points, using min/max buckets for step channels."""
+    if step:
+        return minmax_indices(y, n_out)
+    return lttb_indices(x, y, n_out)
+
+
+def resample_laps(frames, channels, step=5.0):
+    """
+    Resample the telemetry of several laps onto one common distance grid.
+
+    Continuous channels are linearly interpolated; ``STEP_CHANNELS`` hold the
+    last sample so no fractional gears or DRS states appear. Timedelta
+    channels such as "Time" are resampled in seconds. The grid runs from 0 m to the shortest
+    distance covered by all laps.
+
+    Args:
+        frames (list): Lap telemetry DataFrames with a monotonic "Distance" column.
+        channels (list): Columns to resample.
+        step (float): Grid spacing in meters.
+
+    Returns:
+        tuple: ``(grid, arrays)`` where ``grid`` is the 1-D distance grid and
+        ``arrays`` maps every channel to an array of shape (laps, grid points).
+    """
+    distances = [frame["Distance"].to_numpy(dtype=float) for frame in frames]
+    end = min((d[-1] for d in distances if len(d)), default=0.0)
+    grid = np.arange(0.0, end, step)
+
+    arrays = {
+        channel: np.full((len(frames), len(grid)), np.nan) for channel in channels
+    }
+    for row, (frame, distance) in enumerate(zip(frames, distances)):
+        if len(distance) == 0:
+            continue
+        # Last sample at or before each grid point, for zero-order hold
+        held = np.clip(np.searchsorted(distance, grid, side="right") - 1, 0, None)
+        for channel in channels:
+            values = frame[channel]
+            if values.dtype.kind == "m":
+                values = values.dt.total_seconds()
+            values = values.to_numpy(dtype=float)
+            if channel in STEP_CHANNELS:
+                arrays[channel][row] = values[held]
+            else:
+                arrays[channel][row] = np.interp(grid, distance, values)
+    return grid, arrays
+
+
+def delta_time(lap_time, reference=0):
+    """
+    Cumulative time difference of laps to a reference lap over distance.
+
+    Works on the resampled "Time" channel of :func:`resample_laps`, so every
+    lap (e.g. the fastest lap of every driver) is compared in one array
+    operation.
+
+    Args:
+        lap_time (numpy.ndarray): Elapsed lap time in seconds, shape (laps, grid points).
+        reference (int): Row of the reference lap.
+
+    Returns:
+        numpy.ndarray: Same shape as ``lap_time``; positive where a lap is
+        behind the reference at that distance, negative where it is ahead.
+    """
+    # Measure from each lap's own start, telemetry may not begin exactly at 0 s
+    elapsed = lap_time - lap_time[:, :1]
+    return elapsed - elapsed[reference]
+
+
+def track_map_geometry(track_xy, corners_xy, corner_angles, rotation, offset=500.0):
+    """
+    Rotate a track outline and its corner markers in one matrix product.
+
+    Corner labels are placed ``offset`` meters from each corner in the
+    direction of the corner's angle, then everything is rotated by the
+    circuit's rotation so the map matches the official orientation.
+
+    Args:
+        track_xy (numpy.ndarray): Track outline positions, shape (n, 2).
+        corners_xy (numpy.ndarray): Corner positions, shape (m, 2).
+        corner_angles (numpy.ndarray): Label direction of each corner in degrees.
+        rotation (float): Circuit rotation in degrees.
+        offset (float): Distance between a corner and its label.
+
+    Returns:
+        tuple: Rotated ``(track, corners, labels)`` arrays of shapes (n, 2),
+        (m, 2) and (m, 2).
+    """
+    angles = np.radians(np.asarray(corner_angles, dtype=float))
+    label_xy = corners_xy + offset * np.column_stack([np.cos(angles), np.sin(angles)])
+
+    angle = np.radians(rotation)
+    rotation_matrix = np.array(
+        [[np.cos(angle), np.sin(angle)], [-np.sin(angle), np.cos(angle)]]
+    )
+    points = np.vstack([track_xy, corners_xy, label_xy]) @ rotation_matrix
+
+    n, m = len(track_xy), len(corners_xy)
+    return points[:n], points[n:n + m], points[n + m:]
@@ -0,0 +1,115 @@
+import threading
+import time
+
+from caching import MemoryLRUCache
+
+
+def sized(max_bytes):
+    # Values are their own size in bytes
+    return MemoryLRUCache(max_bytes, sizeof=lambda value: value)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = sized(30)
+    cache.put("a", 10)
+    cache.put("b", 10)
+    cache.put("c", 10)
+    cache.get("a")  # "b" is now the least recently used
+
+    cache.put("d", 10)
+
+    assert "a" in cache and "c" in cache and "d" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_oversized_value_is_kept_until_replaced():
+    cache = sized(10)
+    cache.put("small", 5)
+    cache.put("big", 50)
+
+    assert "big" in cache
+    assert "small" not in cache
+    assert len(cache) == 1
+
+
+def test_refresh_evicts_entries_that_grew():
+    cache = MemoryLRUCache(30, sizeof=len)
+    cache.put("a", [0] * 10)
+    cache.put("b", [0] * 10)
+
+    cache.get("b").extend([0] * 15)
+    cache.refresh()
+
+    assert "a" not in cache and "b" in cache
+
+
+def test_get_or_load_counts_hits_and_misses():
+    cache = sized(100)
+
+    assert cache.get_or_load("a", lambda: 1) == 1
+    assert cache.get_or_load("a", lambda: 2) == 1
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_get_or_load_does_not_cache_none():
+    cache = sized(100)
+
+    assert cache.get_or_load("a", lambda: None) is None
+    assert "a" not in cache
+
+
+def test_concurrent_get_or_load_runs_the_loader_once():
+    cache = sized(100)
+    calls = []
+    start = threading.Barrier(8)
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return 42
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(cache.get_or_load("key", loader))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 8
+    assert len(calls) == 1
+
+
+def test_failed_load_lets_the_next_caller_retry():
+    cache = sized(100)
+
+    def fail():
+        raise RuntimeError("unavailable")
+
+    try:
+        cache.get_or_load("key", fail)
+    except RuntimeError:
+        pass
+
+    assert cache.get_or_load("key", lambda: 7) == 7
+
+
+def test_thread_hits_are_per_thread():
+    cache = sized(100)
+    cache.put("a", 1)
+    cache.get("a")
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(cache.thread_hits()))
+    thread.start()
+    thread.join()
+
+    assert cache.thread_hits() == 1
+    assert other == [0]
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmark import load_dashboard
+from synthetic import generate_session
+
+
+@pytest.fixture(scope="module")
+def dashboard():
+    return load_dashboard()
+
+
+def seconds(values):
+    return pd.to_timedelta(values, unit="s")
+
+
+def test_in_laps_are_paired_with_the_next_lap_of_the_same_driver(dashboard):
+    nan = np.nan
+    laps = pd.DataFrame(
+        {
+            "DriverNumber": ["1", "1", "1", "2", "2"],
+            "Driver": ["AAA", "AAA", "AAA", "BBB", "BBB"],
+            "Team": ["T1", "T1", "T1", "T2", "T2"],
+            "LapNumber": [1.0, 2.0, 3.0, 1.0, 2.0],
+            "Stint": [1.0, 2.0, 2.0, 1.0, 1.0],
+            "Compound": ["SOFT", "HARD", "HARD", "MEDIUM", "MEDIUM"],
+            "LapTime": seconds([90.0, 110.0, 91.0, 92.0, 93.0]),
+            # Driver 1 stops at the end of lap 1; driver 2 enters the pits on
+            # the last lap and never comes out
+            "PitInTime": seconds([100.0, nan, nan, nan, 290.0]),
+            "PitOutTime": seconds([nan, 122.0, nan, nan, nan]),
+        }
+    )
+    session = SimpleNamespace(
+        laps=laps.iloc[::-1],  # the table sorts by driver and lap itself
+        results=pd.DataFrame({"DriverNumber": ["1", "2"], "FullName": ["Driver A", "Driver B"]}),
+    )
+
+    table = dashboard.build_pit_stop_table(session)
+
+    assert len(table) == 1
+    stop = table.iloc[0]
+    assert stop["DriverNumber"] == "1" and stop["DriverName"] == "Driver A"
+    assert stop["LapNumber"] == 1
+    assert (stop["Compound"], stop["NewCompound"]) == ("SOFT", "HARD")
+    assert stop["PitDuration"] == pytest.approx(22.0)
+    # In-lap plus out-lap minus twice the median lap without pit lane time,
+    # which for driver 1 is only lap 3
+    assert stop["PitLaneLoss"] == pytest.approx(90.0 + 110.0 - 2 * 91.0)
+
+
+def test_every_synthetic_stop_is_found(dashboard):
+    session = generate_session(n_drivers=3, n_laps=20, hz=1.0)
+
+    table = dashboard.build_pit_stop_table(session)
+
+    laps = session.laps
+    in_laps = laps[laps["PitInTime"].notna() & (laps["LapNumber"] < laps["LapNumber"].max())]
+    assert len(table) == len(in_laps) > 0
+    assert (table["PitDuration"] > 0).all()
+    assert set(table["DriverName"]) <= set(session.results["FullName"])
+    for _, stop in table.iterrows():
+        out_lap = laps[
+            (laps["DriverNumber"] == stop["DriverNumber"])
+            & (laps["LapNumber"] == stop["LapNumber"] + 1)
+        ].iloc[0]
+        assert stop["PitOutTime"] == out_lap["PitOutTime"]
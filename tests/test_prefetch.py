@@ -0,0 +1,44 @@
+import pandas as pd
+
+from prefetch import latest_completed_event, prefetch_targets
+
+
+def schedule():
+    return pd.DataFrame(
+        {
+            "EventName": [
+                "Pre-Season Testing",
+                "Australian Grand Prix",
+                "Chinese Grand Prix",
+                "Japanese Grand Prix",
+            ],
+            "EventFormat": ["testing", "conventional", "sprint_qualifying", "conventional"],
+            "EventDate": pd.to_datetime(["2025-02-28", "2025-03-16", "2025-03-23", "2025-04-06"]),
+        }
+    )
+
+
+def test_latest_completed_event_skips_testing():
+    assert latest_completed_event(schedule(), now=pd.Timestamp("2025-03-01")) is None
+    assert (
+        latest_completed_event(schedule(), now=pd.Timestamp("2025-03-30 12:00"))
+        == "Chinese Grand Prix"
+    )
+
+
+def test_targets_never_include_testing():
+    targets = prefetch_targets(schedule(), now=pd.Timestamp("2025-03-01"))
+
+    assert targets == ["Australian Grand Prix"]
+
+
+def test_targets_are_not_repeated():
+    targets = prefetch_targets(schedule(), now=pd.Timestamp("2025-03-20"))
+
+    assert targets == ["Australian Grand Prix"]
+
+
+def test_latest_event_comes_first():
+    targets = prefetch_targets(schedule(), now=pd.Timestamp("2025-04-10"))
+
+    assert targets == ["Japanese Grand Prix", "Australian Grand Prix"]
@@ -0,0 +1,310 @@
+import json
+from datetime import datetime, timezone
+
+import produce
+from produce import (
+    AdaptivePoller,
+    BatchPublisher,
+    checkpoint,
+    fetch_page,
+    load_cursors,
+    new_entries,
+    newest_time,
+    outcome_of,
+    parse_time,
+    publish_new,
+    reset_cursors,
+    save_cursors,
+)
+from transport import MemoryBroker, MemoryTransport
+
+
+class FakePublisher:
+    def __init__(self):
+        self.added = []
+
+    def add(self, queue, driver_number, entry, marker=None):
+        self.added.append((queue, driver_number, entry, marker))
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def json(self):
+        if self.body is None:
+            raise ValueError("Expecting value")
+        return self.body
+
+
+class FakeHttp:
+    def __init__(self, response):
+        self.response = response
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return self.response
+
+
+def drain(transport, queue):
+    received = []
+    transport.consume(queue, lambda q, body, headers: received.append((body, headers)))
+    transport.poll(0.1)
+    return received
+
+
+def sample(date):
+    return {"date": date, "speed": 300}
+
+
+def lap(number, duration=None):
+    return {"lap_number": number, "lap_duration": duration}
+
+
+def test_car_data_after_the_cursor_is_kept_in_order():
+    entries = [
+        sample("2024-05-26T13:00:02+00:00"),
+        sample("2024-05-26T13:00:01+00:00"),
+        sample("2024-05-26T13:00:03+00:00"),
+        {"speed": 280},
+    ]
+
+    fresh, duplicates = new_entries("car_data", entries, "2024-05-26T13:00:01+00:00")
+
+    assert [entry["date"] for entry in fresh] == [
+        "2024-05-26T13:00:02+00:00",
+        "2024-05-26T13:00:03+00:00",
+    ]
+    # The entry without a date is dropped, not counted as a duplicate
+    assert duplicates == 1
+
+
+def test_without_a_cursor_every_entry_is_new():
+    fresh, duplicates = new_entries("laps", [lap(2), lap(1)], None)
+
+    assert [entry["lap_number"] for entry in fresh] == [1, 2]
+    assert duplicates == 0
+
+
+def test_a_changed_cursor_lap_is_published_again():
+    published = lap(5)
+
+    fresh, duplicates = new_entries("laps", [lap(4), lap(5, 92.1), lap(6)], 5, published)
+
+    assert fresh == [lap(5, 92.1), lap(6)]
+    assert duplicates == 1
+
+
+def test_an_unchanged_cursor_lap_is_not_a_duplicate():
+    fresh, duplicates = new_entries("laps", [lap(5, 92.1)], 5, lap(5, 92.1))
+
+    assert fresh == []
+    assert duplicates == 0
+
+
+def test_publish_new_advances_the_cursor(tmp_path):
+    publisher = FakePublisher()
+    cursors = load_cursors(str(tmp_path / "cursors.json"))
+    cursors["session_key"] = 9165
+    stats = {"published": 0, "duplicates": 0}
+    last_published = {}
+
+    publish_new(publisher, "laps", 1, [lap(1), lap(2)], cursors, stats, last_published)
+    publish_new(publisher, "laps", 1, [lap(2), lap(3, 91.0)], cursors, stats, last_published)
+
+    assert [entry["lap_number"] for _, _, entry, _ in publisher.added] == [1, 2, 3]
+    assert all(entry["driver_number"] == 1 for _, _, entry, _ in publisher.added)
+    assert publisher.added[-1][0] == "lap_data"
+    assert publisher.added[-1][3] == (9165, "laps", 1, 3)
+    assert cursors["laps"] == {"1": 3}
+    assert last_published[("laps", 1)] == lap(3, 91.0) | {"driver_number": 1}
+    assert stats == {"published": 3, "duplicates": 0}
+
+
+def test_cursors_survive_a_restart(tmp_path):
+    path = str(tmp_path / "cursors.json")
+    cursors = load_cursors(path)
+    assert cursors == {"session_key": None, "car_data": {}, "laps": {}}
+
+    cursors["session_key"] = 9165
+    cursors["laps"]["1"] = 12
+    save_cursors(cursors, path)
+
+    assert load_cursors(path) == cursors
+    assert not (tmp_path / "cursors.json.tmp").exists()
+
+
+def test_reset_cursors_starts_a_new_session():
+    cursors = {"session_key": 9165, "car_data": {"1": "2024-05-26T13:00:01"}, "laps": {"1": 12}}
+
+    reset_cursors(cursors, 9166)
+
+    assert cursors == {"session_key": 9166, "car_data": {}, "laps": {}}
+
+
+def test_the_cursor_lap_is_requested_again():
+    http = FakeHttp(FakeResponse(body=[lap(12)]))
+
+    fetch_page("laps", 1, 12, http, session_key=9165)
+    fetch_page("car_data", 1, "2024-05-26T13:00:01+00:00", http, session_key=9165)
+
+    assert http.urls[0].endswith("session_key=9165&driver_number=1&lap_number>=12")
+    assert "&date>2024-05-26T13%3A00%3A01%2B00%3A00" in http.urls[1]
+
+
+def test_a_truncated_body_is_a_failed_fetch():
+    http = FakeHttp(FakeResponse(body=None))
+
+    assert fetch_page("laps", 1, None, http) == ([], None, None)
+
+
+def test_batches_are_sent_when_full():
+    transport = MemoryTransport(broker=MemoryBroker())
+    publisher = BatchPublisher(transport, max_records=3, max_bytes=10**6, max_delay_s=60)
+
+    for i in range(7):
+        publisher.add("lap_data", 1, lap(i))
+
+    received = drain(transport, "lap_data")
+    assert [headers["records"] for _, headers in received] == [3, 3]
+    assert [json.loads(line) for line in received[0][0].splitlines()] == [lap(0), lap(1), lap(2)]
+    assert all(isinstance(headers["published_at"], float) for _, headers in received)
+
+    publisher.flush()
+
+    assert [headers["records"] for _, headers in drain(transport, "lap_data")] == [1]
+    assert publisher.totals["records"] == 7 and publisher.totals["batches"] == 3
+
+
+def test_batches_are_sent_at_the_size_limit():
+    transport = MemoryTransport(broker=MemoryBroker())
+    line_bytes = len(json.dumps(lap(0))) + 1
+    publisher = BatchPublisher(transport, max_records=100, max_bytes=2 * line_bytes, max_delay_s=60)
+
+    for i in range(4):
+        publisher.add("lap_data", 1, lap(i))
+
+    assert [headers["records"] for _, headers in drain(transport, "lap_data")] == [2, 2]
+
+
+def test_batches_are_kept_per_driver_until_due():
+    transport = MemoryTransport(broker=MemoryBroker())
+    publisher = BatchPublisher(transport, max_records=100, max_bytes=10**6, max_delay_s=60)
+    publisher.add("lap_data", 1, lap(1))
+    publisher.add("lap_data", 16, lap(1))
+
+    publisher.flush_due()
+    assert drain(transport, "lap_data") == []
+
+    publisher.max_delay_s = 0
+    publisher.flush_due()
+    assert [headers["records"] for _, headers in drain(transport, "lap_data")] == [1, 1]
+
+
+def test_the_marker_of_the_last_record_is_confirmed():
+    confirms = []
+    publisher = BatchPublisher(
+        MemoryTransport(broker=MemoryBroker()),
+        max_records=2,
+        max_bytes=10**6,
+        max_delay_s=60,
+        on_confirm=confirms.append,
+    )
+
+    publisher.add("lap_data", 1, lap(1), marker=(9165, "laps", 1, 1))
+    assert confirms == []
+    publisher.add("lap_data", 1, lap(2), marker=(9165, "laps", 1, 2))
+    publisher.add("lap_data", 1, lap(3))
+    publisher.flush()
+
+    # A batch without a marker confirms nothing
+    assert confirms == [(9165, "laps", 1, 2)]
+
+
+def test_checkpoint_saves_confirmed_cursors_of_the_session(tmp_path, monkeypatch):
+    path = str(tmp_path / "cursors.json")
+    monkeypatch.setattr(produce, "save_cursors", lambda cursors: save_cursors(cursors, path))
+    confirmed = load_cursors(path)
+    confirmed["session_key"] = 9165
+    on_confirm = checkpoint(confirmed)
+
+    on_confirm((9165, "laps", 1, 12))
+    # Late confirm of a batch from the previous session
+    on_confirm((9164, "laps", 1, 57))
+
+    assert load_cursors(path) == {"session_key": 9165, "car_data": {}, "laps": {"1": 12}}
+
+
+def test_naive_timestamps_are_utc():
+    naive = parse_time("2024-05-26T13:00:01.250")
+    aware = parse_time("2024-05-26T15:00:01.250+02:00")
+
+    assert naive.tzinfo is not None
+    assert naive == aware == datetime(2024, 5, 26, 13, 0, 1, 250000, tzinfo=timezone.utc)
+
+
+def test_newest_time_compares_naive_and_aware_timestamps():
+    entries = [
+        {"date_start": "2024-05-26T13:01:00"},
+        {"date_start": "2024-05-26T15:00:30+02:00"},
+        {"date_start": None},
+        {"date_start": "not a date"},
+        {},
+    ]
+
+    assert newest_time("laps", entries) == datetime(2024, 5, 26, 13, 1, tzinfo=timezone.utc)
+    assert newest_time("laps", [{}]) is None
+
+
+def test_poll_outcomes():
+    assert outcome_of(200, [lap(1)]) == "new"
+    assert outcome_of(200, []) == "idle"
+    assert outcome_of(404, []) == "idle"
+    assert outcome_of(429, []) == "rate_limited"
+    assert outcome_of(None, []) == "error"
+    assert outcome_of(500, []) == "error"
+
+
+def test_poll_intervals_adapt_within_bounds():
+    poller = AdaptivePoller(min_interval=1.0, max_interval=8.0)
+    stream = ("laps", 1)
+    poller.sync([stream, ("car_data", 1)])
+    assert set(poller.due()) == {stream, ("car_data", 1)}
+
+    poller.record(stream, "idle")
+    assert poller.intervals[stream] == 1.5
+    poller.record(stream, "error")
+    assert poller.intervals[stream] == 3.0
+    poller.record(stream, "new")
+    assert poller.intervals[stream] == 1.5
+    poller.record(stream, "new")
+    assert poller.intervals[stream] == 1.0
+    for _ in range(5):
+        poller.record(stream, "rate_limited")
+    assert poller.intervals[stream] == 8.0
+    assert poller.due() == [("car_data", 1)]
+    assert poller.interval_range("laps") == (8.0, 8.0)
+
+
+def test_retry_after_delays_the_next_poll():
+    poller = AdaptivePoller(min_interval=1.0, max_interval=8.0)
+    stream = ("laps", 1)
+    poller.sync([stream])
+
+    poller.record(stream, "rate_limited", retry_after=30.0)
+
+    assert poller.intervals[stream] == 2.0
+    assert 29.0 < poller.wait_time() <= 30.0
+
+
+def test_streams_of_retired_drivers_are_dropped():
+    poller = AdaptivePoller(min_interval=1.0, max_interval=8.0)
+    poller.sync([("laps", 1), ("laps", 16)])
+
+    poller.sync([("laps", 1)])
+    poller.record(("laps", 16), "new")
+
+    assert list(poller.intervals) == [("laps", 1)]
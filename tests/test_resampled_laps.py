@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from fastf1.core import Lap
+
+from benchmark import load_dashboard, reset_caches
+from synthetic import generate_session
+
+
+@pytest.fixture(scope="module")
+def dashboard():
+    return load_dashboard()
+
+
+@pytest.fixture(scope="module")
+def session():
+    return generate_session(n_drivers=4, n_laps=3, hz=4.0)
+
+
+def fastest_laps(session):
+    return [session.laps.pick_drivers(driver).pick_fastest() for driver in session.drivers]
+
+
+def test_time_only_resampling_skips_merged_telemetry(dashboard, session, monkeypatch):
+    reset_caches(dashboard)
+
+    def merged_telemetry(self, *args, **kwargs):
+        raise AssertionError("get_telemetry() merges position data")
+
+    monkeypatch.setattr(Lap, "get_telemetry", merged_telemetry)
+    laps = fastest_laps(session)
+
+    grid, arrays = dashboard.fetch_resampled_laps(session, laps, ["Time"])
+
+    assert arrays["Time"].shape == (len(laps), len(grid))
+    assert not np.isnan(arrays["Time"]).any()
+
+
+def test_delta_at_the_line_matches_the_lap_times(dashboard, session):
+    reset_caches(dashboard)
+    laps = fastest_laps(session)
+
+    _, arrays = dashboard.fetch_resampled_laps(session, laps, ["Time"], step=1.0)
+    delta = dashboard.delta_time(arrays["Time"], reference=0)
+
+    np.testing.assert_allclose(delta[0], 0.0)
+    lap_times = np.array([lap["LapTime"].total_seconds() for lap in laps])
+    # The grid stops short of the line by less than one sample
+    np.testing.assert_allclose(delta[:, -1], lap_times - lap_times[0], atol=0.1)
@@ -0,0 +1,100 @@
+import numpy as np
+
+from ring_buffer import TelemetryRing
+
+
+def filled(capacity, n):
+    ring = TelemetryRing(capacity)
+    for i in range(n):
+        ring.append(float(i), speed=100.0 + i, n_gear=i % 8)
+    return ring
+
+
+def test_latest_before_the_buffer_is_full():
+    ring = filled(8, 3)
+
+    views = ring.latest()
+
+    assert len(ring) == 3
+    np.testing.assert_array_equal(views["time"], [0.0, 1.0, 2.0])
+    np.testing.assert_array_equal(views["speed"], [100.0, 101.0, 102.0])
+
+
+def test_latest_across_wrap_around():
+    ring = filled(8, 13)
+
+    views = ring.latest()
+
+    assert len(ring) == 8
+    np.testing.assert_array_equal(views["time"], np.arange(5.0, 13.0))
+    np.testing.assert_array_equal(ring.latest(3)["time"], [10.0, 11.0, 12.0])
+    assert not views["time"].flags.writeable
+
+
+def test_missing_channels_are_filled():
+    ring = TelemetryRing(4)
+    ring.append(0.0)
+
+    views = ring.latest()
+
+    assert np.isnan(views["speed"][0])
+    assert views["n_gear"][0] == -1
+
+
+def test_since_returns_only_new_samples_across_wrap_around():
+    ring = filled(8, 6)
+    _, seen = ring.since(0)
+
+    for i in range(6, 11):
+        ring.append(float(i))
+    views, total = ring.since(seen)
+
+    assert total == 11
+    np.testing.assert_array_equal(views["time"], np.arange(6.0, 11.0))
+
+
+def test_since_skips_overwritten_samples():
+    ring = filled(8, 2)
+    _, seen = ring.since(0)
+
+    for i in range(2, 22):
+        ring.append(float(i))
+    views, total = ring.since(seen)
+
+    # Only the kept samples come back, not the 20 appended
+    np.testing.assert_array_equal(views["time"], np.arange(14.0, 22.0))
+    assert total == 22
+
+
+def test_view_is_stable_for_capacity_minus_n_appends():
+    ring = filled(8, 13)
+    view = ring.latest(3)["time"]
+    expected = view.copy()
+
+    for i in range(5):
+        ring.append(100.0 + i)
+    np.testing.assert_array_equal(view, expected)
+
+    ring.append(200.0)
+    assert not np.array_equal(view, expected)
+
+
+def test_snapshot_round_trip(tmp_path):
+    ring = filled(8, 13)
+    path = tmp_path / "ring.npz"
+
+    ring.snapshot(path)
+    loaded = TelemetryRing.load(path)
+
+    for name, view in ring.latest().items():
+        np.testing.assert_array_equal(loaded.latest()[name], view)
+
+
+def test_append_record_reads_naive_dates_as_utc():
+    ring = TelemetryRing(4)
+    ring.append_record({"date": "2024-03-02T15:00:00.123456"})
+    ring.append_record({"date": "2024-03-02T15:00:00.123456+00:00"})
+
+    times = ring.latest()["time"]
+
+    assert times[0] == times[1]
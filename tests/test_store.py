@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from store import has_session, open_session, read_lap_telemetry, read_session_table, write_session
+from synthetic import generate_session
+
+
+@pytest.fixture(scope="module")
+def stored(tmp_path_factory):
+    session = generate_session(n_drivers=2, n_laps=4, hz=4.0, event_name="Store Grand Prix")
+    root = str(tmp_path_factory.mktemp("store"))
+    write_session(session, "R", root=root)
+    return session, root
+
+
+def test_session_is_found_after_writing(stored):
+    _, root = stored
+
+    assert has_session(2024, "Store Grand Prix", "R", root=root)
+    assert not has_session(2024, "Store Grand Prix", "Q", root=root)
+
+
+def test_laps_and_results_round_trip(stored):
+    session, root = stored
+
+    opened = open_session(2024, "Store Grand Prix", "R", root=root)
+
+    assert opened.event["EventName"] == "Store Grand Prix"
+    assert opened.name == session.name
+    columns = ["DriverNumber", "LapNumber", "LapTime", "PitInTime", "Compound"]
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(opened.laps[columns]).reset_index(drop=True),
+        pd.DataFrame(session.laps[columns]).reset_index(drop=True),
+    )
+    assert list(opened.results["DriverNumber"]) == list(session.results["DriverNumber"])
+    assert opened.laps.pick_fastest()["LapTime"] == session.laps.pick_fastest()["LapTime"]
+
+
+def test_read_session_table_selects_columns(stored):
+    _, root = stored
+
+    results = read_session_table(
+        2024, "Store Grand Prix", "R", "results", columns=["Position", "Missing"], root=root
+    )
+
+    assert list(results.columns) == ["Position"]
+
+
+def test_lap_telemetry_round_trip(stored):
+    session, root = stored
+    opened = open_session(2024, "Store Grand Prix", "R", root=root)
+    lap = session.laps.pick_drivers(session.drivers[1]).iloc[2]
+
+    tel = read_lap_telemetry(opened, lap["DriverNumber"], lap["LapNumber"], columns=["Distance", "Speed", "X"])
+
+    expected = pd.DataFrame(lap.get_telemetry())[["Distance", "Speed", "X"]]
+    assert list(tel.columns) == ["Distance", "Speed", "X"]
+    pd.testing.assert_frame_equal(tel, expected.reset_index(drop=True), check_dtype=False)
+
+
+def test_missing_lap_telemetry_is_empty(stored):
+    session, root = stored
+    opened = open_session(2024, "Store Grand Prix", "R", root=root)
+
+    tel = read_lap_telemetry(opened, session.drivers[0], 99, columns=["Speed"])
+
+    assert tel.empty and list(tel.columns) == ["Speed"]
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from synthetic import generate_session
+
+
+@pytest.mark.parametrize("n_laps", range(1, 21))
+def test_any_small_lap_count_generates(n_laps):
+    session = generate_session(n_drivers=2, n_laps=n_laps, hz=1.0)
+
+    laps = session.laps
+    assert len(laps) == 2 * n_laps
+    # Pit stops happen between lap 8 and five laps from the end
+    in_laps = laps.loc[laps["PitInTime"].notna(), "LapNumber"]
+    assert ((in_laps >= 8) & (in_laps <= max(n_laps - 5, 8))).all()
+    assert in_laps.empty or n_laps > 12
+
+
+def test_same_seed_gives_the_same_session():
+    first = generate_session(n_drivers=2, n_laps=5, hz=1.0, seed=3)
+    second = generate_session(n_drivers=2, n_laps=5, hz=1.0, seed=3)
+
+    np.testing.assert_array_equal(first.laps["LapTime"], second.laps["LapTime"])
+
+
+def test_drs_opens_on_the_fastest_parts_of_the_lap():
+    session = generate_session(n_drivers=1, n_laps=2, hz=4.0)
+    car_data = session.car_data[session.drivers[0]]
+
+    open_drs = car_data["DRS"] == 12
+    assert open_drs.any()
+    assert car_data.loc[open_drs, "Speed"].min() > car_data["Speed"].median()
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from telemetry import delta_time, lttb_indices, minmax_indices, resample_laps
+
+
+def test_lttb_keeps_endpoints_and_peak():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[437] = 50.0
+
+    indices = lttb_indices(x, y, 50)
+
+    assert len(indices) == 50
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+    assert 437 in indices
+
+
+def test_lttb_returns_everything_when_budget_is_large():
+    x = np.arange(10, dtype=float)
+    np.testing.assert_array_equal(lttb_indices(x, x, 20), np.arange(10))
+
+
+def test_minmax_keeps_every_level():
+    y = np.repeat([1, 2, 3, 8, 3, 2], 100).astype(float)
+    y[250] = 7.0  # single-sample spike
+
+    kept = y[minmax_indices(y, 20)]
+
+    assert set(np.unique(kept)) == {1.0, 2.0, 3.0, 7.0, 8.0}
+
+
+def test_minmax_ignores_nans():
+    y = np.arange(200, dtype=float)
+    y[:100] = np.nan
+
+    indices = minmax_indices(y, 10)
+
+    assert not np.isnan(y[indices[1:]]).any()
+    assert 199 in indices
+
+
+def test_resample_laps_interpolates_and_holds_steps():
+    fast = pd.DataFrame(
+        {"Distance": [0.0, 10.0, 20.0], "Speed": [100.0, 200.0, 300.0], "nGear": [3, 4, 5]}
+    )
+    slow = pd.DataFrame(
+        {"Distance": [0.0, 15.0], "Speed": [50.0, 80.0], "nGear": [2, 3]}
+    )
+
+    grid, arrays = resample_laps([fast, slow], ["Speed", "nGear"], step=5.0)
+
+    # The grid stops at the shortest lap
+    np.testing.assert_array_equal(grid, [0.0, 5.0, 10.0])
+    np.testing.assert_allclose(arrays["Speed"][0], [100.0, 150.0, 200.0])
+    np.testing.assert_allclose(arrays["Speed"][1], [50.0, 60.0, 70.0])
+    # Gears hold the last sample instead of interpolating
+    np.testing.assert_array_equal(arrays["nGear"][0], [3, 3, 4])
+    np.testing.assert_array_equal(arrays["nGear"][1], [2, 2, 2])
+
+
+def test_resample_laps_converts_timedeltas_to_seconds():
+    lap = pd.DataFrame(
+        {"Distance": [0.0, 10.0], "Time": pd.to_timedelta([0.0, 2.0], unit="s")}
+    )
+
+    _, arrays = resample_laps([lap], ["Time"], step=5.0)
+
+    np.testing.assert_allclose(arrays["Time"][0], [0.0, 1.0])
+
+
+def test_delta_time_is_relative_to_the_reference_lap():
+    lap_time = np.array([[10.0, 11.0, 12.0], [5.0, 6.5, 8.0]])
+
+    delta = delta_time(lap_time, reference=0)
+
+    np.testing.assert_allclose(delta[0], 0.0)
+    np.testing.assert_allclose(delta[1], [0.0, 0.5, 1.0])
+
+
+@pytest.mark.parametrize("reference", [0, 1])
+def test_delta_time_of_the_reference_is_zero(reference):
+    lap_time = np.array([[0.0, 1.0, 2.0], [0.0, 0.9, 2.2]])
+    np.testing.assert_allclose(delta_time(lap_time, reference)[reference], 0.0)
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from transport import DirectoryTransport, MemoryBroker, MemoryTransport, TransportError
+
+
+def drain(transport, queue, timeout=0.1):
+    received = []
+    transport.consume(queue, lambda q, body, headers: received.append((body, headers)))
+    transport.poll(timeout)
+    return received
+
+
+def test_messages_are_delivered_in_publish_order(tmp_path):
+    producer = DirectoryTransport(root=tmp_path)
+    producer.declare("laps")
+    for i in range(20):
+        producer.publish("laps", f"lap {i}".encode(), headers={"n": i})
+
+    received = drain(DirectoryTransport(root=tmp_path), "laps")
+
+    assert [body for body, _ in received] == [f"lap {i}".encode() for i in range(20)]
+    assert [headers["n"] for _, headers in received] == list(range(20))
+    assert os.listdir(tmp_path / "laps") == []
+
+
+def test_each_message_is_claimed_by_one_consumer(tmp_path):
+    producer = DirectoryTransport(root=tmp_path)
+    producer.declare("laps")
+    for i in range(50):
+        producer.publish("laps", str(i).encode())
+
+    first, second = DirectoryTransport(root=tmp_path), DirectoryTransport(root=tmp_path)
+    received = drain(first, "laps") + drain(second, "laps")
+
+    assert sorted(int(body) for body, _ in received) == list(range(50))
+
+
+def test_claimed_message_of_an_exited_consumer_is_reclaimed(tmp_path):
+    producer = DirectoryTransport(root=tmp_path)
+    producer.declare("laps")
+    producer.publish("laps", b"orphaned")
+    producer.publish("laps", b"next")
+
+    # A consumer claimed the first message, then its process went away
+    directory = tmp_path / "laps"
+    name = sorted(os.listdir(directory))[0]
+    os.rename(directory / name, directory / f"{name}.999999999-deadbeef")
+
+    received = drain(DirectoryTransport(root=tmp_path), "laps")
+
+    assert [body for body, _ in received] == [b"orphaned", b"next"]
+
+
+def test_message_claimed_by_a_running_consumer_is_left_alone(tmp_path):
+    producer = DirectoryTransport(root=tmp_path)
+    producer.declare("laps")
+    producer.publish("laps", b"in flight")
+
+    directory = tmp_path / "laps"
+    name = os.listdir(directory)[0]
+    os.rename(directory / name, directory / f"{name}.{os.getpid()}-cafe")
+
+    assert drain(DirectoryTransport(root=tmp_path), "laps") == []
+
+
+def test_unusable_spool_directory_raises_transport_error(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    with pytest.raises(TransportError):
+        DirectoryTransport(root=blocker).declare("laps")
+
+
+def test_memory_transports_share_their_broker():
+    broker = MemoryBroker()
+    producer = MemoryTransport(broker=broker)
+    producer.declare("laps")
+    producer.publish("laps", b"lap 1", headers={"records": 1})
+
+    assert drain(MemoryTransport(broker=broker), "laps") == [(b"lap 1", {"records": 1})]
+    assert drain(MemoryTransport(broker=MemoryBroker()), "laps") == []
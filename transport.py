@@ -0,0 +1,278 @@
+"""
+Message transports between the live producer and its consumers.
+
+Every transport offers the same small interface with RabbitMQ's semantics as
+used by ``produce.py`` and ``live.py``: named FIFO queues, ``publish`` returns
+once the message is accepted (publisher confirms), and consumed messages are
+acknowledged on delivery.
+
+Backends, selected with ``F1_TRANSPORT``:
+
+- ``rabbitmq``: a RabbitMQ broker at ``F1_RABBITMQ_HOST``.
+- ``memory``: queues inside the current process, for tests and benchmarks.
+- ``directory``: one file per message under ``F1_TRANSPORT_DIR``, so a
+  producer and a dashboard on the same machine need no broker.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from itertools import count
+
+import pika
+from pika.exceptions import AMQPError
+
+# Backend the producer and the live consumer exchange messages over
+TRANSPORT = os.environ.get("F1_TRANSPORT", "rabbitmq")
+
+# Host of the RabbitMQ broker
+RABBITMQ_HOST = os.environ.get("F1_RABBITMQ_HOST", "localhost")
+
+# Spool directory of the directory transport
+TRANSPORT_DIR = os.environ.get("F1_TRANSPORT_DIR", "spool")
+
+
+class TransportError(Exception):
+    """The transport failed; the connection should be re-opened."""
+
+
+class RabbitMQTransport:
+    """
+    RabbitMQ over a blocking pika connection with publisher confirms.
+
+    Like pika channels, an instance must only be used by one thread.
+    """
+
+    def __init__(self, host=RABBITMQ_HOST):
+        self.name = f"RabbitMQ at {host}"
+        try:
+            self.connection = pika.BlockingConnection(pika.ConnectionParameters(host))
+            self.channel = self.connection.channel()
+            self.channel.confirm_delivery()
+        except AMQPError as e:
+            raise TransportError(f"{self.name}: {e!r}") from e
+
+    def declare(self, queue):
+        try:
+            self.channel.queue_declare(queue=queue)
+        except AMQPError as e:
+            raise TransportError(f"{self.name}: {e!r}") from e
+
+    def publish(self, queue, body, headers=None):
+        """Publish and block until the broker confirms; raises if it is nacked or unroutable."""
+        properties = pika.BasicProperties(content_type="application/x-ndjson", headers=headers)
+        try:
+            self.channel.basic_publish(
+                exchange="", routing_key=queue, body=body, properties=properties, mandatory=True
+            )
+        except AMQPError as e:
+            raise TransportError(f"{self.name}: {e!r}") from e
+
+    def consume(self, queue, callback):
+        """Deliver the queue's messages to ``callback(queue, body, headers)`` during :meth:`poll`."""
+        try:
+            self.channel.basic_consume(
+                queue=queue,
+                on_message_callback=lambda ch, method, properties, body: callback(
+                    queue, body, properties.headers or {}
+                ),
+                auto_ack=True,
+            )
+        except AMQPError as e:
+            raise TransportError(f"{self.name}: {e!r}") from e
+
+    def poll(self, timeout):
+        """Deliver the messages arriving within ``timeout`` seconds."""
+        try:
+            self.connection.process_data_events(time_limit=timeout)
+        except AMQPError as e:
+            raise TransportError(f"{self.name}: {e!r}") from e
+
+    def close(self):
+        if self.connection.is_open:
+            self.connection.close()
+
+
+class MemoryBroker:
+    """Named queues shared by the memory transports of one process."""
+
+    def __init__(self):
+        self.queues = {}
+        self.condition = threading.Condition()
+
+    def queue(self, name):
+        with self.condition:
+            return self.queues.setdefault(name, deque())
+
+
+# Default broker, shared by every MemoryTransport in the process
+MEMORY_BROKER = MemoryBroker()
+
+
+class MemoryTransport:
+    """In-process queues; producers and consumers on any thread share a broker."""
+
+    def __init__(self, broker=MEMORY_BROKER):
+        self.name = "in-process queues"
+        self.broker = broker
+        self._callbacks = {}
+
+    def declare(self, queue):
+        self.broker.queue(queue)
+
+    def publish(self, queue, body, headers=None):
+        with self.broker.condition:
+            self.broker.queue(queue).append((bytes(body), dict(headers or {})))
+            self.broker.condition.notify_all()
+
+    def consume(self, queue, callback):
+        self._callbacks[queue] = callback
+
+    def poll(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.broker.condition:
+                messages = [
+                    (queue, self.broker.queue(queue).popleft())
+                    for queue in self._callbacks
+                    for _ in range(len(self.broker.queue(queue)))
+                ]
+                if not messages:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    self.broker.condition.wait(remaining)
+                    continue
+            # Callbacks run outside the lock so they may publish
+            for queue, (body, headers) in messages:
+                self._callbacks[queue](queue, body, headers)
+            return
+
+    def close(self):
+        pass
+
+
+def owner_alive(owner):
+    """Whether the process of a ``<pid>-<suffix>`` spool owner is still running."""
+    try:
+        os.kill(int(owner.partition("-")[0]), 0)
+    except ValueError:
+        return True  # not an owner tag, leave the file alone
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # running under another user
+    return True
+
+
+class DirectoryTransport:
+    """
+    One file per message in ``<root>/<queue>/``, named so they sort in publish order.
+
+    A message file holds its headers as a JSON line followed by the body.
+    Files are renamed into place, so readers never see partial messages, and
+    consumers claim a file by renaming it before reading, so several
+    consumers of one queue each get a message once. A file claimed by a
+    consumer whose process has exited is claimed again by the next scan, so
+    a consumer killed between claiming and reading loses nothing; one killed
+    after reading loses the message, as with RabbitMQ's automatic acks.
+
+    Args:
+        root (str): Spool directory.
+        poll_interval (float): Seconds between directory scans while idle.
+    """
+
+    def __init__(self, root=TRANSPORT_DIR, poll_interval=0.05):
+        self.name = f"spool directory {root}"
+        self.root = root
+        self.poll_interval = poll_interval
+        self._callbacks = {}
+        self._sequence = count()
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def declare(self, queue):
+        try:
+            os.makedirs(os.path.join(self.root, queue), exist_ok=True)
+        except OSError as e:
+            raise TransportError(f"{self.name}: {e!r}") from e
+
+    def publish(self, queue, body, headers=None):
+        directory = os.path.join(self.root, queue)
+        name = f"{time.time_ns():020d}-{next(self._sequence):09d}-{self._owner}.msg"
+        tmp_path = os.path.join(directory, f".{name}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(headers or {}).encode() + b"\n" + bytes(body))
+            os.replace(tmp_path, os.path.join(directory, name))
+        except OSError as e:
+            raise TransportError(f"{self.name}: {e!r}") from e
+
+    def consume(self, queue, callback):
+        self.declare(queue)
+        self._callbacks[queue] = callback
+
+    def _claim_messages(self, queue):
+        """Claim, read and remove the queue's messages in order; yields ``(body, headers)``."""
+        directory = os.path.join(self.root, queue)
+        names = [n for n in os.listdir(directory) if not n.startswith(".")]
+        pending = [n for n in names if n.endswith(".msg")]
+        # Messages claimed by a consumer that exited before reading them
+        pending += [
+            n for n in names
+            if ".msg." in n and not owner_alive(n.rpartition(".")[2])
+        ]
+        for name in sorted(pending):
+            path = os.path.join(directory, name)
+            claimed = os.path.join(directory, f"{name.partition('.msg')[0]}.msg.{self._owner}")
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue  # claimed by another consumer
+            with open(claimed, "rb") as f:
+                header_line, _, body = f.read().partition(b"\n")
+            os.remove(claimed)
+            yield body, json.loads(header_line)
+
+    def poll(self, timeout):
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                delivered = 0
+                for queue, callback in self._callbacks.items():
+                    for body, headers in self._claim_messages(queue):
+                        callback(queue, body, headers)
+                        delivered += 1
+                if delivered or time.monotonic() >= deadline:
+                    return
+                time.sleep(min(self.poll_interval, max(deadline - time.monotonic(), 0)))
+        except OSError as e:
+            raise TransportError(f"{self.name}: {e!r}") from e
+
+    def close(self):
+        pass
+
+
+TRANSPORTS = {
+    "rabbitmq": RabbitMQTransport,
+    "memory": MemoryTransport,
+    "directory": DirectoryTransport,
+}
+
+
+def open_transport(kind=TRANSPORT, **kwargs):
+    """
+    Connect to a transport backend.
+
+    Args:
+        kind (str): "rabbitmq", "memory" or "directory".
+        **kwargs: Passed to the backend, e.g. ``host`` or ``root``.
+
+    Raises:
+        TransportError: If the backend cannot be reached.
+    """
+    if kind not in TRANSPORTS:
+        raise ValueError(f"Unknown transport {kind!r}, expected one of {', '.join(TRANSPORTS)}")
+    return TRANSPORTS[kind](**kwargs)
@@ -0,0 +1,144 @@
+"""
+Throughput of the live pipeline over each transport, without network access.
+
+Synthetic car data is published through the producer's ``BatchPublisher``
+while a ``LiveConsumer`` drains it into its ring buffers, both over the same
+transport. Publish and end-to-end rates, bytes per second and publish-to-
+receive latency are reported for every transport and batch size.
+
+Usage:
+    python transport_benchmark.py
+    python transport_benchmark.py --transport memory directory rabbitmq --batch-records 1 100 500
+"""
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import product
+
+from live import LiveConsumer
+from produce import ENDPOINTS, BatchPublisher
+from transport import TRANSPORTS, open_transport
+
+QUEUE = ENDPOINTS["car_data"][0]
+
+
+def car_data_records(n_drivers, n_samples, hz=4.0):
+    """OpenF1-shaped car data samples, interleaved by time across drivers."""
+    start = datetime(2024, 3, 2, 15, 0, tzinfo=timezone.utc)
+    for i in range(n_samples):
+        date = (start + timedelta(seconds=i / hz)).isoformat()
+        for driver_number in range(1, n_drivers + 1):
+            yield driver_number, {
+                "date": date,
+                "speed": 250 + i % 60,
+                "throttle": 100 if i % 20 else 0,
+                "brake": 0 if i % 20 else 100,
+                "rpm": 11000 + i % 500,
+                "n_gear": 1 + i % 8,
+                "drs": 0,
+                "driver_number": driver_number,
+            }
+
+
+def run_transport(kind, n_drivers, n_samples, batch_records, timeout=120.0, **kwargs):
+    """
+    Publish ``n_drivers * n_samples`` records and wait until all are consumed.
+
+    Returns:
+        dict: Record and batch counts, publish and end-to-end rates, MB/s and
+        publish-to-receive latency percentiles, or an ``error``.
+    """
+    consumer = LiveConsumer(
+        open_transport=lambda: open_transport(kind, **kwargs), max_points=n_samples
+    )
+    consumer.start()
+    try:
+        producer = open_transport(kind, **kwargs)
+        producer.declare(QUEUE)
+        # Size and age bounds are lifted so only the record count cuts batches
+        publisher = BatchPublisher(
+            producer, max_records=batch_records, max_bytes=float("inf"), max_delay_s=float("inf")
+        )
+
+        total = n_drivers * n_samples
+        start = time.perf_counter()
+        for driver_number, record in car_data_records(n_drivers, n_samples):
+            publisher.add(QUEUE, driver_number, record)
+        publisher.flush()
+        publish_s = time.perf_counter() - start
+
+        while consumer.received < total:
+            if time.perf_counter() - start > timeout:
+                return {"error": f"received {consumer.received} of {total} records in {timeout:.0f}s"}
+            time.sleep(0.001)
+        end_to_end_s = time.perf_counter() - start
+        producer.close()
+    finally:
+        consumer.stop()
+        consumer.join()
+
+    latencies = sorted(consumer.receive_latencies())
+    return {
+        "records": total,
+        "batches": publisher.totals["batches"],
+        "publish_per_s": total / publish_s,
+        "end_to_end_per_s": total / end_to_end_s,
+        "mb_per_s": publisher.totals["bytes"] / 1024 ** 2 / publish_s,
+        "latency_p50_ms": statistics.median(latencies) * 1000,
+        "latency_p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+    }
+
+
+def print_results(results):
+    print(
+        f"{'transport':<10} {'batch':>6} {'batches':>8} {'publish/s':>11} "
+        f"{'end-to-end/s':>13} {'MB/s':>7} {'p50 ms':>8} {'p95 ms':>8}"
+    )
+    for (kind, batch_records), result in results.items():
+        if "error" in result:
+            print(f"{kind:<10} {batch_records:>6} ERROR {result['error']}")
+            continue
+        print(
+            f"{kind:<10} {batch_records:>6} {result['batches']:>8} "
+            f"{result['publish_per_s']:>11.0f} {result['end_to_end_per_s']:>13.0f} "
+            f"{result['mb_per_s']:>7.2f} {result['latency_p50_ms']:>8.1f} "
+            f"{result['latency_p95_ms']:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--transport", nargs="+", choices=list(TRANSPORTS),
+                        default=["memory", "directory"], help="Transports to measure")
+    parser.add_argument("--drivers", type=int, default=20, help="Cars publishing")
+    parser.add_argument("--samples", type=int, default=1000, help="Car data samples per car")
+    parser.add_argument("--batch-records", type=int, nargs="+", default=[1, 100, 500],
+                        help="Records per published message")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    results = {}
+    for kind, batch_records in product(args.transport, args.batch_records):
+        kwargs = {}
+        if kind == "directory":
+            spool = tempfile.TemporaryDirectory()
+            kwargs["root"] = spool.name
+        try:
+            results[(kind, batch_records)] = run_transport(
+                kind, args.drivers, args.samples, batch_records, **kwargs
+            )
+        except Exception as e:
+            results[(kind, batch_records)] = {"error": f"{type(e).__name__}: {e}"}
+        finally:
+            if kind == "directory":
+                spool.cleanup()
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()